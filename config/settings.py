@@ -42,4 +42,16 @@ REPO_OWNER = "streamlit"
 REPO_NAME = "streamlit"
 
 # Outras configurações
-REQUEST_DELAY_SECONDS = 1
\ No newline at end of file
+REQUEST_DELAY_SECONDS = 1
+# Cache em disco dos resultados das métricas (src/analysis/metric_cache.py)
+METRIC_CACHE_DIR = os.getenv(
+	"METRIC_CACHE_DIR",
+	os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '.metric_cache'))
+)
+METRIC_CACHE_MAX_MB = float(os.getenv("METRIC_CACHE_MAX_MB", "512"))
+METRIC_CACHE_ENABLED = os.getenv("METRIC_CACHE_ENABLED", "1") != "0"
+# Snapshots de grafos para comparação entre coletas (src/analysis/graph_diff.py)
+SNAPSHOT_DIR = os.getenv(
+	"SNAPSHOT_DIR",
+	os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '.graph_snapshots'))
+)
@@ -7,19 +7,35 @@ usa listas de adjacência construídas a partir das arestas.
 Métricas fornecidas:
 - build_adjlists
 - degree_centrality (in/out/total, ponderada/não-ponderada)
-- betweenness_centrality (algoritmo de Brandes, não-ponderado)
-- closeness_centrality (menores caminhos não-ponderados via BFS)
+- betweenness_centrality (algoritmo de Brandes, não-ponderado, fase de ida via MS-BFS)
+- closeness_centrality (menores caminhos não-ponderados via MS-BFS bit-paralela)
+- harmonic_centrality (soma de 1/d via BFS)
+- top_k_closeness / top_k_harmonic (top-k com corte de BFS por limitantes)
+- compute_centralities (betweenness, closeness, harmonic e excentricidade em uma só varredura)
 - pagerank (método iterativo de potência)
+- top_k_pagerank (para quando o conjunto top-k estabiliza)
 - eigenvector_centrality (iteração de potência usando pesos de entrada)
 
-Todas as implementações evitam bibliotecas externas de grafo. Numpy não é
-necessário.
+Todas as implementações evitam bibliotecas externas de grafo. Numpy é usado
+apenas na agregação de arestas e nas adjacências em arrays (ArrayAdjacency).
 """
 from collections import deque, defaultdict
 from typing import List, Tuple, Dict
 import heapq
 import math
 
+import numpy as np
+
+from src.analysis.multi_source_bfs import (
+    DEFAULT_BATCH_SIZE,
+    LEVELS_BATCH_SIZE,
+    build_neighbor_snapshot,
+    ms_bfs,
+    ms_bfs_distance_sums,
+)
+from src.analysis.metric_cache import cached_metric
+from src.analysis.sparse_graph import ArrayAdjacency, aggregate_edges
+
 
 def build_adjlists(n: int, edges: List[Tuple[int, int, float]]):
     """Retorna (out_adj, in_adj) onde cada um é uma lista de listas de (vizinho, peso)."""
@@ -69,27 +85,28 @@ def build_integrated_edges(edges_by_relation: Dict[str, List[Tuple[int, int]]],
         weights: dict relação -> peso (se None, usa DEFAULT_RELATION_WEIGHTS)
 
     Retorna:
-        list de tuplas (u, v, total_weight) agregadas por par (u, v).
+        list de tuplas (u, v, total_weight) agregadas por par (u, v), ordenada por (u, v).
     """
     if weights is None:
         weights = DEFAULT_RELATION_WEIGHTS
 
-    agg = {}
-    for rel, pairs in edges_by_relation.items():
-        w = float(weights.get(rel, 1.0))
-        for (u, v) in pairs:
-            key = (int(u), int(v))
-            agg[key] = agg.get(key, 0.0) + w
-
-    return [(u, v, wt) for (u, v), wt in agg.items()]
+    src, dst, totals = aggregate_edges(edges_by_relation, weights, default_weight=1.0)
+    return list(zip(src.tolist(), dst.tolist(), totals.tolist()))
 
 
 def build_relation_graphs_adjlists(n: int, edges_by_relation: Dict[str, List[Tuple[int, int]]]):
-    """Retorna um dicionário relação -> (out_adj, in_adj) onde cada grafo usa peso 1.0."""
+    """Retorna um dicionário relação -> (out_adj, in_adj) onde cada grafo usa peso 1.0.
+
+    As adjacências são ArrayAdjacency (CSR em arrays numpy): indexar out_adj[u]
+    devolve a mesma lista de pares (vizinho, 1.0) de `build_adjlists`, com uma
+    entrada por interação.
+    """
     rel_graphs = {}
-    relation_edges = build_relation_edge_lists(edges_by_relation, default_weight=1.0)
-    for rel, edges in relation_edges.items():
-        out_adj, in_adj = build_adjlists(n, edges)
+    for rel, pairs in edges_by_relation.items():
+        arr = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+        ones = np.ones(len(arr))
+        out_adj = ArrayAdjacency.from_edges(n, arr[:, 0], arr[:, 1], ones)
+        in_adj = ArrayAdjacency.from_edges(n, arr[:, 1], arr[:, 0], ones)
         rel_graphs[rel] = (out_adj, in_adj)
     return rel_graphs
 
@@ -125,48 +142,96 @@ def degree_centrality(out_adj: List[List[Tuple[int, float]]], in_adj: List[List[
     return deg
 
 
-def betweenness_centrality(out_adj: List[List[Tuple[int, float]]], directed: bool = True) -> Dict[int, float]:
+def _bfs_levels_by_source(neighbors: List[Tuple[int, ...]], batch_size: int = LEVELS_BATCH_SIZE):
+    """Gera (s, níveis) para cada fonte s, com níveis[d] = vértices a distância d de s.
+
+    A descoberta dos níveis é feita em lotes de `batch_size` fontes pela MS-BFS
+    bit-paralela, que compartilha a varredura das arestas entre as fontes do lote.
+    Os níveis de todas as fontes do lote ficam em memória ao mesmo tempo
+    (O(batch_size * n)), por isso o padrão é o lote pequeno `LEVELS_BATCH_SIZE`.
+    """
+    n = len(neighbors)
+    for start in range(0, n, batch_size):
+        sources = range(start, min(n, start + batch_size))
+        levels = [[[s]] for s in sources]
+        for depth, visit in ms_bfs(neighbors, sources):
+            for w, mask in visit.items():
+                while mask:
+                    low = mask & -mask
+                    mask ^= low
+                    lv = levels[low.bit_length() - 1]
+                    if len(lv) <= depth:
+                        lv.append([w])
+                    else:
+                        lv[depth].append(w)
+        yield from zip(sources, levels)
+
+
+def _accumulate_dependencies(neighbors: List[Tuple[int, ...]], s: int, lv: List[List[int]],
+                             dist: List[int], CB: List[float]) -> None:
+    """Soma em CB as dependências de Brandes da fonte s, dados seus níveis de BFS.
+
+    `dist` deve conter a distância de s para os vértices de `lv` (e -1 nos demais).
+    """
+    n = len(neighbors)
+    # Contagem de caminhos mínimos, do nível d-1 para o nível d
+    sigma = [0.0] * n
+    sigma[s] = 1.0
+    for d in range(1, len(lv)):
+        for v in lv[d - 1]:
+            sigma_v = sigma[v]
+            for w in neighbors[v]:
+                if dist[w] == d:
+                    sigma[w] += sigma_v
+
+    # Acúmulo das dependências do nível mais profundo para a fonte.
+    #    coef[w] = (1 + delta[w]) / sigma[w]
+    coef = [0.0] * n
+    for d in range(len(lv) - 1, 0, -1):
+        next_d = d + 1
+        for v in lv[d]:
+            acc = 0.0
+            for w in neighbors[v]:
+                if dist[w] == next_d:
+                    acc += coef[w]
+            delta_v = sigma[v] * acc
+            CB[v] += delta_v
+            coef[v] = (1.0 + delta_v) / sigma[v]
+
+
+@cached_metric
+def betweenness_centrality(out_adj: List[List[Tuple[int, float]]], directed: bool = True,
+                           batch_size: int = LEVELS_BATCH_SIZE) -> Dict[int, float]:
     """Algoritmo de Brandes para centralidade de intermediação (não-ponderado).
 
+    A fase de ida (descoberta dos níveis de BFS) é feita em lotes de
+    `batch_size` fontes com a MS-BFS bit-paralela, que compartilha a varredura
+    das arestas entre as fontes do lote. Com os níveis de cada fonte em mãos,
+    sigma (número de caminhos mínimos) e as dependências são acumulados nível a
+    nível, sem filas nem listas de predecessores.
+
     Complexidade O(n*m) para grafos não-ponderados.
     Retorna um dicionário nó->betweenness (não normalizado).
     """
     n = len(out_adj)
     CB = [0.0] * n
 
-    neighbors = [ [v for v,_ in out_adj[u]] for u in range(n) ]
-
-    for s in range(n):
-        S = []
-        P = [[] for _ in range(n)]
-        sigma = [0.0] * n
-        dist = [-1] * n
-        sigma[s] = 1.0
-        dist[s] = 0
-        Q = deque([s])
-        while Q:
-            v = Q.popleft()
-            S.append(v)
-            for w in neighbors[v]:
-                if dist[w] < 0:
-                    dist[w] = dist[v] + 1
-                    Q.append(w)
-                if dist[w] == dist[v] + 1:
-                    sigma[w] += sigma[v]
-                    P[w].append(v)
+    neighbors = build_neighbor_snapshot(out_adj)
+    dist = [-1] * n
 
-        delta = [0.0] * n
-        while S:
-            w = S.pop()
-            for v in P[w]:
-                if sigma[w] != 0:
-                    delta[v] += (sigma[v] / sigma[w]) * (1.0 + delta[w])
-            if w != s:
-                CB[w] += delta[w]
+    for s, lv in _bfs_levels_by_source(neighbors, batch_size):
+        for d, level in enumerate(lv):
+            for w in level:
+                dist[w] = d
+        _accumulate_dependencies(neighbors, s, lv, dist, CB)
+        for level in lv:
+            for w in level:
+                dist[w] = -1
 
     return {i: CB[i] for i in range(n)}
 
 
+@cached_metric
 def betweenness_centrality_weighted(out_adj: List[List[Tuple[int, float]]]) -> Dict[int, float]:
     """Brandes algorithm adaptado para grafos ponderados (arestas com peso > 0).
 
@@ -220,47 +285,342 @@ def betweenness_centrality_weighted(out_adj: List[List[Tuple[int, float]]]) -> D
     return {i: CB[i] for i in range(n)}
 
 
-def closeness_centrality(out_adj: List[List[Tuple[int, float]]], directed: bool = True) -> Dict[int, float]:
+@cached_metric
+def closeness_centrality(out_adj: List[List[Tuple[int, float]]], directed: bool = True,
+                         batch_size: int = DEFAULT_BATCH_SIZE) -> Dict[int, float]:
     """Centralidade de proximidade não-ponderada usando distâncias por BFS.
 
     closeness(v) = (número de nós alcançáveis) / soma(das distâncias para nós alcançáveis)
     Retorna 0 para nós isolados.
+
+    As BFS são executadas em lotes de `batch_size` fontes pela MS-BFS
+    bit-paralela (ver `multi_source_bfs`).
     """
     n = len(out_adj)
-    neighbors = [ [v for v,_ in out_adj[u]] for u in range(n) ]
+    reachable, dist_sum = ms_bfs_distance_sums(build_neighbor_snapshot(out_adj), batch_size=batch_size)
     C = {}
+    for s in range(n):
+        if dist_sum[s] > 0:
+            C[s] = reachable[s] / dist_sum[s]
+        else:
+            C[s] = 0.0
+    return C
+
+
+@cached_metric
+def harmonic_centrality(out_adj: List[List[Tuple[int, float]]]) -> Dict[int, float]:
+    """Centralidade harmônica não-ponderada: harmonic(v) = soma(1 / d(v, u)).
+
+    Diferente da closeness, nós inalcançáveis simplesmente não contribuem,
+    então o valor é bem definido em grafos desconexos. Não normalizado.
+    """
+    n = len(out_adj)
+    neighbors = [ [v for v,_ in out_adj[u]] for u in range(n) ]
+    H = {}
     for s in range(n):
         dist = [-1] * n
         Q = deque([s])
         dist[s] = 0
+        total = 0.0
         while Q:
             v = Q.popleft()
             for w in neighbors[v]:
                 if dist[w] < 0:
                     dist[w] = dist[v] + 1
+                    total += 1.0 / dist[w]
                     Q.append(w)
+        H[s] = total
+    return H
+
+
+def _top_k_result(heap: List[Tuple[float, int]]) -> Dict[int, float]:
+    """Converte o heap de (score, -nó) em dict nó -> score ordenado do maior para o menor."""
+    return {-neg: score for score, neg in sorted(heap, reverse=True)}
+
+
+@cached_metric
+def top_k_closeness(out_adj: List[List[Tuple[int, float]]], k: int = 10) -> Dict[int, float]:
+    """Top-k da closeness (mesma definição de `closeness_centrality`) com corte de BFS.
+
+    Estratégia no estilo Bergamini et al.: as fontes são processadas em ordem
+    decrescente de grau de saída e cada BFS é feita nível a nível. Ao terminar
+    o nível d, com r nós alcançados e soma de distâncias S, todo nó ainda não
+    visitado está a distância >= d + 1, maior que a média atual S / r; logo a
+    closeness final é no máximo r / S. Se esse limitante já não supera o k-ésimo
+    melhor valor encontrado, a BFS é interrompida.
+
+    Empates são resolvidos pelo menor índice, como na ordenação estável de
+    `closeness_centrality`. Retorna dict nó -> closeness com até k entradas,
+    do maior para o menor.
+    """
+    n = len(out_adj)
+    if n == 0 or k <= 0:
+        return {}
+    neighbors = [ [v for v,_ in out_adj[u]] for u in range(n) ]
+    order = sorted(range(n), key=lambda u: len(neighbors[u]), reverse=True)
+
+    heap: List[Tuple[float, int]] = []  # min-heap de (score, -nó) com os k melhores
+    seen = [-1] * n
+    for s in order:
+        full = len(heap) >= k
+        seen[s] = s
+        frontier = [s]
+        d = 0
         total = 0
         reachable = 0
-        for d in dist:
-            if d > 0:
-                total += d
-                reachable += 1
-        if total > 0:
-            C[s] = reachable / total
-        else:
-            C[s] = 0.0
-    return C
+        pruned = False
+        while frontier:
+            d += 1
+            nxt = []
+            for v in frontier:
+                for w in neighbors[v]:
+                    if seen[w] != s:
+                        seen[w] = s
+                        nxt.append(w)
+            if not nxt:
+                break
+            reachable += len(nxt)
+            total += d * len(nxt)
+            frontier = nxt
+            if full and (reachable / total, -s) < heap[0]:
+                pruned = True
+                break
+        if pruned:
+            continue
+        entry = (reachable / total if total > 0 else 0.0, -s)
+        if not full:
+            heapq.heappush(heap, entry)
+        elif entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+    return _top_k_result(heap)
+
+
+@cached_metric
+def top_k_harmonic(out_adj: List[List[Tuple[int, float]]], k: int = 10) -> Dict[int, float]:
+    """Top-k da centralidade harmônica com corte de BFS por limitante superior.
+
+    Ao terminar o nível d (fronteira F, r nós alcançados, soma parcial H), no
+    máximo min(R, soma dos graus de saída de F) nós ficam no nível d + 1 e os
+    demais R restantes ficam a distância >= d + 2, onde R = n - 1 - r. Isso dá o
+    limitante H + x / (d + 1) + (R - x) / (d + 2) usado para abandonar a BFS.
+
+    Retorna dict nó -> harmônica com até k entradas, do maior para o menor.
+    """
+    n = len(out_adj)
+    if n == 0 or k <= 0:
+        return {}
+    neighbors = [ [v for v,_ in out_adj[u]] for u in range(n) ]
+    out_deg = [len(nbrs) for nbrs in neighbors]
+    order = sorted(range(n), key=lambda u: out_deg[u], reverse=True)
+
+    heap: List[Tuple[float, int]] = []
+    seen = [-1] * n
+    for s in order:
+        full = len(heap) >= k
+        seen[s] = s
+        frontier = [s]
+        d = 0
+        total = 0.0
+        reachable = 0
+        pruned = False
+        while frontier:
+            d += 1
+            nxt = []
+            for v in frontier:
+                for w in neighbors[v]:
+                    if seen[w] != s:
+                        seen[w] = s
+                        nxt.append(w)
+            if not nxt:
+                break
+            reachable += len(nxt)
+            total += len(nxt) / d
+            frontier = nxt
+            if full:
+                remaining = n - 1 - reachable
+                next_level = min(remaining, sum(out_deg[v] for v in frontier))
+                bound = total + next_level / (d + 1) + (remaining - next_level) / (d + 2)
+                # pequena folga para não descartar empates por erro de arredondamento
+                if bound + 1e-12 < heap[0][0]:
+                    pruned = True
+                    break
+        if pruned:
+            continue
+        entry = (total, -s)
+        if not full:
+            heapq.heappush(heap, entry)
+        elif entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+    return _top_k_result(heap)
+
+
+FUSED_METRICS = ("betweenness", "closeness", "harmonic", "eccentricity")
+
+
+@cached_metric
+def compute_centralities(out_adj: List[List[Tuple[int, float]]],
+                         metrics: List[str] = ("betweenness", "closeness"),
+                         weighted: bool = False,
+                         batch_size: int = LEVELS_BATCH_SIZE) -> Dict[str, Dict[int, float]]:
+    """Calcula várias métricas baseadas em caminhos mínimos em uma única varredura.
+
+    Para cada fonte é feita UMA busca e o resultado alimenta ao mesmo tempo
+    todas as métricas pedidas. Sem pesos, os níveis de BFS vêm da MS-BFS em
+    lotes de `batch_size` fontes (a mesma fase de ida de
+    `betweenness_centrality`), então pedir betweenness e closeness juntas custa
+    o mesmo que a betweenness sozinha; com `weighted=True` cada fonte roda um
+    Dijkstra com custo = 1/peso, como em `betweenness_centrality_weighted`.
+    As métricas:
+      - betweenness: acúmulo de dependências de Brandes (não normalizado);
+      - closeness: alcançáveis / soma das distâncias (0 se nada é alcançável);
+      - harmonic: soma de 1 / distância;
+      - eccentricity: maior distância até um nó alcançável (0 se nenhum).
+
+    As listas de vizinhos são montadas uma única vez. Os valores coincidem com
+    os das funções individuais correspondentes.
+
+    Retorna dict métrica -> (dict nó -> valor), apenas para as métricas pedidas.
+    """
+    unknown = [m for m in metrics if m not in FUSED_METRICS]
+    if unknown:
+        raise ValueError(f"Métricas não suportadas: {unknown}. Opções: {FUSED_METRICS}")
+
+    n = len(out_adj)
+    want_bc = "betweenness" in metrics
+    want_cc = "closeness" in metrics
+    want_hc = "harmonic" in metrics
+    want_ecc = "eccentricity" in metrics
+
+    CB = [0.0] * n
+    closeness = [0.0] * n
+    harmonic = [0.0] * n
+    eccentricity = [0.0] * n
+
+    if not weighted:
+        neighbors = build_neighbor_snapshot(out_adj)
+        dist = [-1] * n
+        for s, lv in _bfs_levels_by_source(neighbors, batch_size):
+            if want_cc or want_hc or want_ecc:
+                total = 0
+                inv_total = 0.0
+                reachable = 0
+                for d in range(1, len(lv)):
+                    size = len(lv[d])
+                    reachable += size
+                    total += d * size
+                    inv_total += size / d
+                closeness[s] = reachable / total if total > 0 else 0.0
+                harmonic[s] = inv_total
+                eccentricity[s] = float(len(lv) - 1)
+
+            if want_bc:
+                for d, level in enumerate(lv):
+                    for w in level:
+                        dist[w] = d
+                _accumulate_dependencies(neighbors, s, lv, dist, CB)
+                for level in lv:
+                    for w in level:
+                        dist[w] = -1
+        return _fused_results(metrics, CB, closeness, harmonic, eccentricity)
+
+    neighbors = [ [(v, 1.0 / float(w)) for v, w in out_adj[u] if w > 0] for u in range(n) ]
+    for s in range(n):
+        S = []
+        P = [[] for _ in range(n)] if want_bc else None
+        sigma = [0.0] * n
+        sigma[s] = 1.0
+
+        dist = [math.inf] * n
+        dist[s] = 0.0
+        heap = [(0.0, s)]
+        while heap:
+            d_v, v = heapq.heappop(heap)
+            if d_v > dist[v] + 1e-15:
+                continue
+            S.append(v)
+            for w, cost in neighbors[v]:
+                alt = dist[v] + cost
+                if alt + 1e-15 < dist[w]:
+                    dist[w] = alt
+                    heapq.heappush(heap, (alt, w))
+                    if want_bc:
+                        sigma[w] = sigma[v]
+                        P[w] = [v]
+                elif want_bc and abs(alt - dist[w]) <= 1e-15:
+                    sigma[w] += sigma[v]
+                    P[w].append(v)
 
+        # S contém exatamente os nós alcançados, em ordem não-decrescente de distância
+        if want_cc or want_hc or want_ecc:
+            total = 0.0
+            inv_total = 0.0
+            for v in S:
+                if v != s and dist[v] > 0:
+                    total += dist[v]
+                    inv_total += 1.0 / dist[v]
+            reachable = len(S) - 1
+            closeness[s] = reachable / total if total > 0 else 0.0
+            harmonic[s] = inv_total
+            eccentricity[s] = float(dist[S[-1]]) if reachable > 0 else 0.0
+
+        if want_bc:
+            delta = [0.0] * n
+            while S:
+                w = S.pop()
+                for v in P[w]:
+                    if sigma[w] != 0:
+                        delta[v] += (sigma[v] / sigma[w]) * (1.0 + delta[w])
+                if w != s:
+                    CB[w] += delta[w]
+
+    return _fused_results(metrics, CB, closeness, harmonic, eccentricity)
+
+
+def _fused_results(metrics, CB: List[float], closeness: List[float], harmonic: List[float],
+                   eccentricity: List[float]) -> Dict[str, Dict[int, float]]:
+    """Monta o dict métrica -> (dict nó -> valor) de `compute_centralities`."""
+    values = {"betweenness": CB, "closeness": closeness, "harmonic": harmonic, "eccentricity": eccentricity}
+    return {m: dict(enumerate(values[m])) for m in FUSED_METRICS if m in metrics}
+
+
+def _pagerank_iterations(adj: ArrayAdjacency, damping: float, max_iter: int):
+    """
+    Iterações do PageRank direto sobre os arrays CSR de uma ArrayAdjacency: gera
+    (pr, erro L1) a cada passo. Mesma regra das versões em listas, com a massa
+    dos nós sem saída redistribuída de forma uniforme.
+    """
+    n = len(adj)
+    src = np.repeat(np.arange(n, dtype=np.int64), adj.degrees())
+    strength = np.bincount(src, weights=adj.weights, minlength=n)
+    dangling = strength == 0
+    inv_strength = np.divide(1.0, strength, out=np.zeros(n), where=~dangling)
+    pr = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        share = damping * pr * inv_strength
+        new_pr = np.bincount(adj.indices, weights=share[src] * adj.weights, minlength=n)
+        new_pr += (1.0 - damping) / n + damping * pr[dangling].sum() / n
+        err = float(np.abs(new_pr - pr).sum())
+        pr = new_pr
+        yield pr, err
 
+
+@cached_metric
 def pagerank(out_adj: List[List[Tuple[int, float]]], damping: float = 0.85, max_iter: int = 100,
              tol: float = 1.0e-6) -> Dict[int, float]:
     """PageRank simples (os pesos das arestas são usados para distribuir o rank).
 
     Tratamos os pesos de saída como frações da força de saída para distribuir o rank proporcionalmente.
+    Com uma ArrayAdjacency a iteração é vetorizada sobre os arrays CSR.
     """
     n = len(out_adj)
     if n == 0:
         return {}
+    if isinstance(out_adj, ArrayAdjacency):
+        pr = np.full(n, 1.0 / n)
+        for pr, err in _pagerank_iterations(out_adj, damping, max_iter):
+            if err < tol:
+                break
+        return dict(enumerate(pr.tolist()))
     out_strength = [sum(w for _, w in out_adj[i]) for i in range(n)]
     pr = [1.0 / n] * n
     for it in range(max_iter):
@@ -280,15 +640,93 @@ def pagerank(out_adj: List[List[Tuple[int, float]]], damping: float = 0.85, max_
     return {i: pr[i] for i in range(n)}
 
 
+@cached_metric
+def top_k_pagerank(out_adj: List[List[Tuple[int, float]]], k: int = 10, damping: float = 0.85,
+                   max_iter: int = 100, tol: float = 1.0e-6, stable_iters: int = 3) -> Dict[int, float]:
+    """PageRank em modo top-k: mesma iteração de `pagerank`, mas para assim que o
+    ranking dos k primeiros permanece igual por `stable_iters` iterações seguidas
+    (ou quando o erro fica abaixo de `tol`, o que vier primeiro).
+
+    A massa dos nós sem saída é somada uma vez por iteração e redistribuída de
+    forma uniforme, evitando o laço O(n) por nó pendente.
+    Retorna dict nó -> score com até k entradas, do maior para o menor.
+    Com uma ArrayAdjacency a iteração é vetorizada sobre os arrays CSR.
+    """
+    n = len(out_adj)
+    if n == 0 or k <= 0:
+        return {}
+    if isinstance(out_adj, ArrayAdjacency):
+        pr = np.full(n, 1.0 / n)
+        previous_top = None
+        stable = 0
+        for pr, err in _pagerank_iterations(out_adj, damping, max_iter):
+            if err < tol:
+                break
+            # argsort estável: empates pelo menor índice, como heapq.nlargest
+            top = np.argsort(-pr, kind="stable")[:k].tolist()
+            if top == previous_top:
+                stable += 1
+                if stable >= stable_iters:
+                    break
+            else:
+                stable = 0
+                previous_top = top
+        top = np.argsort(-pr, kind="stable")[:k].tolist()
+        return {i: float(pr[i]) for i in top}
+    out_strength = [sum(w for _, w in out_adj[i]) for i in range(n)]
+    dangling = [i for i in range(n) if out_strength[i] == 0]
+    pr = [1.0 / n] * n
+    previous_top = None
+    stable = 0
+    for it in range(max_iter):
+        dangling_mass = damping * sum(pr[i] for i in dangling) / n
+        new_pr = [ (1.0 - damping) / n + dangling_mass ] * n
+        for i in range(n):
+            if out_strength[i] != 0:
+                share = damping * pr[i] / out_strength[i]
+                for j, w in out_adj[i]:
+                    new_pr[j] += share * w
+        err = sum(abs(new_pr[i] - pr[i]) for i in range(n))
+        pr = new_pr
+        if err < tol:
+            break
+        top = heapq.nlargest(k, range(n), key=pr.__getitem__)
+        if top == previous_top:
+            stable += 1
+            if stable >= stable_iters:
+                break
+        else:
+            stable = 0
+            previous_top = top
+    top = heapq.nlargest(k, range(n), key=pr.__getitem__)
+    return {i: pr[i] for i in top}
+
+
+@cached_metric
 def eigenvector_centrality(out_adj: List[List[Tuple[int, float]]], in_adj: List[List[Tuple[int, float]]],
                            max_iter: int = 100, tol: float = 1.0e-6) -> Dict[int, float]:
     """Iteração de potência para centralidade de autovetor usando pesos de entrada.
 
     Calculamos v <- A^T v (ou seja, arestas de entrada contribuem) e normalizamos.
+    Com `in_adj` em ArrayAdjacency a iteração é vetorizada sobre os arrays CSR.
     """
     n = len(out_adj)
     if n == 0:
         return {}
+    if isinstance(in_adj, ArrayAdjacency):
+        rows = np.repeat(np.arange(n, dtype=np.int64), in_adj.degrees())
+        v = np.full(n, 1.0 / n)
+        for _ in range(max_iter):
+            new_v = np.bincount(rows, weights=in_adj.weights * v[in_adj.indices], minlength=n)
+            norm = float(np.abs(new_v).sum())
+            if norm == 0:
+                break
+            new_v /= norm
+            err = float(np.abs(new_v - v).sum())
+            v = new_v
+            if err < tol:
+                break
+        return dict(enumerate(v.tolist()))
     v = [1.0 / n] * n
     for _ in range(max_iter):
         new_v = [0.0] * n
@@ -319,6 +757,12 @@ __all__ = [
     "betweenness_centrality",
     "betweenness_centrality_weighted",
     "closeness_centrality",
+    "harmonic_centrality",
+    "top_k_closeness",
+    "top_k_harmonic",
+    "FUSED_METRICS",
+    "compute_centralities",
     "pagerank",
+    "top_k_pagerank",
     "eigenvector_centrality",
 ]
\ No newline at end of file
@@ -1,6 +1,12 @@
 from collections import deque, defaultdict
-from typing import List, Tuple, Dict
+from typing import List, Optional, Tuple, Dict
 import math
+import random
+
+import numpy as np
+
+from src.analysis.metric_cache import cached_metric, get_cache
+from src.analysis.sparse_graph import row_blocks, two_hop_paths, undirected_csr
 
 def _get_undirected_adj(out_adj: List[List[Tuple[int, float]]]) -> List[List[Tuple[int, float]]]:
     """Cria uma lista de adjacência não-direcionada/simétrica a partir da dirigida."""
@@ -19,100 +25,494 @@ def _get_undirected_adj(out_adj: List[List[Tuple[int, float]]]) -> List[List[Tup
     return undirected_adj
 
 
-def girvan_newman_community_detection(out_adj: List[List[Tuple[int, float]]], max_splits: int = 5):
+def _component_of(adj: List[set], start: int) -> set:
+    """Conjunto de nós alcançáveis a partir de `start` (BFS não-direcionada)."""
+    component = {start}
+    q = deque([start])
+    while q:
+        u = q.popleft()
+        for v in adj[u]:
+            if v not in component:
+                component.add(v)
+                q.append(v)
+    return component
+
+
+def _edge_betweenness(adj: List[set], sources, scale: float = 1.0) -> Dict[Tuple[int, int], float]:
+    """
+    Betweenness de aresta (Brandes/BFS) acumulada apenas a partir de `sources`.
+    Como cada BFS fica restrita à componente da fonte, passar os nós de uma
+    componente calcula a betweenness apenas das arestas dessa componente.
+    Retorna dict (u, v) com u < v -> score (já dividido por 2, grafo não-direcionado).
+    """
+    edge_scores = defaultdict(float)
+    for s in sources:
+        S = []
+        P = {s: []}
+        sigma = {s: 1.0}
+        dist = {s: 0}
+        Q = deque([s])
+        while Q:
+            v = Q.popleft()
+            S.append(v)
+            dist_w_expected = dist[v] + 1
+            for w in adj[v]:
+                if w not in dist:
+                    dist[w] = dist_w_expected
+                    sigma[w] = 0.0
+                    P[w] = []
+                    Q.append(w)
+                if dist[w] == dist_w_expected:
+                    sigma[w] += sigma[v]
+                    P[w].append(v)
+
+        delta = dict.fromkeys(S, 0.0)
+        while S:
+            w = S.pop()
+            coeff = (1.0 + delta[w]) / sigma[w]
+            for v in P[w]:
+                contribution = sigma[v] * coeff
+                edge_scores[(v, w) if v < w else (w, v)] += contribution
+                delta[v] += contribution
+
+    factor = scale / 2.0
+    return {edge: score * factor for edge, score in edge_scores.items()}
+
+
+class GirvanNewmanDendrogram:
+    """
+    Dendrograma Girvan-Newman (G-N) retomável de um grafo.
+
+    Guarda a sequência de arestas removidas e os eventos de divisão de
+    componentes, de forma que a partição após qualquer número k de remoções
+    (o antigo `max_splits`) e a modularidade de cada nível sejam obtidas sem
+    refazer o cálculo. Se for pedido um k maior que o já calculado, `extend`
+    continua do ponto em que parou (mesmo estado do gerador de amostras).
+
+    Versão incremental: a betweenness de aresta só depende da componente em que
+    a aresta está, então após cada remoção recalculamos apenas a(s)
+    componente(s) que continham a aresta removida; as demais mantêm os scores.
+
+    sample_sources > 0 ativa o modo aproximado: em cada componente maior que
+    esse valor, apenas `sample_sources` fontes sorteadas (com `seed`) são
+    usadas e os scores são reescalados por |componente| / amostra.
+    """
+
+    def __init__(self, out_adj: List[List[Tuple[int, float]]], sample_sources: int = 0, seed: int = 0):
+        self.n = len(out_adj)
+        self.sample_sources = sample_sources
+        self.removed_edges: List[Tuple[int, int]] = []
+        # (nº de remoções, nós da nova componente separada da componente-mãe)
+        self.splits: List[Tuple[int, Tuple[int, ...]]] = []
+        self._adj = [set(v for v, _ in nbrs) for nbrs in _get_undirected_adj(out_adj)]
+        self._rng = random.Random(seed)
+
+        # Partição inicial (componentes conexas) e betweenness, uma componente por vez
+        self.initial_components: List[Tuple[int, ...]] = []
+        self._edge_scores: Dict[Tuple[int, int], float] = {}
+        assigned = [False] * self.n
+        for i in range(self.n):
+            if not assigned[i]:
+                component = _component_of(self._adj, i)
+                for u in component:
+                    assigned[u] = True
+                self.initial_components.append(tuple(sorted(component)))
+                self._edge_scores.update(self._component_scores(component))
+
+    @property
+    def exhausted(self) -> bool:
+        """True quando todas as arestas já foram removidas."""
+        return not self._edge_scores
+
+    def _component_scores(self, component: set) -> Dict[Tuple[int, int], float]:
+        nodes = sorted(component)
+        if 0 < self.sample_sources < len(nodes):
+            sources = self._rng.sample(nodes, self.sample_sources)
+            return _edge_betweenness(self._adj, sources, scale=len(nodes) / self.sample_sources)
+        return _edge_betweenness(self._adj, nodes)
+
+    def extend(self, num_removals: int) -> bool:
+        """Calcula o dendrograma até `num_removals` remoções. Retorna True se houve trabalho novo."""
+        progressed = False
+        adj, edge_scores = self._adj, self._edge_scores
+        while len(self.removed_edges) < num_removals and edge_scores:
+            progressed = True
+            # Aresta de maior betweenness (empates, a menos de arredondamento: menor par (u, v))
+            u_rem, v_rem = max(edge_scores, key=lambda e: (round(edge_scores[e], 9), -e[0], -e[1]))
+
+            # Remover a aresta (simétrica)
+            adj[u_rem].discard(v_rem)
+            adj[v_rem].discard(u_rem)
+            del edge_scores[(u_rem, v_rem)]
+            self.removed_edges.append((u_rem, v_rem))
+
+            # Recalcular apenas as componentes afetadas pela remoção
+            comp_u = _component_of(adj, u_rem)
+            if v_rem in comp_u:
+                affected = [comp_u]
+            else:
+                comp_v = _component_of(adj, v_rem)
+                affected = [comp_u, comp_v]
+                self.splits.append((len(self.removed_edges), tuple(sorted(comp_v))))
+            for component in affected:
+                # arestas sem contribuição na amostra não podem manter o score antigo
+                for a in component:
+                    for b in adj[a]:
+                        if a < b:
+                            edge_scores[(a, b)] = 0.0
+                edge_scores.update(self._component_scores(component))
+        return progressed
+
+    def _replay(self, num_removals: int):
+        """Gera (nº de remoções, community_of, membros) após cada divisão até `num_removals`."""
+        members = [set(c) for c in self.initial_components]
+        community_of = [0] * self.n
+        for c, nodes in enumerate(self.initial_components):
+            for u in nodes:
+                community_of[u] = c
+        yield 0, community_of, members, None
+        for step, part in self.splits:
+            if step > num_removals:
+                break
+            parent = community_of[part[0]]
+            child = len(members)
+            members[parent].difference_update(part)
+            members.append(set(part))
+            for u in part:
+                community_of[u] = child
+            yield step, community_of, members, (parent, child)
+
+    def communities_at(self, num_removals: int) -> List[List[int]]:
+        """Componentes conexas após as `num_removals` primeiras remoções (ordenadas pelo menor nó)."""
+        self.extend(num_removals)
+        members = None
+        for _, _, members, _ in self._replay(num_removals):
+            pass
+        if not members:
+            return []
+        return sorted((sorted(c) for c in members), key=lambda c: c[0])
+
+    def modularity_by_level(self, out_adj: List[List[Tuple[int, float]]], num_removals: int = None,
+                            weighted: bool = True, directed: bool = False,
+                            resolution: float = 1.0) -> List[Tuple[int, int, float]]:
+        """
+        Modularidade de cada nível do dendrograma já calculado.
+        Retorna [(nº de remoções, nº de comunidades, Q)], um item por divisão
+        (o nível 0 é a partição em componentes conexas do grafo original).
+        Q é atualizada incrementalmente: a cada divisão só os termos da
+        comunidade-mãe e da nova comunidade são recalculados.
+        """
+        if num_removals is None:
+            num_removals = len(self.removed_edges)
+        A = _modularity_adj(out_adj, weighted, directed)
+        total = sum(sum(row.values()) for row in A)
+        if total == 0:
+            return []
+
+        def term(c, community_of, members):
+            internal = tot_out = tot_in = 0.0
+            for u in members[c]:
+                for v, w in A[u].items():
+                    tot_out += w
+                    if community_of[v] == c:
+                        internal += w
+            for u in members[c]:
+                tot_in += A_in[u]
+            return internal / total - resolution * tot_out * tot_in / (total * total)
+
+        A_in = [0.0] * len(A)
+        for row in A:
+            for v, w in row.items():
+                A_in[v] += w
+
+        levels = []
+        terms: Dict[int, float] = {}
+        q = 0.0
+        for step, community_of, members, changed in self._replay(num_removals):
+            if changed is None:
+                for c in range(len(members)):
+                    terms[c] = term(c, community_of, members)
+                q = sum(terms.values())
+            else:
+                parent, child = changed
+                q -= terms[parent]
+                terms[parent] = term(parent, community_of, members)
+                terms[child] = term(child, community_of, members)
+                q += terms[parent] + terms[child]
+            levels.append((step, len(members), q))
+        return levels
+
+
+def girvan_newman_dendrogram(out_adj: List[List[Tuple[int, float]]], max_splits: int = 5,
+                             sample_sources: int = 0, seed: int = 0) -> GirvanNewmanDendrogram:
+    """
+    Dendrograma G-N do grafo calculado até (pelo menos) `max_splits` remoções.
+    O dendrograma fica no cache de métricas com chave independente de
+    `max_splits`: pedir menos remoções reaproveita o resultado, e pedir mais
+    apenas continua o cálculo a partir do estado salvo.
+    """
+    cache = get_cache()
+    key = None
+    if cache.enabled:
+        key = cache.key_for(f"{__name__}.girvan_newman_dendrogram", out_adj=out_adj,
+                            sample_sources=sample_sources, seed=seed)
+        hit, dendrogram = cache.get(key)
+        if hit:
+            if dendrogram.extend(max_splits):
+                cache.put(key, dendrogram)
+            return dendrogram
+
+    dendrogram = GirvanNewmanDendrogram(out_adj, sample_sources=sample_sources, seed=seed)
+    dendrogram.extend(max_splits)
+    if key is not None:
+        cache.put(key, dendrogram)
+    return dendrogram
+
+
+def girvan_newman_community_detection(out_adj: List[List[Tuple[int, float]]], max_splits: int = 5,
+                                      sample_sources: int = 0, seed: int = 0):
     """
     Detecção de comunidades usando Girvan-Newman (G-N). Remove iterativamente a aresta 
     com a maior Betweenness Centrality (não-ponderada de aresta).
+
+    A partição é lida do dendrograma em cache (ver `girvan_newman_dendrogram`),
+    então mudar `max_splits` não refaz as remoções já calculadas.
+    """
+    if not out_adj:
+        return []
+    return girvan_newman_dendrogram(out_adj, max_splits, sample_sources, seed).communities_at(max_splits)
+
+
+def _modularity_adj(out_adj: List[List[Tuple[int, float]]], weighted: bool, directed: bool) -> List[Dict[int, float]]:
+    """
+    Matriz de pesos A (lista de dicts) usada pelas funções de modularidade.
+    No modo não-direcionado A é simetrizada (A[u][v] = A[v][u] = w(u,v) + w(v,u)),
+    e a fórmula dirigida de Leicht-Newman sobre A simétrica coincide com a
+    modularidade não-direcionada clássica.
     """
     n = len(out_adj)
-    current_out_adj = _get_undirected_adj(out_adj)
-    
+    A = [defaultdict(float) for _ in range(n)]
+    for u, nbrs in enumerate(out_adj):
+        for v, w in nbrs:
+            weight = float(w) if weighted else 1.0
+            A[u][v] += weight
+            if not directed:
+                A[v][u] += weight
+    return A
+
+
+def modularity(out_adj: List[List[Tuple[int, float]]], communities: List[List[int]],
+               weighted: bool = True, directed: bool = False, resolution: float = 1.0) -> float:
+    """
+    Modularidade Q de uma partição.
+
+    Não-direcionada: Q = sum_c [ L_c / m - resolution * (K_c / 2m)^2 ]
+    Dirigida (Leicht-Newman): Q = sum_c [ L_c / m - resolution * Kout_c * Kin_c / m^2 ]
+    Nós fora de `communities` são tratados como comunidades unitárias.
+    """
+    A = _modularity_adj(out_adj, weighted, directed)
+    n = len(A)
+    total = sum(sum(row.values()) for row in A)
+    if total == 0:
+        return 0.0
+
+    community_of = list(range(n, 2 * n))  # padrão: cada nó sozinho
+    for c, members in enumerate(communities):
+        for node in members:
+            community_of[node] = c
+
+    internal = defaultdict(float)
+    tot_out = defaultdict(float)
+    tot_in = defaultdict(float)
+    for u, row in enumerate(A):
+        cu = community_of[u]
+        for v, w in row.items():
+            tot_out[cu] += w
+            tot_in[community_of[v]] += w
+            if community_of[v] == cu:
+                internal[cu] += w
+
+    q = 0.0
+    for c in tot_out.keys() | tot_in.keys():
+        q += internal[c] / total - resolution * tot_out[c] * tot_in[c] / (total * total)
+    return q
+
+
+@cached_metric
+def louvain_community_detection(out_adj: List[List[Tuple[int, float]]], weighted: bool = True,
+                                directed: bool = False, resolution: float = 1.0, seed: int = 0,
+                                max_levels: int = 20,
+                                initial_membership: Optional[List[int]] = None,
+                                tolerance: float = 1e-7, max_passes: int = 50) -> List[List[int]]:
+    """
+    Detecção de comunidades por otimização de modularidade (método de Louvain).
+
+    Cada nível alterna:
+      1. movimentação local: cada nó (em ordem aleatória com `seed`) vai para a
+         comunidade vizinha com maior ganho de modularidade; depois da primeira
+         varredura só são reavaliados os vizinhos de nós que se moveram (fila,
+         como no Leiden). Para quando a fila esvazia, quando uma passada (n
+         avaliações) melhora a modularidade em menos de `tolerance` ou após
+         `max_passes` passadas no nível;
+      2. agregação: cada comunidade vira um super-nó (pesos somados, laços
+         guardam o peso interno).
+    Com directed=True usa o ganho da modularidade dirigida de Leicht-Newman
+    (Dugué & Perez); caso contrário o grafo é simetrizado.
+
+    Como no refinamento do Leiden, ao final cada comunidade desconexa é
+    quebrada em suas componentes conexas, o que nunca reduz a modularidade.
+
+    `initial_membership` (rótulo de comunidade por nó) faz a primeira passada
+    partir dessa partição em vez de nós isolados: com a partição de um grafo
+    parecido (janela anterior de uma série temporal) poucas movimentações bastam.
+    Deve ter um rótulo por nó (ValueError caso contrário).
+
+    Custo aproximadamente linear em m por passada. Retorna lista de comunidades
+    (listas de nós), no mesmo formato de `girvan_newman_community_detection`.
+    """
+    n = len(out_adj)
+    if initial_membership is not None and len(initial_membership) != n:
+        raise ValueError(f"initial_membership tem {len(initial_membership)} rótulos para {n} nós")
     if n == 0:
         return []
 
-    def get_connected_components(adj: List[List[Tuple[int, float]]]):
-        """Helper para encontrar componentes conexos (comunidades) via BFS."""
-        visited = [False] * n
-        components = []
-        for i in range(n):
-            if not visited[i]:
-                component = set()
-                q = deque([i])
-                visited[i] = True
-                while q:
-                    u = q.popleft()
-                    component.add(u)
-                    for v, _ in adj[u]: 
-                        if not visited[v]:
-                            visited[v] = True
-                            q.append(v)
-                if component:
-                    components.append(component)
-        return components
-
-    # O loop principal G-N: remove arestas até max_splits
-    for split in range(max_splits):
-        edge_scores = defaultdict(float)
-        
-        # 1. Calcular Betweenness Centrality da Aresta (usando Brandes/BFS modificado)
-        for s in range(n):
-            S = []
-            P = [[] for _ in range(n)]
-            sigma = [0.0] * n
-            dist = [-1] * n
-            sigma[s] = 1.0
-            dist[s] = 0
-            Q = deque([s])
-            
-            neighbors_current = [ [v for v,_ in current_out_adj[u]] for u in range(n) ]
-
-            while Q:
-                v = Q.popleft()
-                S.append(v)
-                for w in neighbors_current[v]:
-                    if dist[w] < 0:
-                        dist[w] = dist[v] + 1
-                        Q.append(w)
-                    if dist[w] == dist[v] + 1:
-                        sigma[w] += sigma[v]
-                        P[w].append(v)
-
-            delta = [0.0] * n
-            while S:
-                w = S.pop()
-                for v in P[w]:
-                    if sigma[w] != 0:
-                        contribution = (sigma[v] / sigma[w]) * (1.0 + delta[w])
-                        edge = tuple(sorted((v, w)))
-                        edge_scores[edge] += contribution
-                        delta[v] += contribution
-                        
-        # 2. Encontrar e remover a aresta com a maior Betweenness
-        if not edge_scores:
-            break
-            
-        max_edge_val = -1.0
-        edge_to_remove = None
-        
-        for edge, score in edge_scores.items():
-            if score / 2.0 > max_edge_val:
-                max_edge_val = score / 2.0
-                edge_to_remove = edge
+    rng = random.Random(seed)
+    A = _modularity_adj(out_adj, weighted, directed)
+    total = sum(sum(row.values()) for row in A)
 
-        if edge_to_remove is None:
-            break
-            
-        u_rem, v_rem = edge_to_remove
+    # membership[u] = super-nó atual do nó original u
+    membership = list(range(n))
+    if total > 0:
+        out_w = [dict(row) for row in A]
+        in_w = [defaultdict(float) for _ in range(n)]
+        for u, row in enumerate(out_w):
+            for v, w in row.items():
+                in_w[v][u] += w
+
+        for level in range(max_levels):
+            size = len(out_w)
+            k_out = [sum(row.values()) for row in out_w]
+            k_in = [sum(row.values()) for row in in_w]
+            community = list(range(size))
+            tot_out = k_out[:]
+            tot_in = k_in[:]
+            improved = False
+            if level == 0 and initial_membership is not None:
+                labels = {}
+                community = [labels.setdefault(c, len(labels)) for c in initial_membership]
+                tot_out = [0.0] * size
+                tot_in = [0.0] * size
+                for i, c in enumerate(community):
+                    tot_out[c] += k_out[i]
+                    tot_in[c] += k_in[i]
+                # a partição inicial já agrupa nós: vale agregar mesmo sem movimentos
+                improved = len(labels) < size
+
+            # vizinhos de i nos dois sentidos, pesos somados e sem o laço (fixos no nível)
+            nbrs = []
+            for i in range(size):
+                merged = dict(out_w[i])
+                for j, w in in_w[i].items():
+                    merged[j] = merged.get(j, 0.0) + w
+                merged.pop(i, None)
+                nbrs.append(list(merged.items()))
+
+            # Movimentação local com fila (como no Leiden): depois da primeira varredura só
+            # voltam à fila os vizinhos de nós que mudaram de comunidade. Uma "passada"
+            # corresponde a `size` avaliações; o critério de parada é checado a cada uma.
+            order = list(range(size))
+            rng.shuffle(order)
+            queue = deque(order)
+            queued = [True] * size
+            evaluations = 0
+            pass_gain = 0.0
+            while queue and evaluations < max_passes * size:
+                i = queue.popleft()
+                queued[i] = False
+                evaluations += 1
+                ci = community[i]
+                # pesos de i para cada comunidade vizinha
+                links = {}
+                for j, w in nbrs[i]:
+                    c = community[j]
+                    links[c] = links.get(c, 0.0) + w
+
+                ko, ki = k_out[i], k_in[i]
+                tot_out[ci] -= ko
+                tot_in[ci] -= ki
+
+                # ganho de levar i para c: links[c] - resolution * (ko * tot_in[c] + ki * tot_out[c]) / total
+                a_in = resolution * ko / total
+                a_out = resolution * ki / total
+                best_c = ci
+                stay_gain = best_gain = links.get(ci, 0.0) - a_in * tot_in[ci] - a_out * tot_out[ci]
+                for c, link in links.items():
+                    g = link - a_in * tot_in[c] - a_out * tot_out[c]
+                    if g > best_gain + 1e-12:
+                        best_c, best_gain = c, g
+
+                tot_out[best_c] += ko
+                tot_in[best_c] += ki
+                if best_c != ci:
+                    community[i] = best_c
+                    improved = True
+                    pass_gain += best_gain - stay_gain
+                    for j, _ in nbrs[i]:
+                        if not queued[j] and community[j] != best_c:
+                            queued[j] = True
+                            queue.append(j)
+
+                if evaluations % size == 0:
+                    # ganho da passada em modularidade (o ganho de cada movimento é ΔQ * total)
+                    if pass_gain / total < tolerance:
+                        break
+                    pass_gain = 0.0
+
+            if not improved:
+                break
+
+            # Agregação: renumera comunidades e soma os pesos entre elas
+            relabel = {}
+            for c in community:
+                if c not in relabel:
+                    relabel[c] = len(relabel)
+            membership = [relabel[community[m]] for m in membership]
 
-        # 3. Remover a aresta (simétrica)
-        # remove o vizinho V de U
-        current_out_adj[u_rem] = [(v, w) for v, w in current_out_adj[u_rem] if v != v_rem]
-        # remove o vizinho U de V
-        current_out_adj[v_rem] = [(v, w) for v, w in current_out_adj[v_rem] if v != u_rem]
+            new_size = len(relabel)
+            new_out = [defaultdict(float) for _ in range(new_size)]
+            new_in = [defaultdict(float) for _ in range(new_size)]
+            for i, row in enumerate(out_w):
+                ci = relabel[community[i]]
+                for j, w in row.items():
+                    cj = relabel[community[j]]
+                    new_out[ci][cj] += w
+                    new_in[cj][ci] += w
+            out_w, in_w = new_out, new_in
+            if new_size == size:
+                break
 
-    # Retorna os Componentes Conexos resultantes
-    communities = get_connected_components(current_out_adj)
-    return [list(c) for c in communities] 
+    groups = defaultdict(list)
+    for u, c in enumerate(membership):
+        groups[c].append(u)
+
+    # Refinamento: separa comunidades desconexas (visão não-direcionada)
+    undirected = [set(v for v, _ in nbrs) for nbrs in _get_undirected_adj(out_adj)]
+    communities = []
+    for c in sorted(groups, key=lambda c: groups[c][0]):
+        members = set(groups[c])
+        while members:
+            start = min(members)
+            part = {start}
+            q = deque([start])
+            while q:
+                u = q.popleft()
+                for v in undirected[u]:
+                    if v in members and v not in part:
+                        part.add(v)
+                        q.append(v)
+            members -= part
+            communities.append(sorted(part))
+    return communities
 
 
 def find_bridging_ties(out_adj: List[List[Tuple[int, float]]], communities: List[List[int]]):
@@ -145,4 +545,160 @@ def find_bridging_ties(out_adj: List[List[Tuple[int, float]]], communities: List
             if v_community is not None and u_community != v_community:
                 bridging_ties.append((u, v, w))
 
-    return bridging_ties
\ No newline at end of file
+    return bridging_ties
+
+@cached_metric
+def structural_holes(out_adj: List[List[Tuple[int, float]]]) -> Dict[str, List[float]]:
+    """
+    Métricas de buracos estruturais de Burt por autor, na visão não-direcionada
+    ponderada (peso de {i, j} = w(i, j) + w(j, i)):
+
+      p_ij = peso(i, j) / soma dos pesos de i     (investimento de i em j)
+      m_jq = peso(j, q) / maior peso de j
+      constraint(i)     = soma_j (p_ij + soma_q p_iq * p_qj)^2
+      effective_size(i) = soma_j (1 - soma_q p_iq * m_jq)
+      efficiency(i)     = effective_size(i) / grau(i)
+
+    com j e q vizinhos de i. Constraint baixo indica um corretor (broker) entre
+    grupos que não se falam; diferente de `find_bridging_ties`, não depende de
+    detecção de comunidades. Os termos indiretos saem de uma passada vetorizada
+    pelos caminhos de dois saltos i - q - j (em blocos de linhas do CSR).
+    Autores isolados recebem nan nas três métricas.
+    """
+    n = len(out_adj)
+    indptr, indices, weights = undirected_csr(out_adj)
+    degree = np.diff(indptr)
+    rows = np.repeat(np.arange(n), degree)
+    strength = np.bincount(rows, weights=weights, minlength=n)
+    max_weight = np.zeros(n)
+    nonempty = np.flatnonzero(degree)
+    if len(nonempty):
+        max_weight[nonempty] = np.maximum.reduceat(weights, indptr[nonempty])
+    p = weights / strength[rows] if len(weights) else weights
+    edge_keys = rows * n + indices
+
+    # soma_q p_iq * p_qj e soma_q p_iq * m_jq para cada aresta (i, j) do CSR
+    indirect = np.zeros(len(indices))
+    redundancy = np.zeros(len(indices))
+    for start, end in row_blocks(indptr, indices):
+        i, q, j, pos_iq, pos_qj = two_hop_paths(indptr, indices, weights, np.arange(start, end, dtype=np.int64))
+        keys = i * n + j
+        pos = np.minimum(np.searchsorted(edge_keys, keys), max(len(edge_keys) - 1, 0))
+        closed = (edge_keys[pos] == keys) if len(edge_keys) else np.zeros(len(keys), dtype=bool)
+        pos, pos_iq, pos_qj, j = pos[closed], pos_iq[closed], pos_qj[closed], j[closed]
+        indirect += np.bincount(pos, weights=p[pos_iq] * p[pos_qj], minlength=len(indices))
+        redundancy += np.bincount(pos, weights=p[pos_iq] * weights[pos_qj] / max_weight[j], minlength=len(indices))
+
+    constraint = np.bincount(rows, weights=(p + indirect) ** 2, minlength=n).astype(np.float64)
+    effective_size = degree - np.bincount(rows, weights=redundancy, minlength=n).astype(np.float64)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        efficiency = effective_size / degree
+    isolated = degree == 0
+    constraint[isolated] = np.nan
+    effective_size[isolated] = np.nan
+    efficiency[isolated] = np.nan
+    return {
+        'constraint': constraint.tolist(),
+        'effective_size': effective_size.tolist(),
+        'efficiency': efficiency.tolist(),
+    }
+
+def biconnected_structure(out_adj: List[List[Tuple[int, float]]]) -> Dict[str, object]:
+    """
+    Pontos de articulação, pontes e componentes biconexas da visão não-direcionada
+    (`_get_undirected_adj`), em O(n + m) com Hopcroft-Tarjan iterativo (sem recursão).
+
+    Retorna dict com:
+      'articulation_points': lista ordenada de nós cuja remoção desconecta a componente;
+      'bridges': lista de pares (u, v), u < v, cuja remoção desconecta a componente;
+      'biconnected_components': listas ordenadas de nós (uma por componente biconexa);
+      'articulation_impact': {nó: (partes, nós_desligados)} - em quantas partes a
+          componente se divide sem o nó e quantos nós perdem contato com a maior delas.
+    """
+    n = len(out_adj)
+    adj = [[v for v, _ in nbrs if v != u] for u, nbrs in enumerate(_get_undirected_adj(out_adj))]
+    disc = [-1] * n
+    low = [0] * n
+    size = [1] * n
+    bridges = []
+    components = []
+    impact: Dict[int, Tuple[int, int]] = {}
+    timer = 0
+
+    for root in range(n):
+        if disc[root] >= 0:
+            continue
+        disc[root] = low[root] = timer
+        timer += 1
+        stack = [(root, -1, iter(adj[root]))]
+        edge_stack = []
+        root_parts = []  # tamanhos das subárvores filhas da raiz
+        separated: Dict[int, List[int]] = defaultdict(list)
+
+        while stack:
+            u, parent, neighbors = stack[-1]
+            descended = False
+            for v in neighbors:
+                if disc[v] < 0:
+                    edge_stack.append((u, v))
+                    disc[v] = low[v] = timer
+                    timer += 1
+                    stack.append((v, u, iter(adj[v])))
+                    descended = True
+                    break
+                if v != parent and disc[v] < disc[u]:
+                    # aresta de retorno para um ancestral
+                    edge_stack.append((u, v))
+                    if disc[v] < low[u]:
+                        low[u] = disc[v]
+            if descended:
+                continue
+
+            stack.pop()
+            if parent < 0:
+                continue
+            if low[u] < low[parent]:
+                low[parent] = low[u]
+            size[parent] += size[u]
+            if low[u] > disc[parent]:
+                bridges.append((parent, u) if parent < u else (u, parent))
+            if low[u] >= disc[parent]:
+                # `parent` separa a subárvore de u: desempilha uma componente biconexa
+                members = set()
+                while True:
+                    a, b = edge_stack.pop()
+                    members.add(a)
+                    members.add(b)
+                    if (a, b) == (parent, u):
+                        break
+                components.append(sorted(members))
+                if parent == root:
+                    root_parts.append(size[u])
+                else:
+                    separated[parent].append(size[u])
+
+        component_size = size[root]
+        for v, parts in separated.items():
+            # sem v: cada subárvore separada vira uma parte, mais o restante (que contém a raiz)
+            parts = parts + [component_size - 1 - sum(parts)]
+            impact[v] = (len(parts), component_size - 1 - max(parts))
+        if len(root_parts) >= 2:
+            impact[root] = (len(root_parts), component_size - 1 - max(root_parts))
+
+    return {
+        'articulation_points': sorted(impact),
+        'bridges': sorted(bridges),
+        'biconnected_components': components,
+        'articulation_impact': impact,
+    }
+
+
+def find_structural_bridging_ties(out_adj: List[List[Tuple[int, float]]]):
+    """
+    Alternativa linear a `find_bridging_ties` que dispensa detecção de comunidades:
+    arestas dirigidas e ponderadas (u, v, w) cujo par não-direcionado é uma ponte,
+    ou seja, a única ligação entre os dois lados da rede.
+    """
+    bridges = set(biconnected_structure(out_adj)['bridges'])
+    return [(u, v, w) for u, nbrs in enumerate(out_adj) for v, w in nbrs
+            if ((u, v) if u < v else (v, u)) in bridges]
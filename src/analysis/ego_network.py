@@ -0,0 +1,70 @@
+"""Rede ego de um autor: a vizinhança local até k saltos, com limite de tamanho.
+
+A vizinhança é tomada na visão não direcionada (quem o autor procurou e quem
+o procurou). A BFS avança nível a nível a partir do centro; quando o limite
+de vértices aperta, os candidatos de cada nível são ordenados pela força do
+laço com a fronteira atual (soma dos pesos das arestas, nos dois sentidos,
+que os ligam aos vértices do nível anterior) e entram os mais fortes
+primeiro. Candidatos que ficam de fora não são expandidos, então o custo é
+proporcional à vizinhança visitada, mais uma passada O(m) para montar os
+predecessores.
+
+Funções fornecidas:
+- ego_graph (vértices da rede ego, em ordem de entrada, e as arestas entre eles)
+"""
+from typing import Dict, List, Tuple
+
+from src.core.AbstractGraph import AbstractGraph
+
+
+def ego_graph(graph: AbstractGraph, center: int, hops: int = 1, max_nodes: int = 50,
+              min_weight: float = 0.0) -> Tuple[List[int], List[Tuple[int, int, float]]]:
+    """
+    Rede ego de `center`: autores a até `hops` saltos (em qualquer sentido),
+    no máximo `max_nodes` vértices contando o centro. Arestas com peso abaixo
+    de `min_weight` são ignoradas tanto na busca quanto no resultado.
+
+    Retorna (vértices, arestas): os índices originais na ordem de entrada
+    (centro primeiro, depois nível a nível, laços mais fortes primeiro, empates
+    pelo menor índice) e as arestas (u, v, peso) do grafo entre esses vértices.
+    """
+    n = graph.getVertexCount()
+    if not 0 <= center < n:
+        raise ValueError(f"Vértice fora do grafo: {center}")
+    if hops < 0 or max_nodes < 1:
+        raise ValueError("hops deve ser >= 0 e max_nodes >= 1")
+
+    out_adj = graph.getAsAdjacencyList()
+    in_adj: List[Dict[int, float]] = [{} for _ in range(n)]
+    for u, nbrs in enumerate(out_adj):
+        for v, w in nbrs.items():
+            if w >= min_weight:
+                in_adj[v][u] = w
+
+    selected = [center]
+    seen = {center}
+    frontier = [center]
+    for _ in range(hops):
+        if not frontier or len(selected) >= max_nodes:
+            break
+        strength: Dict[int, float] = {}
+        for u in frontier:
+            for v, w in out_adj[u].items():
+                if w >= min_weight and v not in seen:
+                    strength[v] = strength.get(v, 0.0) + w
+            for v, w in in_adj[u].items():
+                if v not in seen:
+                    strength[v] = strength.get(v, 0.0) + w
+        ranked = sorted(strength, key=lambda v: (-strength[v], v))
+        frontier = ranked[:max_nodes - len(selected)]
+        selected.extend(frontier)
+        seen.update(frontier)
+
+    edges = [(u, v, w) for u in selected for v, w in out_adj[u].items()
+             if v in seen and w >= min_weight]
+    return selected, edges
+
+
+__all__ = [
+    "ego_graph",
+]
@@ -0,0 +1,170 @@
+"""Diferença entre dois grafos de autores (ou dois snapshots salvos), por login.
+
+Os índices dos vértices mudam entre duas coletas, então tudo é comparado
+pelo login: os logins dos dois lados são unidos num vetor ordenado e cada
+aresta vira uma chave inteira (índice_global(u) * G + índice_global(v)).
+Com as chaves dos dois lados ordenadas, vértices e arestas em comum saem de
+junções por merge (np.searchsorted sobre vetores ordenados), sem dicts de
+tuplas nem buscas aninhadas.
+
+Funções fornecidas:
+- snapshot_from_graph (idx_to_name + arestas a partir de um grafo carregado)
+- save_snapshot / load_snapshot / list_snapshots (snapshots em disco, .npz)
+- diff_snapshots (vértices e arestas adicionados/removidos, arestas com peso
+  alterado e variação de grau por autor)
+"""
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from config.settings import SNAPSHOT_DIR
+
+Snapshot = Tuple[Dict[int, str], List[Tuple[int, int, float]]]
+
+
+def snapshot_from_graph(graph, idx_to_name: Dict[int, str]) -> Snapshot:
+    """(idx_to_name, arestas) de um grafo carregado, no formato de `fetch_authors_and_edges`."""
+    edges = [(u, v, float(w)) for u, nbrs in enumerate(graph.getAsAdjacencyList()) for v, w in nbrs.items()]
+    names = {i: idx_to_name.get(i, str(i)) for i in range(graph.getVertexCount())}
+    return names, edges
+
+
+def _snapshot_path(name: str, directory: Optional[str]) -> Path:
+    return Path(directory or SNAPSHOT_DIR) / f"{name}.npz"
+
+
+def save_snapshot(name: str, idx_to_name: Dict[int, str], edges: List[Tuple[int, int, float]],
+                  directory: Optional[str] = None) -> Path:
+    """
+    Grava o snapshot em `<directory>/<name>.npz` (padrão SNAPSHOT_DIR): logins
+    e arestas em vetores, mais o instante da gravação.
+    """
+    path = _snapshot_path(name, directory)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    n = max(idx_to_name, default=-1) + 1
+    logins = np.array([idx_to_name.get(i, str(i)) for i in range(n)], dtype=str)
+    arr = np.array([(u, v) for u, v, _ in edges], dtype=np.int64).reshape(-1, 2)
+    weights = np.array([w for _, _, w in edges], dtype=np.float64)
+    tmp = path.with_suffix(".tmp.npz")
+    np.savez_compressed(tmp, logins=logins, src=arr[:, 0], dst=arr[:, 1], weights=weights,
+                        saved_at=np.array(datetime.now(timezone.utc).isoformat()))
+    os.replace(tmp, path)
+    return path
+
+
+def load_snapshot(name: str, directory: Optional[str] = None) -> Snapshot:
+    """Lê um snapshot gravado por `save_snapshot`."""
+    with np.load(_snapshot_path(name, directory)) as data:
+        idx_to_name = dict(enumerate(data["logins"].tolist()))
+        edges = list(zip(data["src"].tolist(), data["dst"].tolist(), data["weights"].tolist()))
+    return idx_to_name, edges
+
+
+def list_snapshots(directory: Optional[str] = None) -> List[str]:
+    """Nomes dos snapshots gravados, do mais antigo para o mais recente."""
+    folder = Path(directory or SNAPSHOT_DIR)
+    if not folder.is_dir():
+        return []
+    files = sorted(folder.glob("*.npz"), key=lambda p: p.stat().st_mtime)
+    return [p.stem for p in files if not p.stem.endswith(".tmp")]
+
+
+def _present(sorted_keys: np.ndarray, keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Junção por merge: (posição de cada chave em `sorted_keys`, chave encontrada?)."""
+    if not len(sorted_keys):
+        return np.zeros(len(keys), dtype=np.int64), np.zeros(len(keys), dtype=bool)
+    pos = np.minimum(np.searchsorted(sorted_keys, keys), len(sorted_keys) - 1)
+    return pos, sorted_keys[pos] == keys
+
+
+def _edge_table(idx_to_name: Dict[int, str], edges: List[Tuple[int, int, float]],
+                logins: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Chaves globais ordenadas (uma por par, pesos repetidos somados) e seus pesos."""
+    n = max(idx_to_name, default=-1) + 1
+    names = np.array([idx_to_name.get(i, str(i)) for i in range(n)], dtype=str)
+    to_global = np.searchsorted(logins, names)
+    arr = np.array([(u, v) for u, v, _ in edges], dtype=np.int64).reshape(-1, 2)
+    weights = np.array([w for _, _, w in edges], dtype=np.float64)
+    keys = to_global[arr[:, 0]] * len(logins) + to_global[arr[:, 1]] if len(arr) else np.zeros(0, dtype=np.int64)
+    unique_keys, inverse = np.unique(keys, return_inverse=True)
+    return unique_keys, np.bincount(inverse, weights=weights, minlength=len(unique_keys))
+
+
+def diff_snapshots(old: Snapshot, new: Snapshot, tol: float = 1e-9) -> Dict[str, object]:
+    """
+    Compara dois snapshots (idx_to_name, arestas) pelo login dos autores.
+
+    Retorna dict com:
+      'added_vertices' / 'removed_vertices': logins (ordenados);
+      'added_edges' / 'removed_edges': listas de (login_u, login_v, peso);
+      'reweighted_edges': (login_u, login_v, peso_antigo, peso_novo), |Δ| > tol;
+      'degree_delta': colunas 'author', 'old_degree', 'new_degree', 'delta',
+        'out_delta', 'in_delta' (grau ponderado), só autores que mudaram,
+        ordenadas por |delta| decrescente;
+      'summary': contagens de cada item acima.
+    """
+    old_names, old_edges = old
+    new_names, new_edges = new
+    old_logins = np.unique(np.array(list(old_names.values()), dtype=str))
+    new_logins = np.unique(np.array(list(new_names.values()), dtype=str))
+    logins = np.union1d(old_logins, new_logins)
+    g = len(logins)
+
+    _, in_old = _present(old_logins, logins)
+    _, in_new = _present(new_logins, logins)
+
+    old_keys, old_weights = _edge_table(old_names, old_edges, logins)
+    new_keys, new_weights = _edge_table(new_names, new_edges, logins)
+    pos_in_new, old_kept = _present(new_keys, old_keys)
+    _, new_kept = _present(old_keys, new_keys)
+    before = old_weights[old_kept]
+    after = new_weights[pos_in_new[old_kept]]
+    changed = np.abs(after - before) > tol
+    changed_keys = old_keys[old_kept][changed]
+
+    def edge_rows(keys, *columns):
+        u, v = np.divmod(keys, g) if g else (keys, keys)
+        return list(zip(logins[u].tolist(), logins[v].tolist(), *(c.tolist() for c in columns)))
+
+    def strengths(keys, weights):
+        u, v = np.divmod(keys, g) if g else (keys, keys)
+        return np.bincount(u, weights=weights, minlength=g), np.bincount(v, weights=weights, minlength=g)
+
+    old_out, old_in = strengths(old_keys, old_weights)
+    new_out, new_in = strengths(new_keys, new_weights)
+    out_delta, in_delta = new_out - old_out, new_in - old_in
+    delta = out_delta + in_delta
+    moved = np.flatnonzero((np.abs(out_delta) > tol) | (np.abs(in_delta) > tol))
+    moved = moved[np.lexsort((moved, -np.abs(delta[moved])))]
+
+    result = {
+        'added_vertices': logins[in_new & ~in_old].tolist(),
+        'removed_vertices': logins[in_old & ~in_new].tolist(),
+        'added_edges': edge_rows(new_keys[~new_kept], new_weights[~new_kept]),
+        'removed_edges': edge_rows(old_keys[~old_kept], old_weights[~old_kept]),
+        'reweighted_edges': edge_rows(changed_keys, before[changed], after[changed]),
+        'degree_delta': {
+            'author': logins[moved].tolist(),
+            'old_degree': (old_out + old_in)[moved].tolist(),
+            'new_degree': (new_out + new_in)[moved].tolist(),
+            'delta': delta[moved].tolist(),
+            'out_delta': out_delta[moved].tolist(),
+            'in_delta': in_delta[moved].tolist(),
+        },
+    }
+    result['summary'] = {key: len(result[key]) for key in
+                         ('added_vertices', 'removed_vertices', 'added_edges', 'removed_edges', 'reweighted_edges')}
+    result['summary']['authors_with_degree_change'] = len(moved)
+    return result
+
+
+__all__ = [
+    "diff_snapshots",
+    "list_snapshots",
+    "load_snapshot",
+    "save_snapshot",
+    "snapshot_from_graph",
+]
@@ -0,0 +1,155 @@
+"""Função de vizinhança aproximada (HyperANF) com contadores HyperLogLog.
+
+Cada autor u recebe um contador HyperLogLog (2^log2m registradores de 1 byte)
+que estima |B(u, t)|, o número de nós alcançáveis a partir de u em até t
+saltos (seguindo as arestas de saída). Como B(u, t+1) = {u} ∪ B(v, t) para os
+sucessores v, cada salto é apenas a união (máximo registrador a registrador)
+dos contadores dos sucessores: uma passada vetorizada sobre as arestas.
+
+Funções fornecidas:
+- hyperanf (estimativas por autor e função de vizinhança N(t) para t = 0..H)
+- effective_diameter (menor h, interpolado, com N(h) >= alpha * N(H))
+- influence_reach (alcance estimado de cada autor em até `hops` saltos)
+- reach_at (o mesmo alcance lido de um resultado de `hyperanf` já calculado)
+"""
+from typing import Dict, List
+
+import numpy as np
+
+from src.analysis.metric_cache import cached_metric
+from src.analysis.multi_source_bfs import build_neighbor_snapshot
+
+DEFAULT_LOG2M = 7
+_EDGE_CHUNK = 1 << 18  # arestas por bloco ao reunir os contadores (limita a memória)
+
+
+def _splitmix64(x: np.ndarray) -> np.ndarray:
+    """Hash 64 bits (splitmix64) vetorizado."""
+    x = x + np.uint64(0x9E3779B97F4A7C15)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def _initial_registers(n: int, log2m: int, seed: int) -> np.ndarray:
+    """Contador de cada nó contendo apenas ele mesmo."""
+    m = 1 << log2m
+    with np.errstate(over="ignore"):
+        h = _splitmix64(np.arange(n, dtype=np.uint64) + np.uint64(seed) * np.uint64(0x5851F42D4C957F2D))
+    bucket = (h & np.uint64(m - 1)).astype(np.int64)
+    w = (h >> np.uint64(32)).astype(np.float64)
+    # rho = posição do primeiro bit 1 nos 32 bits altos (33 se todos forem zero)
+    rho = 33 - np.frexp(w)[1]
+    registers = np.zeros((n, m), dtype=np.uint8)
+    registers[np.arange(n), bucket] = rho.astype(np.uint8)
+    return registers
+
+
+def _estimate(registers: np.ndarray) -> np.ndarray:
+    """Estimador HyperLogLog (com correção para cardinalidades pequenas) de cada linha."""
+    m = registers.shape[1]
+    alpha = {16: 0.673, 32: 0.697, 64: 0.709}.get(m, 0.7213 / (1 + 1.079 / m))
+    raw = alpha * m * m / np.exp2(-registers.astype(np.float64)).sum(axis=1)
+    zeros = (registers == 0).sum(axis=1)
+    small = (raw <= 2.5 * m) & (zeros > 0)
+    with np.errstate(divide="ignore"):
+        linear = m * np.log(m / np.maximum(zeros, 1))
+    return np.where(small, linear, raw)
+
+
+@cached_metric
+def hyperanf(adj, max_hops: int = 0, log2m: int = DEFAULT_LOG2M, seed: int = 0) -> Dict[str, object]:
+    """
+    Executa o HyperANF até os contadores estabilizarem (ou até `max_hops` > 0 saltos).
+
+    Retorna dict com:
+      'reach': matriz (H+1) x n, reach[t][u] = estimativa de |B(u, t)| (inclui u);
+      'neighbourhood_function': lista N(t) = soma de reach[t] (pares alcançáveis em <= t);
+      'hops': H, número de saltos executados.
+    O erro relativo padrão de cada contador é ~1.04 / sqrt(2^log2m).
+    """
+    neighbors = build_neighbor_snapshot(adj)
+    n = len(neighbors)
+    registers = _initial_registers(n, log2m, seed)
+    reach = [_estimate(registers).astype(np.float32)]
+    if n == 0:
+        return {'reach': np.zeros((1, 0), dtype=np.float32), 'neighbourhood_function': [0.0], 'hops': 0}
+
+    counts = np.fromiter((len(nbrs) for nbrs in neighbors), dtype=np.int64, count=n)
+    src = np.repeat(np.arange(n, dtype=np.int64), counts)
+    dst = np.fromiter((v for nbrs in neighbors for v in nbrs), dtype=np.int64, count=int(counts.sum()))
+
+    # blocos de arestas cortados em fronteiras de origem (arestas já agrupadas por origem)
+    sources, starts = np.unique(src, return_index=True)
+    blocks = []
+    first = 0
+    while first < len(sources):
+        last = int(np.searchsorted(starts, starts[first] + _EDGE_CHUNK, side="left"))
+        last = max(last, first + 1)
+        edge_end = starts[last] if last < len(sources) else len(src)
+        blocks.append((sources[first:last], starts[first:last] - starts[first], starts[first], edge_end))
+        first = last
+
+    hops = 0
+    while max_hops <= 0 or hops < max_hops:
+        updated = registers.copy()
+        for block_sources, offsets, edge_start, edge_end in blocks:
+            gathered = registers[dst[edge_start:edge_end]]
+            unions = np.maximum.reduceat(gathered, offsets, axis=0)
+            updated[block_sources] = np.maximum(updated[block_sources], unions)
+        if np.array_equal(updated, registers):
+            break
+        registers = updated
+        hops += 1
+        reach.append(_estimate(registers).astype(np.float32))
+
+    reach = np.vstack(reach)
+    return {
+        'reach': reach,
+        'neighbourhood_function': [float(x) for x in reach.sum(axis=1, dtype=np.float64)],
+        'hops': hops,
+    }
+
+
+def effective_diameter(neighbourhood_function: List[float], alpha: float = 0.9) -> float:
+    """
+    Menor h (interpolado linearmente entre saltos inteiros) tal que N(h) atinge
+    a fração `alpha` dos pares alcançáveis N(H).
+    """
+    if not neighbourhood_function:
+        return 0.0
+    target = alpha * neighbourhood_function[-1]
+    for h, value in enumerate(neighbourhood_function):
+        if value >= target:
+            if h == 0:
+                return 0.0
+            previous = neighbourhood_function[h - 1]
+            return h - 1 + (target - previous) / (value - previous)
+    return float(len(neighbourhood_function) - 1)
+
+
+def influence_reach(adj, hops: int = 2, log2m: int = DEFAULT_LOG2M, seed: int = 0) -> Dict[int, float]:
+    """
+    Estimativa, para cada autor, de quantos outros são alcançáveis em até `hops` saltos.
+    Lê a linha `hops` da execução completa, que fica no cache e é compartilhada
+    com o diâmetro efetivo e com consultas para outros valores de `hops`.
+    """
+    return reach_at(hyperanf(adj, log2m=log2m, seed=seed), hops)
+
+
+def reach_at(result: Dict[str, object], hops: int) -> Dict[int, float]:
+    """
+    Alcance em até `hops` saltos (sem contar o próprio autor) a partir de um
+    resultado de `hyperanf`, para quem também usa a função de vizinhança.
+    """
+    row = result['reach'][min(hops, result['hops'])]
+    return {u: max(0.0, float(est) - 1.0) for u, est in enumerate(row)}
+
+
+__all__ = [
+    "DEFAULT_LOG2M",
+    "effective_diameter",
+    "hyperanf",
+    "influence_reach",
+    "reach_at",
+]
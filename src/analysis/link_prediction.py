@@ -0,0 +1,233 @@
+"""Similaridade entre autores e predição de ligações (vetorizadas com numpy).
+
+A vizinhança de um autor é a versão não-dirigida do grafo (vizinhos de saída
+e de entrada; o peso de {u, v} é w(u, v) + w(v, u)), guardada em formato CSR
+(indptr, indices, weights). Pontuar uma linha u contra todos os autores é o
+produto esparso A[u] · Aᵀ: os vizinhos dos vizinhos de u são concatenados a
+partir do CSR e somados com np.bincount, sem interseções de conjuntos em
+Python.
+
+Métricas (`METHODS`):
+- common_neighbors: |N(u) ∩ N(v)|
+- jaccard: |N(u) ∩ N(v)| / |N(u) ∪ N(v)|
+- adamic_adar: soma de 1 / log|N(w)| sobre os vizinhos comuns w
+- cosine: cosseno entre as linhas ponderadas A[u] e A[v]
+
+Classes/funções fornecidas:
+- SimilarityIndex / build_similarity_index (pontuação exata, top-k por autor e
+  top-k global de pares ainda não ligados)
+- MinHashLSHIndex / build_minhash_index (top-k aproximado por Jaccard para
+  grafos muito grandes: assinaturas MinHash agrupadas em bandas LSH)
+"""
+from typing import List, Tuple
+
+import numpy as np
+
+from src.analysis.sparse_graph import row_blocks, two_hop_paths, undirected_csr
+
+METHODS = ("common_neighbors", "jaccard", "adamic_adar", "cosine")
+MINHASH_BLOCK_CELLS = 1 << 22  # hashes uint32 (vizinho x permutação) materializados por bloco, ~16 MB
+
+
+class SimilarityIndex:
+    """Vizinhança não-dirigida em CSR mais os termos por autor usados pelas métricas."""
+
+    def __init__(self, adj_list: list[dict]):
+        self.n = len(adj_list)
+        self.indptr, self.indices, self.weights = undirected_csr(adj_list)
+        self.degree = np.diff(self.indptr)
+        self.norm = np.sqrt(np.bincount(np.repeat(np.arange(self.n), self.degree),
+                                        weights=self.weights ** 2, minlength=self.n))
+        with np.errstate(divide="ignore"):
+            inv_log = 1.0 / np.log(self.degree.astype(np.float64))
+        # vizinhos comuns de grau 1 não existem (grau 1 só liga a um lado)
+        self.inv_log_degree = np.where(self.degree > 1, inv_log, 0.0)
+
+    def neighbors(self, u: int) -> np.ndarray:
+        return self.indices[self.indptr[u]:self.indptr[u + 1]]
+
+    def _expand(self, rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Caminhos u - w - v para cada u em `rows`: retorna (u, w, v, A[u,w] * A[w,v])
+        como vetores alinhados (uma entrada por caminho de dois saltos).
+        """
+        u, w, v, pos_uw, pos_wv = two_hop_paths(self.indptr, self.indices, self.weights, rows)
+        return u, w, v, self.weights[pos_uw] * self.weights[pos_wv]
+
+    def _finish(self, method: str, u: np.ndarray, v: np.ndarray, raw: np.ndarray) -> np.ndarray:
+        """Converte a soma de dois saltos de cada par (u, v) na métrica pedida."""
+        if method == "jaccard":
+            return raw / (self.degree[u] + self.degree[v] - raw)
+        if method == "cosine":
+            return raw / (self.norm[u] * self.norm[v])
+        return raw
+
+    def _path_values(self, method: str, w: np.ndarray, products: np.ndarray) -> np.ndarray:
+        if method == "adamic_adar":
+            return self.inv_log_degree[w]
+        if method == "cosine":
+            return products
+        return np.ones(len(w))
+
+    def scores(self, u: int, method: str = "adamic_adar") -> np.ndarray:
+        """Pontuação de `u` contra todos os autores (vetor de tamanho n; 0 = sem vizinho comum)."""
+        if method not in METHODS:
+            raise ValueError(f"Métrica desconhecida: {method!r} (use uma de {METHODS})")
+        _, w, v, products = self._expand(np.array([u], dtype=np.int64))
+        raw = np.bincount(v, weights=self._path_values(method, w, products), minlength=self.n)
+        touched = np.flatnonzero(raw)
+        result = np.zeros(self.n)
+        result[touched] = self._finish(method, np.full(len(touched), u), touched, raw[touched])
+        result[u] = 0.0
+        return result
+
+    def top_k(self, u: int, k: int = 10, method: str = "adamic_adar",
+              exclude_neighbors: bool = False) -> List[Tuple[int, float]]:
+        """
+        Os `k` autores mais similares a `u` (pontuação > 0), em ordem decrescente.
+        Com exclude_neighbors=True só sugere quem ainda não interage com `u`.
+        """
+        score = self.scores(u, method)
+        if exclude_neighbors:
+            score[self.neighbors(u)] = 0.0
+        candidates = np.flatnonzero(score > 0)
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-score[candidates], k - 1)[:k]]
+        order = np.lexsort((candidates, -score[candidates]))
+        return [(int(v), float(score[v])) for v in candidates[order]]
+
+    def predict_links(self, k: int = 20, method: str = "adamic_adar") -> List[Tuple[int, int, float]]:
+        """
+        Os `k` pares {u, v} (u < v) ainda não ligados com maior pontuação no grafo todo.
+        As linhas são processadas em blocos (produto esparso bloco · Aᵀ), então a
+        memória fica limitada pelo número de caminhos de dois saltos por bloco.
+        """
+        if method not in METHODS:
+            raise ValueError(f"Métrica desconhecida: {method!r} (use uma de {METHODS})")
+        best_u = np.zeros(0, dtype=np.int64)
+        best_v = np.zeros(0, dtype=np.int64)
+        best_s = np.zeros(0)
+        edge_keys = np.repeat(np.arange(self.n), self.degree) * self.n + self.indices
+        for row, end in row_blocks(self.indptr, self.indices):
+            u, w, v, products = self._expand(np.arange(row, end, dtype=np.int64))
+            keep = u < v
+            u, w, v, products = u[keep], w[keep], v[keep], products[keep]
+            if not len(u):
+                continue
+            pair_keys = u * self.n + v
+            order = np.argsort(pair_keys, kind="stable")
+            pair_keys = pair_keys[order]
+            starts = np.flatnonzero(np.concatenate([[True], pair_keys[1:] != pair_keys[:-1]]))
+            keys = pair_keys[starts]
+            raw = np.add.reduceat(self._path_values(method, w, products)[order], starts)
+            pu, pv = np.divmod(keys, self.n)
+            # descarta pares que já são vizinhos (edge_keys já está ordenado pelo CSR)
+            pos = np.minimum(np.searchsorted(edge_keys, keys), max(len(edge_keys) - 1, 0))
+            linked = edge_keys[pos] == keys if len(edge_keys) else np.zeros(len(keys), dtype=bool)
+            pu, pv, raw = pu[~linked], pv[~linked], raw[~linked]
+            score = self._finish(method, pu, pv, raw)
+            best_u = np.concatenate([best_u, pu])
+            best_v = np.concatenate([best_v, pv])
+            best_s = np.concatenate([best_s, score])
+            if len(best_s) > k:
+                top = np.argpartition(-best_s, k - 1)[:k]
+                best_u, best_v, best_s = best_u[top], best_v[top], best_s[top]
+        order = np.lexsort((best_v, best_u, -best_s))
+        return [(int(best_u[i]), int(best_v[i]), float(best_s[i])) for i in order]
+
+
+class MinHashLSHIndex:
+    """
+    Índice aproximado de Jaccard entre vizinhanças (MinHash + LSH por bandas).
+
+    Cada autor recebe uma assinatura de `num_perm` mínimos de hashes dos seus
+    vizinhos; a fração de posições iguais entre duas assinaturas estima o
+    Jaccard. As assinaturas são cortadas em `bands` bandas e autores com
+    alguma banda idêntica caem no mesmo balde, então uma consulta só compara
+    `u` com os candidatos dos seus baldes (pares com Jaccard alto colidem com
+    alta probabilidade, pares pouco similares raramente).
+    """
+
+    def __init__(self, adj_list: list[dict], num_perm: int = 64, bands: int = 32, seed: int = 0):
+        if num_perm % bands:
+            raise ValueError("num_perm deve ser múltiplo de bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.indptr, self.indices, _ = undirected_csr(adj_list)
+        indptr, indices = self.indptr, self.indices
+        self.n = len(adj_list)
+        self.degree = np.diff(indptr)
+
+        rng = np.random.default_rng(seed)
+        # hash multiply-shift: h(x) = ((a*x + b) mod 2^64) >> 32, com `a` ímpar;
+        # um valor por (vizinho distinto, permutação)
+        a = rng.integers(0, 1 << 63, size=num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        b = rng.integers(0, 1 << 63, size=num_perm, dtype=np.uint64)
+        self.signatures = np.full((self.n, num_perm), np.iinfo(np.uint32).max, dtype=np.uint32)
+        nonempty = np.flatnonzero(self.degree)
+        # blocos de linhas com até MINHASH_BLOCK_CELLS hashes (vizinhos x permutações) por vez,
+        # em vez de uma matriz (2m x num_perm) de uma só vez
+        for start, end in row_blocks(indptr, indices, budget=max(1, MINHASH_BLOCK_CELLS // num_perm),
+                                     row_cost=self.degree):
+            rows = nonempty[np.searchsorted(nonempty, start):np.searchsorted(nonempty, end)]
+            if not len(rows):
+                continue
+            block = indices[indptr[rows[0]]:indptr[rows[-1] + 1]].astype(np.uint64)
+            with np.errstate(over="ignore"):
+                hashed = ((block[:, None] * a + b) >> np.uint64(32)).astype(np.uint32)
+            self.signatures[rows] = np.minimum.reduceat(hashed, indptr[rows] - indptr[rows[0]], axis=0)
+
+        # baldes por banda em formato CSR: `members[band]` lista os autores ordenados
+        # pelo balde e `bucket_of[:, band]` dá o balde de cada autor
+        rows_per_band = num_perm // bands
+        self.bucket_of = np.zeros((self.n, bands), dtype=np.int64)
+        self.members: List[np.ndarray] = []
+        self.bucket_start: List[np.ndarray] = []
+        for band in range(bands):
+            chunk = np.ascontiguousarray(self.signatures[nonempty, band * rows_per_band:(band + 1) * rows_per_band])
+            _, ids = np.unique(chunk.view(np.dtype((np.void, chunk.dtype.itemsize * rows_per_band))).ravel(),
+                               return_inverse=True)
+            self.bucket_of[nonempty, band] = ids
+            order = np.argsort(ids, kind="stable")
+            self.members.append(nonempty[order])
+            self.bucket_start.append(np.searchsorted(ids[order], np.arange(ids.max() + 2 if len(ids) else 1)))
+
+    def candidates(self, u: int) -> np.ndarray:
+        """Autores que compartilham ao menos um balde com `u`."""
+        if not self.degree[u]:
+            return np.zeros(0, dtype=np.int64)
+        found = np.unique(np.concatenate([
+            self.members[band][self.bucket_start[band][bucket]:self.bucket_start[band][bucket + 1]]
+            for band, bucket in enumerate(self.bucket_of[u])
+        ]))
+        return found[found != u]
+
+    def top_k(self, u: int, k: int = 10, exclude_neighbors: bool = False) -> List[Tuple[int, float]]:
+        """Os `k` candidatos com maior Jaccard estimado pelas assinaturas."""
+        cand = self.candidates(u)
+        if exclude_neighbors:
+            cand = np.setdiff1d(cand, self.indices[self.indptr[u]:self.indptr[u + 1]], assume_unique=True)
+        if not len(cand):
+            return []
+        estimate = (self.signatures[cand] == self.signatures[u]).mean(axis=1)
+        order = np.lexsort((cand, -estimate))[:k]
+        return [(int(cand[i]), float(estimate[i])) for i in order if estimate[i] > 0]
+
+
+def build_similarity_index(adj_list: list[dict]) -> SimilarityIndex:
+    """Constrói o índice de similaridade do grafo (O(m log m); o reuso fica na sessão, ver graph_service)."""
+    return SimilarityIndex(adj_list)
+
+
+def build_minhash_index(adj_list: list[dict], num_perm: int = 64, bands: int = 32, seed: int = 0) -> MinHashLSHIndex:
+    """Constrói o índice MinHash-LSH do grafo (O(m * num_perm); o reuso fica na sessão, ver graph_service)."""
+    return MinHashLSHIndex(adj_list, num_perm=num_perm, bands=bands, seed=seed)
+
+
+__all__ = [
+    "METHODS",
+    "MinHashLSHIndex",
+    "SimilarityIndex",
+    "build_minhash_index",
+    "build_similarity_index",
+]
@@ -0,0 +1,269 @@
+"""Cache persistente (em disco) dos resultados das métricas de grafo.
+
+A chave de cada resultado combina:
+- o nome qualificado da função;
+- uma impressão digital (fingerprint) do CONTEÚDO dos argumentos: listas de
+  adjacência viram o conjunto ordenado de arestas (u, v, peso), de modo que a
+  ordem dos vizinhos não altera a chave (ArrayAdjacency é hasheada
+  pelos bytes dos seus arrays CSR, com os vizinhos de cada linha ordenados);
+- os demais parâmetros (arrays numpy entram pelo dtype, forma e bytes);
+- a versão do código de `src/analysis` (hash dos fontes), para que uma
+  alteração nas implementações invalide os resultados antigos.
+
+Os resultados são gravados com pickle em `METRIC_CACHE_DIR` (um arquivo por
+chave, escrita atômica via arquivo temporário + os.replace), então processos
+diferentes (outra aba do navegador, `run_metrics.py`) compartilham o cache.
+A política de remoção é LRU pelo mtime dos arquivos, respeitando o limite
+`METRIC_CACHE_MAX_MB`.
+
+Uso:
+    @cached_metric
+    def minha_metrica(out_adj, param=1): ...
+
+O decorador só compensa em métricas super-lineares (BFS de todas as fontes,
+métodos iterativos, fechos): a impressão digital percorre todas as arestas em
+Python, então métricas O(m) como `degree_centrality` ficam sem cache.
+"""
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import tempfile
+import warnings
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+from config.settings import METRIC_CACHE_DIR, METRIC_CACHE_ENABLED, METRIC_CACHE_MAX_MB
+from src.analysis.sparse_graph import ArrayAdjacency
+
+_CACHE_SUFFIX = ".pkl"
+
+
+def _code_version() -> str:
+    """Hash dos fontes do pacote de análise (muda sempre que algum módulo muda)."""
+    h = hashlib.blake2b(digest_size=8)
+    for path in sorted(Path(__file__).resolve().parent.glob("*.py")):
+        h.update(path.name.encode())
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+_CODE_VERSION = _code_version()
+
+
+def _is_adjacency(value) -> bool:
+    """Heurística: lista de dicts {v: w} ou lista de listas de pares (v, w)."""
+    if not isinstance(value, (list, tuple)) or not value:
+        return False
+    for nbrs in value:
+        if isinstance(nbrs, dict):
+            continue
+        if isinstance(nbrs, (list, tuple)) and all(isinstance(p, tuple) and len(p) == 2 for p in nbrs):
+            continue
+        return False
+    return True
+
+
+def _feed(h, value) -> None:
+    """Alimenta o hash com uma codificação canônica de `value`."""
+    if isinstance(value, ArrayAdjacency):
+        # arrays CSR já agrupados por origem: reordena os vizinhos de cada linha (lexsort) e hasheia os bytes
+        order = np.lexsort((value.weights, value.indices, np.repeat(np.arange(len(value)), value.degrees())))
+        h.update(b"C%d|" % len(value))
+        h.update(value.indptr.astype(np.int64).tobytes())
+        h.update(value.indices[order].astype(np.int64).tobytes())
+        h.update(value.weights[order].astype(np.float64).tobytes())
+    elif _is_adjacency(value):
+        h.update(b"A%d|" % len(value))
+        for u, nbrs in enumerate(value):
+            pairs = nbrs.items() if isinstance(nbrs, dict) else nbrs
+            for v, w in sorted(pairs):
+                h.update(b"%d>%d:%s;" % (u, v, repr(float(w)).encode()))
+    elif isinstance(value, dict):
+        h.update(b"D%d{" % len(value))
+        for k in sorted(value, key=repr):
+            _feed(h, k)
+            h.update(b"=")
+            _feed(h, value[k])
+        h.update(b"}")
+    elif isinstance(value, (list, tuple)):
+        h.update(b"L%d[" % len(value))
+        for item in value:
+            _feed(h, item)
+            h.update(b",")
+        h.update(b"]")
+    elif isinstance(value, (set, frozenset)):
+        h.update(b"S%d(" % len(value))
+        for item in sorted(value, key=repr):
+            _feed(h, item)
+            h.update(b",")
+        h.update(b")")
+    elif isinstance(value, np.ndarray) and value.dtype != object:
+        h.update(b"N%s%r|" % (value.dtype.str.encode(), value.shape))
+        h.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, float):
+        h.update(b"f" + repr(value).encode())
+    elif value is None or isinstance(value, (bool, int, str, bytes)):
+        h.update(type(value).__name__.encode() + b":" + repr(value).encode())
+    else:
+        raise TypeError(f"Argumento não suportado pelo cache de métricas: {type(value).__name__}")
+
+
+def graph_fingerprint(adj) -> str:
+    """Impressão digital do conteúdo de uma lista de adjacência (arestas + pesos)."""
+    h = hashlib.blake2b(digest_size=16)
+    _feed(h, adj)
+    return h.hexdigest()
+
+
+class MetricCache:
+    """Armazena resultados pickle em um diretório, com remoção LRU por tamanho."""
+
+    def __init__(self, cache_dir: str, max_bytes: int, enabled: bool = True):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+
+    def make_key(self, func: Callable, args: tuple, kwargs: dict) -> str:
+        bound = inspect.signature(func).bind(*args, **kwargs)
+        bound.apply_defaults()
+        return self.key_for(f"{func.__module__}.{func.__qualname__}", **bound.arguments)
+
+    def key_for(self, name: str, **params) -> str:
+        """Chave para um resultado identificado por `name` e pelos parâmetros dados."""
+        h = hashlib.blake2b(digest_size=20)
+        h.update(f"{name}|{_CODE_VERSION}|".encode())
+        for param, value in params.items():
+            h.update(param.encode() + b"=")
+            _feed(h, value)
+            h.update(b"&")
+        return h.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / (key + _CACHE_SUFFIX)
+
+    def get(self, key: str):
+        """
+        Retorna (True, valor) em caso de acerto ou (False, None).
+
+        Um arquivo que existe mas não pode ser lido (truncado, ou gravado por uma
+        versão cujas classes não carregam mais: AttributeError, ImportError...)
+        é removido, para que o próximo cálculo o substitua.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            return False, None
+        except Exception as e:
+            warnings.warn(f"Entrada inválida no cache de métricas ({path.name}) descartada: {e!r}",
+                          RuntimeWarning, stacklevel=2)
+            self._discard(path)
+            return False, None
+        try:
+            os.utime(path)  # marca como usado recentemente (LRU)
+        except OSError:
+            pass
+        return True, value
+
+    def put(self, key: str, value: Any) -> None:
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            warnings.warn(f"Não foi possível gravar no cache de métricas: {e}", RuntimeWarning, stacklevel=2)
+            return
+        self.evict()
+
+    @staticmethod
+    def _discard(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+    def evict(self) -> None:
+        """Remove os arquivos menos usados até o total caber em `max_bytes`."""
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob("*" + _CACHE_SUFFIX):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+                total -= size
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        for path in self.cache_dir.glob("*" + _CACHE_SUFFIX):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+_cache = MetricCache(METRIC_CACHE_DIR, METRIC_CACHE_MAX_MB * 1024 * 1024, METRIC_CACHE_ENABLED)
+
+
+def get_cache() -> MetricCache:
+    """Retorna a instância de cache usada pelo decorador `cached_metric`."""
+    return _cache
+
+
+def configure(cache_dir: Optional[str] = None, max_mb: Optional[float] = None,
+              enabled: Optional[bool] = None) -> MetricCache:
+    """Altera o diretório, o limite de tamanho e/ou liga/desliga o cache."""
+    if cache_dir is not None:
+        _cache.cache_dir = Path(cache_dir)
+    if max_mb is not None:
+        _cache.max_bytes = int(max_mb * 1024 * 1024)
+    if enabled is not None:
+        _cache.enabled = enabled
+    return _cache
+
+
+def cached_metric(func: Callable) -> Callable:
+    """Decorador: memoriza em disco o resultado de uma função de métrica."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _cache.enabled:
+            return func(*args, **kwargs)
+        try:
+            key = _cache.make_key(func, args, kwargs)
+        except TypeError:
+            # argumento não serializável de forma canônica: calcula sem cache
+            return func(*args, **kwargs)
+        hit, value = _cache.get(key)
+        if hit:
+            return value
+        value = func(*args, **kwargs)
+        _cache.put(key, value)
+        return value
+
+    wrapper.uncached = func
+    return wrapper
+
+
+__all__ = [
+    "MetricCache",
+    "cached_metric",
+    "configure",
+    "get_cache",
+    "graph_fingerprint",
+]
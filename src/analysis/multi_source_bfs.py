@@ -0,0 +1,128 @@
+"""BFS multi-fonte bit-paralela (MS-BFS) sobre um snapshot do grafo.
+
+Em vez de uma BFS por fonte, um lote de fontes é percorrido ao mesmo tempo:
+cada vértice guarda uma máscara de bits (um int do Python, de largura
+arbitrária) onde o bit i indica "a fonte i já alcançou este vértice". Uma
+única varredura das arestas da fronteira avança todas as BFS do lote, então o
+custo de percorrer as listas de adjacência é dividido entre até `batch_size`
+fontes.
+
+Funções fornecidas:
+- build_neighbor_snapshot (tuplas de vizinhos a partir de out_adj ou lista de dicts)
+- ms_bfs (gerador nível a nível das máscaras recém-visitadas)
+- ms_bfs_distance_sums (alcançáveis e soma de distâncias por fonte)
+"""
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+DEFAULT_BATCH_SIZE = 1024
+# Quem guarda os níveis de cada fonte do lote (ex.: Brandes) usa O(batch * n) de
+# memória; lotes menores mantêm esse custo baixo e não ficam mais lentos.
+LEVELS_BATCH_SIZE = 64
+
+
+def build_neighbor_snapshot(adj) -> List[Tuple[int, ...]]:
+    """Congela a adjacência em uma lista de tuplas de vizinhos (sem pesos).
+
+    Aceita tanto `out_adj` (listas de pares (vizinho, peso)) quanto a lista de
+    dicionários {vizinho: peso} devolvida por `getAsAdjacencyList()`.
+    """
+    snapshot = []
+    for nbrs in adj:
+        if isinstance(nbrs, dict):
+            snapshot.append(tuple(nbrs))
+        else:
+            snapshot.append(tuple(v for v, _ in nbrs))
+    return snapshot
+
+
+def ms_bfs(neighbors: Sequence[Sequence[int]], sources: Sequence[int]) -> Iterator[Tuple[int, Dict[int, int]]]:
+    """Executa uma BFS por fonte de `sources`, todas ao mesmo tempo.
+
+    Gera, para cada profundidade d >= 1, o par (d, visit) onde `visit` mapeia
+    vértice -> máscara das fontes (bit i = sources[i]) que o alcançaram pela
+    primeira vez exatamente na distância d.
+    """
+    n = len(neighbors)
+    seen = [0] * n
+    frontier: Dict[int, int] = {}
+    for i, s in enumerate(sources):
+        bit = 1 << i
+        seen[s] |= bit
+        frontier[s] = frontier.get(s, 0) | bit
+
+    depth = 0
+    while frontier:
+        depth += 1
+        nxt: Dict[int, int] = {}
+        for v, mask in frontier.items():
+            for w in neighbors[v]:
+                new = mask & ~seen[w]
+                if new:
+                    seen[w] |= new
+                    nxt[w] = nxt.get(w, 0) | new
+        if not nxt:
+            break
+        yield depth, nxt
+        frontier = nxt
+
+
+def _column_counts(masks: Iterable[int], width: int) -> List[int]:
+    """Conta, para cada bit 0..width-1, em quantas máscaras ele está ligado.
+
+    Usa um contador fatiado por bits (bit-sliced): a fatia j guarda o bit j
+    do contador de cada coluna, então somar uma máscara custa poucas operações
+    de int independentemente da largura do lote.
+    """
+    slices: List[int] = []
+    for mask in masks:
+        carry = mask
+        j = 0
+        while carry:
+            if j == len(slices):
+                slices.append(carry)
+                break
+            overflow = slices[j] & carry
+            slices[j] ^= carry
+            carry = overflow
+            j += 1
+
+    counts = [0] * width
+    for j, sl in enumerate(slices):
+        weight = 1 << j
+        bits = bin(sl)[:1:-1]  # LSB primeiro
+        pos = bits.find('1')
+        while pos >= 0:
+            counts[pos] += weight
+            pos = bits.find('1', pos + 1)
+    return counts
+
+
+def ms_bfs_distance_sums(neighbors: Sequence[Sequence[int]],
+                         batch_size: int = DEFAULT_BATCH_SIZE) -> Tuple[List[int], List[int]]:
+    """Retorna (reachable, dist_sum) para todas as fontes 0..n-1.
+
+    reachable[s] = número de vértices alcançáveis a partir de s (excluindo s)
+    dist_sum[s]  = soma das distâncias (não-ponderadas) de s até eles
+    """
+    n = len(neighbors)
+    reachable = [0] * n
+    dist_sum = [0] * n
+    for start in range(0, n, batch_size):
+        sources = range(start, min(n, start + batch_size))
+        width = len(sources)
+        for depth, visit in ms_bfs(neighbors, sources):
+            counts = _column_counts(visit.values(), width)
+            for i, c in enumerate(counts):
+                if c:
+                    reachable[start + i] += c
+                    dist_sum[start + i] += depth * c
+    return reachable, dist_sum
+
+
+__all__ = [
+    "DEFAULT_BATCH_SIZE",
+    "LEVELS_BATCH_SIZE",
+    "build_neighbor_snapshot",
+    "ms_bfs",
+    "ms_bfs_distance_sums",
+]
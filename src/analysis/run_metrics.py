@@ -19,8 +19,7 @@ from src.services.shared_queries import fetch_authors_and_edges
 from src.analysis.centrality_metrics import (
     build_adjlists,
     degree_centrality,
-    betweenness_centrality,
-    closeness_centrality,
+    compute_centralities,
     pagerank,
     eigenvector_centrality,
 )
@@ -59,13 +58,14 @@ def main():
     deg_un = degree_centrality(out_adj, in_adj, weighted=False, mode='out')
     pprint(top_n(deg_un, idx_to_name, n=10))
 
+    # Betweenness e closeness compartilham os mesmos níveis de BFS (MS-BFS em lotes)
+    fused = compute_centralities(out_adj, metrics=['betweenness', 'closeness'])
+
     print('\nBetweenness centrality (unweighted Brandes) - top 10:')
-    bc = betweenness_centrality(out_adj)
-    pprint(top_n(bc, idx_to_name, n=10))
+    pprint(top_n(fused['betweenness'], idx_to_name, n=10))
 
     print('\nCloseness centrality (unweighted) - top 10:')
-    cc = closeness_centrality(out_adj)
-    pprint(top_n(cc, idx_to_name, n=10))
+    pprint(top_n(fused['closeness'], idx_to_name, n=10))
 
     print('\nPageRank (weighted) - top 10:')
     pr = pagerank(out_adj)
@@ -0,0 +1,70 @@
+"""Terminal runner for a sensitivity sweep over the relation weights.
+
+Usage:
+    python src/analysis/run_weight_sweep.py --vary REVIEW=2,4,8 --vary MERGE=1,5,10 [--top 10]
+
+The author-artifact model is loaded from Neo4j once; every combination of the
+`--vary` values (the other relations keep `shared_queries.WEIGHTS`) is then
+evaluated locally and compared with the baseline `WEIGHTS`: Kendall tau of the
+full PageRank / degree rankings and how many of the baseline top-k remain.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from src.utils.neo4j_connector import get_neo4j_service
+from src.services.shared_queries import RELATION_PROJECTIONS, WEIGHTS, get_author_artifact_model
+from src.analysis.weight_sensitivity import sweep_weights, weight_grid
+
+
+def parse_axis(text):
+    relation, _, values = text.partition("=")
+    if relation not in RELATION_PROJECTIONS or not values:
+        raise argparse.ArgumentTypeError(
+            f"use RELACAO=v1,v2,... com RELACAO em {', '.join(RELATION_PROJECTIONS)}")
+    return relation, [float(v) for v in values.split(",")]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--vary", type=parse_axis, action="append", required=True,
+                        help="relação e valores a testar, ex.: REVIEW=2,4,8 (pode repetir)")
+    parser.add_argument("--top", type=int, default=10, help="tamanho do top-k comparado (padrão 10)")
+    args = parser.parse_args()
+
+    try:
+        neo4j = get_neo4j_service()
+    except Exception as e:
+        print("Erro conectando ao Neo4j:", e, file=sys.stderr)
+        sys.exit(1)
+
+    model = get_author_artifact_model(neo4j)
+    if not model.num_authors:
+        print("Nenhum autor retornado pelo banco.")
+        return
+    edges_by_relation = {rel: model.relation_edges(rel) for rel in WEIGHTS if rel in RELATION_PROJECTIONS}
+    grid = weight_grid(dict(args.vary), WEIGHTS)
+    print(f"Autores: {model.num_authors}, pontos na grade: {len(grid)}")
+
+    result = sweep_weights(model.num_authors, edges_by_relation, grid, dict(WEIGHTS), k=args.top)
+    names = model.idx_to_name
+
+    print(f"\nLinha de base {dict(WEIGHTS)}")
+    print(f"  PageRank top {args.top}: {', '.join(names[u] for u, _ in result['baseline']['pagerank_top'])}")
+    print(f"  Degree top {args.top}:   {', '.join(names[u] for u, _ in result['baseline']['degree_top'])}")
+
+    varied = [rel for rel, _ in args.vary]
+    header = "  ".join(f"{rel:>14}" for rel in varied)
+    print(f"\n{header}  {'tau PR':>7}  {'tau deg':>7}  {'top PR':>6}  {'top deg':>7}  {'iter':>4}")
+    for point in result['points']:
+        values = "  ".join(f"{point['weights'][rel]:>14g}" for rel in varied)
+        print(f"{values}  {point['pagerank_tau']:>7.3f}  {point['degree_tau']:>7.3f}  "
+              f"{point['pagerank_overlap']:>3}/{args.top:<2}  {point['degree_overlap']:>4}/{args.top:<2}  "
+              f"{point['pagerank_iterations']:>4}")
+
+
+if __name__ == '__main__':
+    main()
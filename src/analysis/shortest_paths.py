@@ -0,0 +1,282 @@
+"""Consultas de caminho mínimo entre dois autores.
+
+Funções/classes fornecidas:
+- build_cost_adjacency (vizinhos de saída/entrada com custo por aresta)
+- bidirectional_bfs (menor número de saltos, busca pelas duas pontas)
+- bidirectional_dijkstra (custo = 1/peso, opcionalmente guiada por potenciais ALT)
+- LandmarkIndex (distâncias de/para landmarks, limites inferiores pela desigualdade triangular)
+- ShortestPathIndex / build_shortest_path_index (índice por grafo, guardado no cache de métricas)
+
+O modelo de custo ponderado é o mesmo de `betweenness_centrality_weighted`:
+pesos representam força da interação, então custo = 1.0 / peso.
+"""
+import heapq
+import math
+from collections import deque
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+from src.analysis.metric_cache import cached_metric
+
+CostAdjacency = List[Tuple[Tuple[int, float], ...]]
+
+
+def build_cost_adjacency(adj_list: list[dict], weighted: bool = True) -> Tuple[CostAdjacency, CostAdjacency]:
+    """
+    Retorna (forward, backward): para cada nó, tuplas (vizinho, custo) das arestas
+    de saída e de entrada. Com weighted=False todo custo é 1 (contagem de saltos);
+    arestas com peso <= 0 são ignoradas no modo ponderado.
+    """
+    n = len(adj_list)
+    forward = [[] for _ in range(n)]
+    backward = [[] for _ in range(n)]
+    for u, nbrs in enumerate(adj_list):
+        for v, w in nbrs.items():
+            if weighted:
+                if w <= 0:
+                    continue
+                cost = 1.0 / float(w)
+            else:
+                cost = 1.0
+            forward[u].append((v, cost))
+            backward[v].append((u, cost))
+    return [tuple(x) for x in forward], [tuple(x) for x in backward]
+
+
+def _join_path(parent_f: dict, parent_b: dict, meet: int) -> List[int]:
+    """Concatena s -> meet (árvore da frente) com meet -> t (árvore de trás)."""
+    path = []
+    x = meet
+    while x is not None:
+        path.append(x)
+        x = parent_f[x]
+    path.reverse()
+    x = parent_b[meet]
+    while x is not None:
+        path.append(x)
+        x = parent_b[x]
+    return path
+
+
+def bidirectional_bfs(forward: CostAdjacency, backward: CostAdjacency, source: int, target: int) -> List[int]:
+    """
+    Caminho com menos arestas de `source` a `target` (lista de nós, vazia se não houver).
+    Expande sempre a fronteira menor, então explora ~2 * b^(d/2) nós em vez de b^d.
+    """
+    if source == target:
+        return [source]
+    parent_f = {source: None}
+    parent_b = {target: None}
+    frontier_f = [source]
+    frontier_b = [target]
+    while frontier_f and frontier_b:
+        if len(frontier_f) <= len(frontier_b):
+            frontier, parents, other, nbrs = frontier_f, parent_f, parent_b, forward
+        else:
+            frontier, parents, other, nbrs = frontier_b, parent_b, parent_f, backward
+        nxt = []
+        meet = None
+        for u in frontier:
+            for v, _ in nbrs[u]:
+                if v not in parents:
+                    parents[v] = u
+                    nxt.append(v)
+                    if v in other and meet is None:
+                        meet = v
+        if meet is not None:
+            return _join_path(parent_f, parent_b, meet)
+        if frontier is frontier_f:
+            frontier_f = nxt
+        else:
+            frontier_b = nxt
+    return []
+
+
+def bidirectional_dijkstra(forward: CostAdjacency, backward: CostAdjacency, source: int, target: int,
+                           potential: Optional[Callable[[int], float]] = None) -> Tuple[float, List[int], int]:
+    """
+    Dijkstra bidirecional de `source` a `target`. Retorna (custo, caminho, nós_fixados);
+    custo = inf e caminho vazio se `target` for inalcançável.
+
+    `potential` (opcional) é a função p(v) de uma busca A* bidirecional com
+    potenciais médios (ALT): a busca da frente ordena por d_f(v) + p(v) e a de
+    trás por d_b(v) - p(v). Com custos reduzidos consistentes o critério de
+    parada continua sendo chave_frente + chave_trás >= melhor custo encontrado.
+    """
+    if source == target:
+        return 0.0, [source], 0
+    p = potential or (lambda v: 0.0)
+    dist = ({source: 0.0}, {target: 0.0})
+    parents = ({source: None}, {target: None})
+    settled = (set(), set())
+    heaps = ([(p(source), source)], [(-p(target), target)])
+    sign = (1.0, -1.0)
+    adjacency = (forward, backward)
+    best = math.inf
+    meet = None
+    num_settled = 0
+
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= best:
+            break
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        key, u = heapq.heappop(heaps[side])
+        if u in settled[side]:
+            continue
+        settled[side].add(u)
+        num_settled += 1
+        d_u = dist[side][u]
+        other_dist = dist[1 - side]
+        for v, cost in adjacency[side][u]:
+            alt = d_u + cost
+            if alt < dist[side].get(v, math.inf):
+                dist[side][v] = alt
+                parents[side][v] = u
+                heapq.heappush(heaps[side], (alt + sign[side] * p(v), v))
+                if v in other_dist and alt + other_dist[v] < best:
+                    best = alt + other_dist[v]
+                    meet = v
+
+    if meet is None:
+        return math.inf, [], num_settled
+    return best, _join_path(parents[0], parents[1], meet), num_settled
+
+
+def _single_source(adjacency: CostAdjacency, source: int) -> List[float]:
+    """Dijkstra completo a partir de `source` sobre `adjacency` (inf = inalcançável)."""
+    dist = [math.inf] * len(adjacency)
+    dist[source] = 0.0
+    heap = [(0.0, source)]
+    while heap:
+        d_u, u = heapq.heappop(heap)
+        if d_u > dist[u]:
+            continue
+        for v, cost in adjacency[u]:
+            alt = d_u + cost
+            if alt < dist[v]:
+                dist[v] = alt
+                heapq.heappush(heap, (alt, v))
+    return dist
+
+
+class LandmarkIndex:
+    """
+    Distâncias pré-calculadas de e para um pequeno conjunto de landmarks (ALT).
+
+    Pela desigualdade triangular, para todo landmark L:
+        d(v, t) >= d(v, L) - d(t, L)   e   d(v, t) >= d(L, t) - d(L, v)
+    O maior desses limites é um potencial admissível e consistente para A*.
+    Landmarks são escolhidos pela heurística "mais distante": o primeiro é o
+    nó de maior grau e cada seguinte é o mais distante (em saltos) dos já
+    escolhidos, o que espalha os landmarks pela periferia do grafo.
+    """
+
+    def __init__(self, forward: CostAdjacency, backward: CostAdjacency, num_landmarks: int = 8):
+        n = len(forward)
+        self.landmarks: List[int] = []
+        dist_from, dist_to = [], []  # d(L, v) e d(v, L)
+
+        undirected = [[v for v, _ in forward[u]] + [v for v, _ in backward[u]] for u in range(n)]
+        hops = [math.inf] * n
+        current = max(range(n), key=lambda u: (len(undirected[u]), -u), default=None)
+        while current is not None and len(self.landmarks) < min(num_landmarks, n):
+            self.landmarks.append(current)
+            dist_from.append(_single_source(forward, current))
+            dist_to.append(_single_source(backward, current))
+            hops[current] = 0
+            q = deque([current])
+            while q:
+                u = q.popleft()
+                for v in undirected[u]:
+                    if hops[v] > hops[u] + 1:
+                        hops[v] = hops[u] + 1
+                        q.append(v)
+            # próximo landmark: nó alcançável mais distante dos já escolhidos;
+            # nós de outras componentes (inf) ainda não cobertas têm prioridade
+            current = max(range(n), key=lambda u: (hops[u], -u))
+            if hops[current] == 0:
+                break
+
+        self.dist_from = np.array(dist_from, dtype=np.float64).reshape(len(self.landmarks), n)
+        self.dist_to = np.array(dist_to, dtype=np.float64).reshape(len(self.landmarks), n)
+
+    @staticmethod
+    def _bounds(minuend: np.ndarray, subtrahend: np.ndarray) -> np.ndarray:
+        """
+        max(0, max_L (minuend - subtrahend)) por nó. Minuendo infinito com
+        subtraendo finito prova que não há caminho (inf); inf - inf não informa nada.
+        """
+        with np.errstate(invalid="ignore"):
+            terms = minuend - subtrahend
+        terms[np.isnan(terms)] = 0.0
+        if terms.shape[0] == 0:
+            return np.zeros(terms.shape[1])
+        return np.maximum(terms.max(axis=0), 0.0)
+
+    def bounds_to(self, t: int) -> np.ndarray:
+        """Limite inferior de d(v, t) para todo v (inf = v provadamente não alcança t)."""
+        d_to, d_from = self.dist_to, self.dist_from
+        # d(v, t) >= d(v, L) - d(t, L)   e   d(v, t) >= d(L, t) - d(L, v)
+        via_to = self._bounds(d_to, np.broadcast_to(d_to[:, t:t + 1], d_to.shape))
+        via_from = self._bounds(np.broadcast_to(d_from[:, t:t + 1], d_from.shape), d_from)
+        return np.maximum(via_to, via_from)
+
+    def bounds_from(self, s: int) -> np.ndarray:
+        """Limite inferior de d(s, v) para todo v (inf = s provadamente não alcança v)."""
+        d_to, d_from = self.dist_to, self.dist_from
+        # d(s, v) >= d(s, L) - d(v, L)   e   d(s, v) >= d(L, v) - d(L, s)
+        via_to = self._bounds(np.broadcast_to(d_to[:, s:s + 1], d_to.shape), d_to)
+        via_from = self._bounds(d_from, np.broadcast_to(d_from[:, s:s + 1], d_from.shape))
+        return np.maximum(via_to, via_from)
+
+
+class ShortestPathIndex:
+    """
+    Índice de consultas de caminho mínimo de um grafo: adjacências de saída e
+    entrada já com custos e, opcionalmente, um LandmarkIndex para ALT.
+    """
+
+    def __init__(self, adj_list: list[dict], weighted: bool = True, num_landmarks: int = 0):
+        self.weighted = weighted
+        self.forward, self.backward = build_cost_adjacency(adj_list, weighted)
+        self.landmarks = LandmarkIndex(self.forward, self.backward, num_landmarks) if num_landmarks > 0 else None
+
+    def query(self, source: int, target: int) -> Tuple[float, List[int], int]:
+        """Retorna (custo, caminho, nós_fixados); custo em saltos se o índice não for ponderado."""
+        if not self.weighted and self.landmarks is None:
+            path = bidirectional_bfs(self.forward, self.backward, source, target)
+            return (float(len(path) - 1) if path else math.inf), path, 0
+
+        potential = None
+        if self.landmarks is not None:
+            to_target = self.landmarks.bounds_to(target)
+            if to_target[source] == math.inf:
+                return math.inf, [], 0
+            from_source = self.landmarks.bounds_from(source)
+            # potencial médio p(v) = (pi_t(v) - pi_s(v)) / 2; nós que provadamente não
+            # alcançam t (ou não são alcançados por s) recebem chave infinita na busca
+            # correspondente e nunca são expandidos
+            with np.errstate(invalid="ignore"):
+                p = (to_target - from_source) / 2.0
+            p[np.isinf(from_source)] = -math.inf
+            p[np.isinf(to_target)] = math.inf
+            potential = p.tolist().__getitem__
+
+        return bidirectional_dijkstra(self.forward, self.backward, source, target, potential)
+
+
+@cached_metric
+def build_shortest_path_index(adj_list: list[dict], weighted: bool = True, num_landmarks: int = 0) -> ShortestPathIndex:
+    """Constrói (ou recupera do cache de métricas) o índice de caminhos mínimos do grafo."""
+    return ShortestPathIndex(adj_list, weighted=weighted, num_landmarks=num_landmarks)
+
+
+__all__ = [
+    "LandmarkIndex",
+    "ShortestPathIndex",
+    "bidirectional_bfs",
+    "bidirectional_dijkstra",
+    "build_cost_adjacency",
+    "build_shortest_path_index",
+]
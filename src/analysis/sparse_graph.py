@@ -0,0 +1,225 @@
+"""Representações em arrays (numpy) de grafos e passadas vetorizadas sobre elas.
+
+Funções/classes fornecidas:
+- aggregate_edges (soma de pesos por par (u, v) com sort + bincount, sem dict de tuplas)
+- ArrayAdjacency (lista de adjacência dirigida apoiada em arrays CSR)
+- undirected_csr (indptr, indices, weights simétricos; pesos das duas direções somados)
+- two_hop_paths (caminhos u - w - v de um conjunto de linhas, como vetores alinhados)
+- row_blocks (fatias de linhas cujo custo, por padrão caminhos de dois saltos, cabe num orçamento)
+- weighted_pagerank (PageRank sobre vetores de arestas, com vetor inicial opcional)
+"""
+from collections.abc import Sequence
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+DEFAULT_PATH_BUDGET = 1 << 21  # caminhos de dois saltos materializados por bloco
+
+
+def aggregate_edges(edges_by_relation: Dict[str, object], weights: Dict[str, float],
+                    default_weight: float = 1.0,
+                    drop_self_loops: bool = False) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Agrega as arestas de várias relações em (src, dst, peso_total), um elemento
+    por par (u, v) distinto, ordenado por (u, v).
+
+    Cada ocorrência de (u, v) na relação `rel` soma weights.get(rel, default_weight).
+    Os pares de cada relação podem ser listas de tuplas ou matrizes (k, 2); a
+    agregação empilha as chaves, ordena uma chave int64 por par e soma com bincount.
+    """
+    src_parts, dst_parts, weight_parts = [], [], []
+    for rel, pairs in edges_by_relation.items():
+        arr = _pairs_array(pairs)
+        src_parts.append(arr[:, 0])
+        dst_parts.append(arr[:, 1])
+        weight_parts.append(np.full(len(arr), float(weights.get(rel, default_weight))))
+    if not src_parts:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0)
+
+    src = np.concatenate(src_parts)
+    dst = np.concatenate(dst_parts)
+    wts = np.concatenate(weight_parts)
+    if drop_self_loops:
+        keep = src != dst
+        src, dst, wts = src[keep], dst[keep], wts[keep]
+    if not len(src):
+        return src, dst, wts
+
+    # uma chave int64 por par (ordenar uma coluna é bem mais rápido que lexsort em duas)
+    width = int(dst.max()) + 1
+    keys = src * width + dst
+    order = np.argsort(keys)
+    keys = keys[order]
+    first = np.ones(len(keys), dtype=bool)
+    first[1:] = keys[1:] != keys[:-1]
+    totals = np.bincount(np.cumsum(first) - 1, weights=wts[order])
+    unique_src, unique_dst = np.divmod(keys[first], width)
+    return unique_src, unique_dst, totals
+
+
+def _pairs_array(pairs) -> np.ndarray:
+    """Matriz (k, 2) int64 a partir de uma matriz ou de uma lista de pares (u, v)."""
+    if isinstance(pairs, np.ndarray):
+        return pairs.astype(np.int64, copy=False).reshape(-1, 2)
+    flat = np.fromiter((x for pair in pairs for x in pair[:2]), dtype=np.int64)
+    return flat.reshape(-1, 2)
+
+
+class ArrayAdjacency(Sequence):
+    """
+    Lista de adjacência dirigida apoiada em arrays CSR (indptr, indices, weights).
+
+    Comporta-se como a lista de listas de pares (vizinho, peso) de `build_adjlists`
+    (adj[u] devolve a lista de pares de u), então serve às métricas existentes,
+    mas ocupa três arrays em vez de uma tupla Python por aresta. Cada adj[u]
+    monta uma lista nova; métricas iterativas (pagerank, top_k_pagerank,
+    eigenvector_centrality) reconhecem a classe e usam os arrays diretamente.
+    """
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray):
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+
+    @classmethod
+    def from_edges(cls, n: int, src: np.ndarray, dst: np.ndarray, weights: np.ndarray) -> "ArrayAdjacency":
+        """Agrupa as arestas por origem (ordem estável, arestas repetidas são mantidas)."""
+        src = np.asarray(src, dtype=np.int64)
+        order = np.argsort(src, kind="stable")
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+        return cls(indptr, np.asarray(dst, dtype=np.int64)[order], np.asarray(weights, dtype=np.float64)[order])
+
+    def __len__(self) -> int:
+        return len(self.indptr) - 1
+
+    def __getitem__(self, u) -> List[Tuple[int, float]]:
+        if isinstance(u, slice):
+            return [self[i] for i in range(*u.indices(len(self)))]
+        if u < 0:
+            u += len(self)
+        if not 0 <= u < len(self):
+            raise IndexError(u)
+        start, end = self.indptr[u], self.indptr[u + 1]
+        return list(zip(self.indices[start:end].tolist(), self.weights[start:end].tolist()))
+
+    def degrees(self) -> np.ndarray:
+        return np.diff(self.indptr)
+
+
+def undirected_csr(adj) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    CSR simétrico (indptr, indices, weights), sem laços, com o peso de {u, v}
+    igual a w(u, v) + w(v, u). Aceita `out_adj` (listas de pares (vizinho, peso)),
+    uma ArrayAdjacency ou a lista de dicionários de `getAsAdjacencyList()`; as
+    colunas de cada linha saem ordenadas.
+    """
+    n = len(adj)
+    if isinstance(adj, ArrayAdjacency):
+        src = np.repeat(np.arange(n, dtype=np.int64), adj.degrees())
+        keep = src != adj.indices
+        return _symmetrize(n, src[keep], adj.indices[keep], adj.weights[keep])
+    pairs = [nbrs.items() if isinstance(nbrs, dict) else nbrs for nbrs in adj]
+    src = [u for u, nbrs in enumerate(pairs) for v, _ in nbrs if v != u]
+    dst = [v for u, nbrs in enumerate(pairs) for v, _ in nbrs if v != u]
+    wts = [float(w) for u, nbrs in enumerate(pairs) for v, w in nbrs if v != u]
+    return _symmetrize(n, np.array(src, dtype=np.int64), np.array(dst, dtype=np.int64),
+                       np.array(wts, dtype=np.float64))
+
+
+def _symmetrize(n: int, src: np.ndarray, dst: np.ndarray,
+                wts: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """CSR de u -> v e v -> u para cada aresta (src, dst), somando pesos de pares repetidos."""
+    rows = np.concatenate([src, dst])
+    cols = np.concatenate([dst, src])
+    weights = np.concatenate([wts, wts])
+
+    keys = rows * n + cols
+    unique_keys, inverse = np.unique(keys, return_inverse=True)
+    summed = np.bincount(inverse, weights=weights, minlength=len(unique_keys))
+    rows, cols = np.divmod(unique_keys, n) if n else (unique_keys, unique_keys)
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+    return indptr, cols, summed
+
+
+def two_hop_paths(indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray,
+                  rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Caminhos u - w - v para cada u em `rows` (v pode ser o próprio u).
+    Retorna (u, w, v, pos_uw, pos_wv): vetores alinhados, um elemento por
+    caminho, onde pos_* são as posições das arestas em `indices`/`weights`.
+    """
+    degree = np.diff(indptr)
+    first_lengths = degree[rows]
+    ends = indptr[rows + 1]
+    pos_uw = np.repeat(ends - first_lengths.cumsum(), first_lengths) + np.arange(first_lengths.sum())
+    u = np.repeat(rows, first_lengths)
+    w = indices[pos_uw]
+
+    second_lengths = degree[w]
+    pos_wv = np.repeat(indptr[w + 1] - second_lengths.cumsum(), second_lengths) + np.arange(second_lengths.sum())
+    return (np.repeat(u, second_lengths), np.repeat(w, second_lengths), indices[pos_wv],
+            np.repeat(pos_uw, second_lengths), pos_wv)
+
+
+def row_blocks(indptr: np.ndarray, indices: np.ndarray, budget: int = DEFAULT_PATH_BUDGET,
+               row_cost: Optional[np.ndarray] = None) -> Iterator[Tuple[int, int]]:
+    """
+    Gera intervalos [início, fim) de linhas cujo custo total fica dentro de
+    `budget` (ao menos uma linha por bloco). O custo padrão de uma linha é o
+    número de caminhos de dois saltos (soma dos graus dos vizinhos); `row_cost`
+    substitui esse custo (ex.: o grau, quando só os vizinhos diretos são lidos).
+    """
+    n = len(indptr) - 1
+    if row_cost is None:
+        degree = np.diff(indptr)
+        row_cost = np.bincount(np.repeat(np.arange(n), degree), weights=degree[indices], minlength=n)
+    paths_cum = np.concatenate([[0.0], np.asarray(row_cost, dtype=np.float64).cumsum()])
+    row = 0
+    while row < n:
+        end = int(np.searchsorted(paths_cum, paths_cum[row] + budget, side="right")) - 1
+        end = min(n, max(end, row + 1))
+        yield row, end
+        row = end
+
+
+def weighted_pagerank(n: int, src: np.ndarray, dst: np.ndarray, weights: np.ndarray,
+                      start: Optional[np.ndarray] = None, damping: float = 0.85, max_iter: int = 100,
+                      tol: float = 1.0e-6, out_strength: Optional[np.ndarray] = None) -> Tuple[np.ndarray, int]:
+    """
+    PageRank sobre as arestas (src, dst, peso), com a mesma definição de
+    `centrality_metrics.pagerank`: os pesos de saída viram frações e nós sem
+    saída (força 0) distribuem o rank igualmente entre os n nós. Arestas
+    repetidas somam. `start` é o vetor inicial (partida a quente, ex.: o
+    resultado de um grafo parecido) e `out_strength` pode vir pré-calculado.
+    Retorna (rank, iterações usadas).
+    """
+    if n == 0:
+        return np.zeros(0), 0
+    if out_strength is None:
+        out_strength = np.bincount(src, weights=weights, minlength=n)
+    source_strength = out_strength[src]
+    share = np.divide(weights, source_strength, out=np.zeros(len(src)), where=source_strength > 0)
+    dangling = out_strength <= 0
+    pr = np.full(n, 1.0 / n) if start is None else np.array(start, dtype=np.float64)
+    iterations = 0
+    for iterations in range(1, max_iter + 1):
+        new_pr = np.full(n, (1.0 - damping) / n + damping * pr[dangling].sum() / n)
+        new_pr += damping * np.bincount(dst, weights=pr[src] * share, minlength=n)
+        err = np.abs(new_pr - pr).sum()
+        pr = new_pr
+        if err < tol:
+            break
+    return pr, iterations
+
+
+__all__ = [
+    "ArrayAdjacency",
+    "DEFAULT_PATH_BUDGET",
+    "aggregate_edges",
+    "row_blocks",
+    "two_hop_paths",
+    "undirected_csr",
+    "weighted_pagerank",
+]
@@ -1,5 +1,13 @@
 import math
-from collections import defaultdict
+import random
+from itertools import chain
+from statistics import NormalDist
+
+import numpy as np
+
+from src.analysis.metric_cache import cached_metric
+from src.analysis.multi_source_bfs import build_neighbor_snapshot, ms_bfs_distance_sums
+from src.analysis.reachability import strongly_connected_components
 
 def calculate_density(num_vertices: int, num_edges: int) -> float:
     """
@@ -11,101 +19,530 @@ def calculate_density(num_vertices: int, num_edges: int) -> float:
     possible_edges = num_vertices * (num_vertices - 1)
     return num_edges / possible_edges
 
+def _undirected_neighbor_sets(adj_list: list[dict]) -> list[set]:
+    """Vizinhança não-direcionada (entrada e saída combinadas, sem laços)."""
+    undirected = [set() for _ in range(len(adj_list))]
+    for u, neighbors in enumerate(adj_list):
+        for v in neighbors:
+            if u != v:
+                undirected[u].add(v)
+                undirected[v].add(u)
+    return undirected
+
+
+def count_triangles(adj_list: list[dict]) -> list[int]:
+    """
+    Número de triângulos (grafo tratado como NÃO-DIRECIONADO) em que cada nó participa.
+
+    Algoritmo "forward" ordenado por grau: os nós são ranqueados por
+    (grau, índice) e cada aresta é orientada do nó de menor rank para o de
+    maior. Cada triângulo é encontrado uma única vez, na interseção das listas
+    "para frente" das pontas de uma aresta orientada, e essas listas têm no
+    máximo O(sqrt(m)) elementos, o que limita o custo total a O(m * sqrt(m))
+    mesmo com hubs de milhares de vizinhos (em vez de O(sum k^2)).
+    """
+    undirected = _undirected_neighbor_sets(adj_list)
+    n = len(undirected)
+    order = sorted(range(n), key=lambda u: (len(undirected[u]), u))
+    rank = [0] * n
+    for r, u in enumerate(order):
+        rank[u] = r
+
+    forward = [None] * n
+    for u in range(n):
+        ru = rank[u]
+        forward[u] = {v for v in undirected[u] if rank[v] > ru}
+
+    triangles = [0] * n
+    for u in order:
+        fu = forward[u]
+        for v in fu:
+            common = fu & forward[v]
+            if common:
+                c = len(common)
+                triangles[u] += c
+                triangles[v] += c
+                for w in common:
+                    triangles[w] += 1
+    return triangles
+
+
+@cached_metric
+def calculate_local_clustering_coefficients(adj_list: list[dict]) -> list[float]:
+    """
+    Coeficiente de aglomeração local de cada nó (grafo NÃO-DIRECIONADO):
+    C(u) = triângulos(u) / (k(u) * (k(u) - 1) / 2), e 0 para nós com k < 2.
+    """
+    triangles = count_triangles(adj_list)
+    degrees = [len(s) for s in _undirected_neighbor_sets(adj_list)]
+    local = []
+    for t, k in zip(triangles, degrees):
+        local.append(t / (k * (k - 1) / 2) if k >= 2 else 0.0)
+    return local
+
+
+@cached_metric
 def calculate_average_clustering_coefficient(adj_list: list[dict]) -> float:
     """
     Calcula o coeficiente de aglomeração médio.
     Trata o grafo como NÃO-DIRECIONADO para analisar a 'coesão social' (colaboração).
-    
-    Lógica:
-    Para cada nó u:
-      1. Identifica seus vizinhos (entrada e saída combinados).
-      2. Conta quantas ligações existem entre esses vizinhos.
-      3. Divide pelo total de ligações possíveis entre eles.
+
+    Média dos coeficientes locais sobre todos os n nós (nós com menos de dois
+    vizinhos contam como 0). Os triângulos são contados por `count_triangles`.
     """
     n = len(adj_list)
     if n == 0:
         return 0.0
+    return sum(calculate_local_clustering_coefficients(adj_list)) / n
 
-    # Converter para lista de adjacência não-direcionada
-    undirected_adj = defaultdict(set)
-    for u, neighbors in enumerate(adj_list):
-        for v in neighbors:
-            if u != v:
-                undirected_adj[u].add(v)
-                undirected_adj[v].add(u)
 
-    total_coefficient = 0.0
-    
-    for u in range(n):
-        neighbors = list(undirected_adj[u])
-        k = len(neighbors)
-        
-        if k < 2:
+@cached_metric
+def estimate_average_clustering_coefficient(adj_list: list[dict], num_samples: int = 10000,
+                                            confidence: float = 0.95, seed: int = 0) -> tuple[float, float, float]:
+    """
+    Estimativa do coeficiente de aglomeração médio por amostragem de cunhas (wedges).
+
+    Cada amostra sorteia um nó uniformemente e, se ele tiver k >= 2, uma cunha
+    (par de vizinhos) uniforme nele; o indicador "a cunha é fechada" tem
+    esperança igual a C(u), então a média dos indicadores estima a média de
+    C(u). O custo é O(num_samples) após montar a vizinhança.
+
+    Retorna (estimativa, limite_inferior, limite_superior) com o intervalo de
+    confiança normal (aproximação binomial) no nível `confidence`.
+    """
+    n = len(adj_list)
+    if n == 0 or num_samples <= 0:
+        return 0.0, 0.0, 0.0
+
+    undirected = _undirected_neighbor_sets(adj_list)
+    neighbor_lists = [list(s) for s in undirected]
+    rng = random.Random(seed)
+    closed = 0
+    for _ in range(num_samples):
+        nbrs = neighbor_lists[rng.randrange(n)]
+        if len(nbrs) < 2:
             continue
-            
-        actual_links = 0
-        for i in range(k):
-            for j in range(i + 1, k):
-                neighbor_a = neighbors[i]
-                neighbor_b = neighbors[j]
-                
-                if neighbor_b in undirected_adj[neighbor_a]:
-                    actual_links += 1
-        
-        # Total possível de conexões entre os vizinhos: k * (k-1) / 2
-        possible_links = (k * (k - 1)) / 2
-        
-        local_coefficient = actual_links / possible_links
-        total_coefficient += local_coefficient
-
-    return total_coefficient / n
+        a, b = rng.sample(nbrs, 2)
+        if b in undirected[a]:
+            closed += 1
+
+    p = closed / num_samples
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    half_width = z * math.sqrt(p * (1 - p) / num_samples)
+    return p, max(0.0, p - half_width), min(1.0, p + half_width)
+
+TRIAD_TYPES = ("003", "012", "102", "021D", "021U", "021C", "111D", "111U",
+               "030T", "030C", "201", "120D", "120U", "120C", "210", "300")
+
+# tipo (índice em TRIAD_TYPES) de cada código de tríade (v, u, w), onde o código soma
+# 1: v->u, 2: u->v, 4: v->w, 8: w->v, 16: u->w, 32: w->u
+_TRICODE_TYPE = (0, 1, 1, 2, 1, 3, 5, 7, 1, 5, 4, 6, 2, 7, 6, 10,
+                 1, 5, 3, 7, 4, 8, 8, 12, 5, 9, 8, 13, 6, 13, 11, 14,
+                 1, 4, 5, 6, 5, 8, 9, 13, 3, 8, 8, 11, 7, 12, 13, 14,
+                 2, 6, 7, 10, 6, 11, 13, 14, 7, 13, 12, 14, 10, 14, 14, 15)
+
+
+@cached_metric
+def calculate_triad_census(adj_list: list[dict]) -> dict:
+    """
+    Censo de tríades dirigidas: quantas das C(n, 3) triplas de nós são de cada
+    um dos 16 tipos MAN (TRIAD_TYPES), ex. 102 = um par recíproco e um nó isolado.
+
+    Algoritmo de Batagelj & Mrvar, O(m * Δ): só as triplas com ao menos uma
+    aresta são visitadas, cada uma uma única vez, a partir do par (v, u) com
+    v < u conectado; triplas com uma única díade ligada são contadas em bloco
+    (n - |N(v) ∪ N(u)|) e as vazias (003) saem por diferença de C(n, 3).
+    """
+    n = len(adj_list)
+    successors = [set(nbrs) - {u} for u, nbrs in enumerate(adj_list)]
+    neighbors = _undirected_neighbor_sets(adj_list)
+    census = [0] * len(TRIAD_TYPES)
+
+    for v in range(n):
+        succ_v = successors[v]
+        nbrs_v = neighbors[v]
+        for u in nbrs_v:
+            if u <= v:
+                continue
+            succ_u = successors[u]
+            link = (1 if u in succ_v else 0) | (2 if v in succ_u else 0)
+            union = nbrs_v | neighbors[u]
+            census[2 if link == 3 else 1] += n - len(union)  # |union| já inclui u e v
+            for w in union:
+                if w == u or w == v:
+                    continue
+                # cada tripla conexa é contada uma vez: pelo menor par conectado (v, u)
+                if u < w or (v < w and w not in nbrs_v):
+                    succ_w = successors[w]
+                    code = (link
+                            | (4 if w in succ_v else 0) | (8 if v in succ_w else 0)
+                            | (16 if w in succ_u else 0) | (32 if u in succ_w else 0))
+                    census[_TRICODE_TYPE[code]] += 1
+
+    census[0] = n * (n - 1) * (n - 2) // 6 - sum(census[1:])
+    return dict(zip(TRIAD_TYPES, census))
+
+
+def edge_arrays(adj_list: list[dict]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Converte a lista de adjacência em três vetores paralelos (origem, destino, peso),
+    percorrendo os dicionários uma única vez.
+    """
+    counts = np.fromiter((len(nbrs) for nbrs in adj_list), dtype=np.int64, count=len(adj_list))
+    m = int(counts.sum())
+    src = np.repeat(np.arange(len(adj_list), dtype=np.int64), counts)
+    dst = np.fromiter(chain.from_iterable(adj_list), dtype=np.int64, count=m)
+    weights = np.fromiter(chain.from_iterable(nbrs.values() for nbrs in adj_list), dtype=np.float64, count=m)
+    return src, dst, weights
+
+
+def _degree_assortativity(src: np.ndarray, dst: np.ndarray, degrees: np.ndarray) -> float:
+    """Correlação de Pearson entre o grau da origem e o grau do destino de cada aresta."""
+    if len(src) == 0:
+        return 0.0
+    x = degrees[src].astype(np.float64)
+    y = degrees[dst].astype(np.float64)
+    dx = x - x.mean()
+    dy = y - y.mean()
+    denominator = math.sqrt(float(dx @ dx) * float(dy @ dy))
+    if denominator == 0:
+        return 0.0
+    return float(dx @ dy) / denominator
+
+
+def _ccdf(degrees: np.ndarray) -> np.ndarray:
+    """CCDF dos graus: ccdf[k] = fração de nós com grau >= k, para k = 0..max."""
+    if len(degrees) == 0:
+        return np.zeros(0)
+    hist = np.bincount(degrees)
+    return np.cumsum(hist[::-1])[::-1] / len(degrees)
+
+
+def calculate_structural_summary(adj_list: list[dict]) -> dict:
+    """
+    Resumo estrutural em uma única passada vetorizada sobre os vetores de arestas.
+
+    Retorna um dicionário com:
+      num_vertices, num_edges, density, assortativity, reciprocity (floats/ints);
+      src, dst (vetores de arestas), in_degree, out_degree, total_degree (por nó);
+      in_hist, out_hist, total_hist (hist[k] = nº de nós com grau k);
+      in_ccdf, out_ccdf, total_ccdf (fração de nós com grau >= k).
+    Reciprocidade: fração das arestas (u, v) para as quais (v, u) também existe.
+    """
+    n = len(adj_list)
+    src, dst, _ = edge_arrays(adj_list)
+    m = len(src)
+
+    out_degree = np.bincount(src, minlength=n)
+    in_degree = np.bincount(dst, minlength=n)
+    total_degree = out_degree + in_degree
+
+    if m:
+        keys = np.sort(src * n + dst)
+        reverse = dst * n + src
+        pos = np.minimum(np.searchsorted(keys, reverse), m - 1)
+        reciprocity = float(np.count_nonzero(keys[pos] == reverse)) / m
+    else:
+        reciprocity = 0.0
+
+    summary = {
+        'num_vertices': n,
+        'num_edges': m,
+        'density': calculate_density(n, m),
+        'assortativity': _degree_assortativity(src, dst, total_degree),
+        'reciprocity': reciprocity,
+        'src': src,
+        'dst': dst,
+    }
+    for label, degrees in (('in', in_degree), ('out', out_degree), ('total', total_degree)):
+        summary[f'{label}_degree'] = degrees
+        summary[f'{label}_hist'] = np.bincount(degrees) if n else np.zeros(0, dtype=np.int64)
+        summary[f'{label}_ccdf'] = _ccdf(degrees)
+    return summary
+
 
 def calculate_assortativity(adj_list: list[dict]) -> float:
     """
     Calcula a assortatividade de grau (Correlação de Pearson entre graus dos nós conectados).
     Analisa se nós muito conectados tendem a se conectar com outros nós muito conectados.
+    Usa o grau total (entrada + saída) das pontas de cada aresta (origem -> destino).
     
     Retorna:
        1.0: Perfeitamente assortativa (famosos com famosos).
        0.0: Não correlacionada.
       -1.0: Disassortativa (famosos com novatos).
     """
-    # Calcular graus totais de cada nó
-    n = len(adj_list)
-    degrees = [0] * n
-    
-    edges = []
-    
-    for u, neighbors in enumerate(adj_list):
-        degrees[u] += len(neighbors)
-        for v in neighbors:
-            degrees[v] += 1
-            edges.append((u, v))
-            
-    if not edges:
-        return 0.0
+    src, dst, _ = edge_arrays(adj_list)
+    degrees = np.bincount(src, minlength=len(adj_list)) + np.bincount(dst, minlength=len(adj_list))
+    return _degree_assortativity(src, dst, degrees)
 
-    # Preparar as listas X e Y para correlação
-    # X = grau do nó de origem, Y = grau do nó de destino
-    x_vals = []
-    y_vals = []
-    
-    for u, v in edges:
-        x_vals.append(degrees[u])
-        y_vals.append(degrees[v])
-        
-    sum_x = sum(x_vals)
-    sum_y = sum(y_vals)
-    sum_xy = sum(i * j for i, j in zip(x_vals, y_vals))
-    sum_x2 = sum(i ** 2 for i in x_vals)
-    sum_y2 = sum(i ** 2 for i in y_vals)
-    
-    num_items = len(x_vals)
-    
-    numerator = (num_items * sum_xy) - (sum_x * sum_y)
-    denominator = math.sqrt((num_items * sum_x2 - sum_x ** 2) * (num_items * sum_y2 - sum_y ** 2))
-    
-    if denominator == 0:
+@cached_metric
+def calculate_average_shortest_path_length(adj_list: list[dict]) -> float:
+    """
+    Calcula o comprimento médio dos caminhos mínimos (não-ponderados, dirigidos).
+
+    A média é feita sobre todos os pares ordenados (u, v) com v alcançável a
+    partir de u, o que mantém o valor definido em grafos desconexos.
+    As BFS de todas as fontes são executadas em lotes pela MS-BFS bit-paralela.
+    """
+    reachable, dist_sum = ms_bfs_distance_sums(build_neighbor_snapshot(adj_list))
+    total_pairs = sum(reachable)
+    if total_pairs == 0:
         return 0.0
-        
-    return numerator / denominator
\ No newline at end of file
+    return sum(dist_sum) / total_pairs
+
+
+CORE_MODES = ("total", "in", "out")
+
+
+def calculate_core_numbers(adj, mode: str = "total") -> list[int]:
+    """
+    Número de core (k-core) de cada nó pelo algoritmo de Batagelj-Zaversnik, O(n + m).
+
+    `adj` pode ser out_adj ou a lista de dicts de `getAsAdjacencyList()`.
+    mode="total" usa grau de entrada + saída, "in" o grau de entrada e "out" o
+    de saída. O k-core é o maior subgrafo em que todo nó tem grau >= k; o
+    número de core de v é o maior k cujo k-core contém v.
+
+    Os nós ficam em um vetor ordenado por grau (bucket sort) e são removidos
+    do menor para o maior; cada remoção decrementa o grau dos vizinhos
+    afetados trocando-os de posição com o primeiro nó do seu bucket, em O(1).
+    """
+    if mode not in CORE_MODES:
+        raise ValueError(f"Modo de k-core desconhecido: {mode!r}. Use um de {CORE_MODES}.")
+    out_nbrs = build_neighbor_snapshot(adj)
+    n = len(out_nbrs)
+    in_nbrs = [[] for _ in range(n)]
+    for u, nbrs in enumerate(out_nbrs):
+        for v in nbrs:
+            in_nbrs[v].append(u)
+
+    if mode == "total":
+        degree = [len(out_nbrs[u]) + len(in_nbrs[u]) for u in range(n)]
+        affected = [tuple(out_nbrs[u]) + tuple(in_nbrs[u]) for u in range(n)]
+    elif mode == "in":
+        # remover v reduz o grau de entrada dos seus sucessores
+        degree = [len(in_nbrs[u]) for u in range(n)]
+        affected = out_nbrs
+    else:
+        # remover v reduz o grau de saída dos seus predecessores
+        degree = [len(out_nbrs[u]) for u in range(n)]
+        affected = in_nbrs
+    if n == 0:
+        return []
+
+    max_degree = max(degree)
+    bin_start = [0] * (max_degree + 1)
+    for d in degree:
+        bin_start[d] += 1
+    start = 0
+    for d in range(max_degree + 1):
+        count = bin_start[d]
+        bin_start[d] = start
+        start += count
+    pos = [0] * n
+    vert = [0] * n
+    for v in range(n):
+        pos[v] = bin_start[degree[v]]
+        vert[pos[v]] = v
+        bin_start[degree[v]] += 1
+    for d in range(max_degree, 0, -1):
+        bin_start[d] = bin_start[d - 1]
+    bin_start[0] = 0
+
+    for i in range(n):
+        v = vert[i]
+        dv = degree[v]
+        for u in affected[v]:
+            du = degree[u]
+            if du > dv:
+                pu = pos[u]
+                pw = bin_start[du]
+                w = vert[pw]
+                if u != w:
+                    pos[u], pos[w] = pw, pu
+                    vert[pu], vert[pw] = w, u
+                bin_start[du] += 1
+                degree[u] = du - 1
+    return degree
+
+
+def _bfs_distances(neighbors, source: int) -> list[int]:
+    """Distâncias (em saltos) de `source` a todos os nós; -1 para inalcançáveis."""
+    dist = [-1] * len(neighbors)
+    dist[source] = 0
+    frontier = [source]
+    depth = 0
+    while frontier:
+        depth += 1
+        nxt = []
+        for u in frontier:
+            for v in neighbors[u]:
+                if dist[v] < 0:
+                    dist[v] = depth
+                    nxt.append(v)
+        frontier = nxt
+    return dist
+
+
+def _largest_component_view(adj_list: list[dict], strong: bool):
+    """
+    Subgrafo induzido pela maior componente fracamente (strong=False, vizinhança
+    não-direcionada) ou fortemente (strong=True, arestas dirigidas) conexa.
+    Retorna (vizinhos_saída, vizinhos_entrada), com os nós renumerados 0..c-1.
+    """
+    directed = build_neighbor_snapshot(adj_list)
+    if strong:
+        components = strongly_connected_components(directed)
+        if not components:
+            return [], []
+        nodes = max(components, key=len)
+        members = set(nodes)
+        local = {u: i for i, u in enumerate(nodes)}
+        forward = [tuple(local[v] for v in directed[u] if v in members) for u in nodes]
+        backward = [[] for _ in nodes]
+        for i, nbrs in enumerate(forward):
+            for j in nbrs:
+                backward[j].append(i)
+        return forward, [tuple(b) for b in backward]
+
+    undirected = [set() for _ in directed]
+    for u, nbrs in enumerate(directed):
+        for v in nbrs:
+            if u != v:
+                undirected[u].add(v)
+                undirected[v].add(u)
+    # Uma única rotulação: `seen` é compartilhado e cada BFS só percorre a própria
+    # componente, então o total é O(n + m) mesmo com muitos autores isolados.
+    seen = [False] * len(undirected)
+    largest: list[int] = []
+    for s in range(len(undirected)):
+        if seen[s]:
+            continue
+        seen[s] = True
+        component = [s]
+        for u in component:  # a lista cresce durante o laço e serve de fila
+            for v in undirected[u]:
+                if not seen[v]:
+                    seen[v] = True
+                    component.append(v)
+        if len(component) > len(largest):
+            largest = component
+    local = {u: i for i, u in enumerate(largest)}
+    view = [tuple(local[v] for v in undirected[u]) for u in largest]
+    return view, view
+
+
+@cached_metric
+def calculate_diameter(adj_list: list[dict], strong: bool = False) -> dict:
+    """
+    Diâmetro exato da maior componente conexa, sem BFS de todos os pares.
+
+    strong=False: maior componente fracamente conexa, distâncias não-direcionadas.
+    strong=True: maior componente fortemente conexa, distâncias dirigidas.
+
+    Usa iFUB (DiFUB no caso dirigido, Crescenzi et al.): a partir do nó u de
+    maior grau, as BFS de ida e de volta dividem os nós em níveis F_i. Os nós
+    do nível i são examinados do mais distante para o mais próximo; assim que
+    o maior valor encontrado ultrapassar 2(i-1), nenhum par restante pode ser
+    mais longo e o valor é o diâmetro. Em redes reais (com hubs) poucas BFS
+    bastam.
+
+    Retorna {'diameter', 'component_size', 'bfs_runs'}.
+    """
+    return _diameter_of_view(*_largest_component_view(adj_list, strong))
+
+
+def _diameter_of_view(forward, backward) -> dict:
+    """iFUB/DiFUB sobre uma visão já montada por `_largest_component_view`."""
+    c = len(forward)
+    if c <= 1:
+        return {'diameter': 0, 'component_size': c, 'bfs_runs': 0}
+    directed = backward is not forward
+
+    u = max(range(c), key=lambda x: (len(forward[x]) + len(backward[x]), -x))
+    dist_from = _bfs_distances(forward, u)
+    dist_to = _bfs_distances(backward, u) if directed else dist_from
+    bfs_runs = 2 if directed else 1
+
+    top = max(max(dist_from), max(dist_to))
+    levels_from = [[] for _ in range(top + 1)]  # nós a distância i de u
+    levels_to = [[] for _ in range(top + 1)]    # nós a distância i até u
+    for w in range(c):
+        levels_from[dist_from[w]].append(w)
+        levels_to[dist_to[w]].append(w)
+
+    # Todo par (x, y) ainda não examinado satisfaz d(x, y) <= d(x, u) + d(u, y) <= 2i,
+    # e após esgotar o nível i os restantes ficam limitados a 2(i - 1).
+    lower = top
+    for i in range(top, 0, -1):
+        # excentricidade de saída de quem está longe "antes" de u
+        for x in levels_to[i]:
+            if lower >= 2 * i:
+                break
+            lower = max(lower, max(_bfs_distances(forward, x)))
+            bfs_runs += 1
+        # excentricidade de entrada de quem está longe "depois" de u
+        if directed:
+            for x in levels_from[i]:
+                if lower >= 2 * i:
+                    break
+                lower = max(lower, max(_bfs_distances(backward, x)))
+                bfs_runs += 1
+        if lower > 2 * (i - 1):
+            break
+
+    return {'diameter': lower, 'component_size': c, 'bfs_runs': bfs_runs}
+
+
+@cached_metric
+def estimate_average_shortest_path_length(adj_list: list[dict], strong: bool = False, num_samples: int = 256,
+                                          confidence: float = 0.95, seed: int = 0) -> dict:
+    """
+    Comprimento médio dos caminhos mínimos da maior componente (fraca ou forte),
+    estimado a partir de BFS de `num_samples` fontes sorteadas.
+
+    Dentro de uma componente conexa cada fonte alcança todos os outros c-1 nós,
+    então o ASPL é a média simples das distâncias médias por fonte e o
+    intervalo de confiança normal vem do desvio padrão amostral dessas médias.
+    Se num_samples >= c, todas as fontes são usadas e o valor é exato.
+
+    Retorna {'aspl', 'low', 'high', 'component_size', 'samples'}.
+    """
+    forward, _ = _largest_component_view(adj_list, strong)
+    return _aspl_of_view(forward, num_samples, confidence, seed)
+
+
+def _aspl_of_view(forward, num_samples: int, confidence: float, seed: int) -> dict:
+    """ASPL amostrado sobre uma visão já montada por `_largest_component_view`."""
+    c = len(forward)
+    if c <= 1:
+        return {'aspl': 0.0, 'low': 0.0, 'high': 0.0, 'component_size': c, 'samples': 0}
+
+    exact = num_samples >= c
+    sources = range(c) if exact else random.Random(seed).sample(range(c), num_samples)
+    means = [sum(_bfs_distances(forward, s)) / (c - 1) for s in sources]
+    aspl = sum(means) / len(means)
+    if exact or len(means) < 2:
+        half_width = 0.0
+    else:
+        variance = sum((x - aspl) ** 2 for x in means) / (len(means) - 1)
+        # correção de população finita: amostragem sem reposição entre c fontes
+        fpc = (c - len(means)) / (c - 1)
+        half_width = NormalDist().inv_cdf(0.5 + confidence / 2) * math.sqrt(variance / len(means) * fpc)
+    return {'aspl': aspl, 'low': aspl - half_width, 'high': aspl + half_width,
+            'component_size': c, 'samples': len(means)}
+
+
+@cached_metric
+def calculate_distance_summary(adj_list: list[dict], strong: bool = False, num_samples: int = 256,
+                               confidence: float = 0.95, seed: int = 0) -> dict:
+    """
+    Diâmetro (`calculate_diameter`) e ASPL (`estimate_average_shortest_path_length`)
+    da maior componente, montando a visão da componente (e o Tarjan, na visão
+    forte) uma única vez para os dois.
+
+    Retorna {'diameter', 'bfs_runs', 'aspl', 'low', 'high', 'component_size', 'samples'}.
+    """
+    forward, backward = _largest_component_view(adj_list, strong)
+    return {**_diameter_of_view(forward, backward), **_aspl_of_view(forward, num_samples, confidence, seed)}
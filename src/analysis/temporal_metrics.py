@@ -0,0 +1,233 @@
+"""Séries temporais de centralidade em janelas deslizantes.
+
+Cada interação datada (src, dst, peso, instante) cai num período (semana ou
+mês). As interações são ordenadas por período uma única vez; assim a janela
+com os períodos [p, p + span) é sempre uma fatia contígua [lo, hi) dos
+vetores ordenados, e passar de uma janela para a seguinte é só avançar as
+duas pontas: as interações entre o hi antigo e o novo entram, as entre o lo
+antigo e o novo expiram. Nenhum grafo é reconstruído do zero:
+
+- grau ponderado e contagem de interações por autor são atualizados somando
+  ou subtraindo apenas as interações que entraram ou saíram;
+- PageRank itera sobre a fatia da janela (mesma definição de
+  `centrality_metrics.pagerank`) partindo do vetor da janela anterior;
+- Louvain parte da partição da janela anterior (`initial_membership`).
+
+Funções/classes fornecidas:
+- period_index / period_start (instantes -> períodos semanais ou mensais e de volta)
+- SlidingWindowSeries (estado incremental da janela atual)
+- sliding_window_metrics (grau, PageRank e número de comunidades por janela)
+"""
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.analysis.community_metrics import louvain_community_detection
+from src.analysis.metric_cache import cached_metric
+from src.analysis.sparse_graph import ArrayAdjacency, weighted_pagerank
+
+FREQUENCIES = ("W", "M")
+# semanas do numpy começam na quinta-feira (1970-01-01); deslocar 3 dias faz começarem na segunda
+_WEEK_SHIFT = np.timedelta64(3, "D")
+
+
+def period_index(times: np.ndarray, freq: str = "M") -> np.ndarray:
+    """Período (semanas ou meses desde 1970) de cada instante, em segundos desde a época."""
+    if freq not in FREQUENCIES:
+        raise ValueError(f"Frequência desconhecida: {freq!r} (use uma de {FREQUENCIES})")
+    moments = np.floor(np.asarray(times, dtype=np.float64)).astype(np.int64).astype("datetime64[s]")
+    if freq == "W":
+        moments = moments + _WEEK_SHIFT
+    return moments.astype(f"datetime64[{freq}]").astype(np.int64)
+
+
+def period_start(period: int, freq: str = "M") -> np.datetime64:
+    """Primeiro dia do período (segunda-feira para semanas)."""
+    start = np.datetime64(int(period), freq).astype("datetime64[D]")
+    return start - _WEEK_SHIFT if freq == "W" else start
+
+
+class SlidingWindowSeries:
+    """
+    Janelas de `span` períodos, avançando `step` períodos por vez, sobre as
+    interações datadas. Interações sem data (nan) são descartadas.
+
+    O estado (grau de entrada/saída e contagens por autor) corresponde sempre
+    à janela passada ao último `advance`.
+    """
+
+    def __init__(self, n: int, src, dst, weights, times, freq: str = "M", span: int = 1, step: int = 1):
+        if span < 1 or step < 1:
+            raise ValueError("span e step devem ser >= 1")
+        times = np.asarray(times, dtype=np.float64)
+        valid = np.isfinite(times)
+        periods = period_index(times[valid], freq)
+        order = np.argsort(periods, kind="stable")
+
+        self.n = n
+        self.freq = freq
+        self.span = span
+        self.step = step
+        self.src = np.asarray(src, dtype=np.int64)[valid][order]
+        self.dst = np.asarray(dst, dtype=np.int64)[valid][order]
+        self.weights = np.asarray(weights, dtype=np.float64)[valid][order]
+        self.periods = periods[order]
+
+        if len(self.periods):
+            first, last = int(self.periods[0]), int(self.periods[-1])
+            self.window_starts = np.arange(first, max(first, last - span + 1) + 1, step, dtype=np.int64)
+        else:
+            self.window_starts = np.zeros(0, dtype=np.int64)
+        self.window_lo = np.searchsorted(self.periods, self.window_starts, side="left")
+        self.window_hi = np.searchsorted(self.periods, self.window_starts + span, side="left")
+
+        self.lo = self.hi = 0
+        self.out_strength = np.zeros(n)
+        self.in_strength = np.zeros(n)
+        self.out_count = np.zeros(n, dtype=np.int64)
+        self.in_count = np.zeros(n, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.window_starts)
+
+    def labels(self) -> List[str]:
+        """Data de início de cada janela (AAAA-MM-DD)."""
+        return [str(period_start(p, self.freq)) for p in self.window_starts]
+
+    def _apply(self, start: int, end: int, sign: int) -> None:
+        """Insere (sign=+1) ou expira (sign=-1) as interações [start, end) dos vetores ordenados."""
+        if end <= start:
+            return
+        src, dst, weights = self.src[start:end], self.dst[start:end], self.weights[start:end]
+        self.out_strength += sign * np.bincount(src, weights=weights, minlength=self.n)
+        self.in_strength += sign * np.bincount(dst, weights=weights, minlength=self.n)
+        self.out_count += sign * np.bincount(src, minlength=self.n)
+        self.in_count += sign * np.bincount(dst, minlength=self.n)
+
+    def advance(self, window: int) -> Tuple[int, int]:
+        """Leva o estado para a janela `window` aplicando só as diferenças; retorna a fatia (lo, hi)."""
+        lo, hi = int(self.window_lo[window]), int(self.window_hi[window])
+        if lo >= self.hi or hi <= self.lo:
+            # janelas disjuntas: recomeçar sai mais barato que expirar tudo
+            self.out_strength[:] = 0.0
+            self.in_strength[:] = 0.0
+            self.out_count[:] = 0
+            self.in_count[:] = 0
+            self._apply(lo, hi, +1)
+        else:
+            self._apply(self.hi, hi, +1)
+            self._apply(hi, self.hi, -1)
+            self._apply(self.lo, lo, -1)
+            self._apply(lo, self.lo, +1)
+        self.lo, self.hi = lo, hi
+        # autores sem interações na janela voltam a zero exato (sem resíduo de ponto flutuante)
+        self.out_strength[self.out_count == 0] = 0.0
+        self.in_strength[self.in_count == 0] = 0.0
+        return lo, hi
+
+    def degree(self) -> np.ndarray:
+        """Grau ponderado total (entrada + saída) de cada autor na janela atual."""
+        return self.out_strength + self.in_strength
+
+    def active(self) -> np.ndarray:
+        """Autores com ao menos uma interação na janela atual."""
+        return np.flatnonzero(self.out_count + self.in_count)
+
+    def pagerank(self, start: Optional[np.ndarray] = None, damping: float = 0.85, max_iter: int = 100,
+                 tol: float = 1.0e-6) -> Tuple[np.ndarray, int]:
+        """
+        PageRank da janela atual (como `centrality_metrics.pagerank`: pesos de saída
+        como frações, nós sem saída distribuem o rank igualmente entre os n autores).
+        `start` é o vetor inicial (o da janela anterior); retorna (rank, iterações).
+        """
+        lo, hi = self.lo, self.hi
+        return weighted_pagerank(self.n, self.src[lo:hi], self.dst[lo:hi], self.weights[lo:hi], start=start,
+                                 damping=damping, max_iter=max_iter, tol=tol, out_strength=self.out_strength)
+
+    def communities(self, previous: Optional[np.ndarray] = None, seed: int = 0) -> Tuple[np.ndarray, int]:
+        """
+        Louvain no grafo da janela atual (só autores ativos, pesos agregados por par).
+        `previous` (rótulo por autor, -1 = inativo) vem da janela anterior e serve de
+        partição inicial. Retorna (rótulo por autor, número de comunidades).
+        """
+        labels = np.full(self.n, -1, dtype=np.int64)
+        active = self.active()
+        m = len(active)
+        if not m:
+            return labels, 0
+        compact = np.full(self.n, -1, dtype=np.int64)
+        compact[active] = np.arange(m)
+        keys = compact[self.src[self.lo:self.hi]] * m + compact[self.dst[self.lo:self.hi]]
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        totals = np.bincount(inverse, weights=self.weights[self.lo:self.hi], minlength=len(unique_keys))
+        adj = ArrayAdjacency.from_edges(m, unique_keys // m, unique_keys % m, totals)
+
+        initial = None
+        if previous is not None:
+            initial = previous[active].copy()
+            fresh = initial < 0
+            # autores que entraram agora começam sozinhos (rótulos novos, sem colidir)
+            initial[fresh] = self.n + np.arange(int(fresh.sum()))
+            initial = initial.tolist()
+        found = louvain_community_detection.uncached(adj, seed=seed, initial_membership=initial)
+        for c, members in enumerate(found):
+            labels[active[members]] = c
+        return labels, len(found)
+
+
+@cached_metric
+def sliding_window_metrics(n: int, src: np.ndarray, dst: np.ndarray, weights: np.ndarray, times: np.ndarray,
+                           freq: str = "M", span: int = 1, step: int = 1, damping: float = 0.85,
+                           max_iter: int = 100, tol: float = 1.0e-6, communities: bool = True,
+                           seed: int = 0) -> Dict[str, object]:
+    """
+    Grau, PageRank e número de comunidades em cada janela deslizante.
+
+    Retorna dict com:
+      'labels': data de início de cada janela;
+      'degree', 'pagerank': matrizes (janelas x n) em float32;
+      'communities': número de comunidades por janela (None se communities=False);
+      'active_authors', 'interactions': autores ativos e interações em cada janela;
+      'pagerank_iterations': iterações do PageRank (com partida a quente) por janela.
+    """
+    series = SlidingWindowSeries(n, src, dst, weights, times, freq=freq, span=span, step=step)
+    windows = len(series)
+    degree = np.zeros((windows, n), dtype=np.float32)
+    rank = np.zeros((windows, n), dtype=np.float32)
+    community_counts: List[int] = []
+    active_authors: List[int] = []
+    interactions: List[int] = []
+    iterations: List[int] = []
+
+    previous_rank = None
+    previous_labels = None
+    for window in range(windows):
+        lo, hi = series.advance(window)
+        degree[window] = series.degree()
+        previous_rank, used = series.pagerank(previous_rank, damping=damping, max_iter=max_iter, tol=tol)
+        rank[window] = previous_rank
+        if communities:
+            previous_labels, count = series.communities(previous_labels, seed=seed)
+            community_counts.append(count)
+        active_authors.append(len(series.active()))
+        interactions.append(hi - lo)
+        iterations.append(used)
+
+    return {
+        'labels': series.labels(),
+        'degree': degree,
+        'pagerank': rank,
+        'communities': community_counts if communities else None,
+        'active_authors': active_authors,
+        'interactions': interactions,
+        'pagerank_iterations': iterations,
+    }
+
+
+__all__ = [
+    "FREQUENCIES",
+    "SlidingWindowSeries",
+    "period_index",
+    "period_start",
+    "sliding_window_metrics",
+]
@@ -0,0 +1,228 @@
+"""Sensibilidade dos rankings aos pesos das relações (`shared_queries.WEIGHTS`).
+
+Para cada par de autores (u, v) e cada relação r guarda-se, uma única vez,
+quantas interações do tipo r existem de u para v (matriz pares x relações).
+O peso integrado de cada aresta para um vetor de pesos w é então o produto
+`contagens @ w`, e o grau ponderado de cada autor é `contagens_por_autor @ w`:
+avaliar um ponto da grade não passa de novo pelo banco nem pela agregação.
+O PageRank de cada ponto parte do vetor do ponto anterior (pesos vizinhos
+produzem rankings parecidos, então a iteração converge em poucos passos).
+
+Funções/classes fornecidas:
+- kendall_tau (τ-b de Kendall com empates, algoritmo de Knight em O(n log n))
+- weight_grid (produto cartesiano de valores alternativos sobre pesos base)
+- WeightSweep (contagens por relação e avaliação de um vetor de pesos)
+- sweep_weights (top-k de PageRank/grau e τ contra a linha de base em cada ponto)
+"""
+import itertools
+import math
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.analysis.metric_cache import cached_metric
+from src.analysis.sparse_graph import weighted_pagerank
+
+
+def _count_inversions(values: np.ndarray) -> int:
+    """
+    Pares i < j com values[i] > values[j] (empates não contam), para inteiros
+    não negativos. Radix MSD bit a bit: a cada bit, dentro de cada grupo de
+    mesmo prefixo, cada elemento com bit 0 forma inversão com os elementos de
+    bit 1 anteriores a ele; depois o grupo é particionado de forma estável
+    (zeros antes dos uns). São O(log max) passadas lineares.
+    """
+    n = len(values)
+    if n < 2:
+        return 0
+    positions = np.arange(n)
+    order = positions.copy()  # posições originais, ordenadas (estável) pelo prefixo atual
+    total = 0
+    for b in range(int(values.max()).bit_length() - 1, -1, -1):
+        sorted_values = values[order]
+        bit = (sorted_values >> b) & 1
+        prefix = sorted_values >> (b + 1)
+        new_group = np.ones(n, dtype=bool)
+        new_group[1:] = prefix[1:] != prefix[:-1]
+        starts = np.flatnonzero(new_group)
+        group_start = starts[np.cumsum(new_group) - 1]
+
+        ones_before = np.cumsum(bit) - bit
+        ones_before = ones_before - ones_before[group_start]
+        total += int(ones_before[bit == 0].sum())
+
+        zeros_in_group = np.add.reduceat(1 - bit, starts)[np.cumsum(new_group) - 1]
+        zeros_before = positions - group_start - ones_before
+        new_position = np.where(bit == 0, group_start + zeros_before, group_start + zeros_in_group + ones_before)
+        new_order = np.empty_like(order)
+        new_order[new_position] = order
+        order = new_order
+    return total
+
+
+def _tied_pairs(sorted_values: np.ndarray) -> int:
+    """Número de pares empatados num vetor ordenado."""
+    if not len(sorted_values):
+        return 0
+    boundaries = np.flatnonzero(np.concatenate([[True], sorted_values[1:] != sorted_values[:-1], [True]]))
+    runs = np.diff(boundaries)
+    return int((runs * (runs - 1) // 2).sum())
+
+
+def kendall_tau(x: Sequence[float], y: Sequence[float]) -> float:
+    """
+    τ-b de Kendall entre dois vetores de pontuação (correção para empates).
+
+    Algoritmo de Knight: ordena por (x, y) e conta as inversões de y nessa
+    ordem (pares discordantes) em O(n log n), sem comparar todos os pares.
+    Retorna nan se algum dos vetores for constante ou tiver menos de 2 itens.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if n < 2:
+        return float("nan")
+    order = np.lexsort((y, x))
+    x, y = x[order], y[order]
+
+    total_pairs = n * (n - 1) // 2
+    x_ties = _tied_pairs(x)
+    y_ties = _tied_pairs(np.sort(y))
+    same_x = x[1:] == x[:-1]
+    joint = np.concatenate([[True], ~(same_x & (y[1:] == y[:-1])), [True]])
+    runs = np.diff(np.flatnonzero(joint))
+    joint_ties = int((runs * (runs - 1) // 2).sum())
+
+    _, y_rank = np.unique(y, return_inverse=True)
+    swaps = _count_inversions(y_rank.astype(np.int64))
+
+    denominator = (total_pairs - x_ties) * (total_pairs - y_ties)
+    if denominator == 0:
+        return float("nan")
+    return (total_pairs - x_ties - y_ties + joint_ties - 2 * swaps) / math.sqrt(denominator)
+
+
+def weight_grid(axes: Dict[str, Sequence[float]], base: Dict[str, float]) -> List[Dict[str, float]]:
+    """
+    Todos os vetores de pesos que combinam os valores de `axes` (relação ->
+    valores a testar); as demais relações mantêm o valor de `base`. A última
+    relação de `axes` varia mais rápido, então pontos vizinhos diferem em um peso.
+    """
+    relations = list(axes)
+    grid = []
+    for values in itertools.product(*(axes[rel] for rel in relations)):
+        weights = dict(base)
+        weights.update({rel: float(value) for rel, value in zip(relations, values)})
+        grid.append(weights)
+    return grid
+
+
+class WeightSweep:
+    """
+    Arestas distintas (u, v) com a contagem de interações de cada relação,
+    mais a força de saída/entrada de cada autor por relação.
+    """
+
+    def __init__(self, n: int, edges_by_relation: Dict[str, object]):
+        self.n = n
+        self.relations = list(edges_by_relation)
+        keys, relation_ids = [], []
+        for r, pairs in enumerate(edges_by_relation.values()):
+            arr = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+            arr = arr[arr[:, 0] != arr[:, 1]]
+            keys.append(arr[:, 0] * n + arr[:, 1])
+            relation_ids.append(np.full(len(arr), r, dtype=np.int64))
+        keys = np.concatenate(keys) if keys else np.zeros(0, dtype=np.int64)
+        relation_ids = np.concatenate(relation_ids) if relation_ids else np.zeros(0, dtype=np.int64)
+
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        num_relations = len(self.relations)
+        self.src, self.dst = (np.divmod(unique_keys, n) if n
+                              else (unique_keys, unique_keys))
+        self.counts = np.bincount(inverse * num_relations + relation_ids,
+                                  minlength=len(unique_keys) * num_relations
+                                  ).reshape(len(unique_keys), num_relations).astype(np.float64)
+        self.out_counts = np.zeros((n, num_relations))
+        self.in_counts = np.zeros((n, num_relations))
+        for r in range(num_relations):
+            self.out_counts[:, r] = np.bincount(self.src, weights=self.counts[:, r], minlength=n)
+            self.in_counts[:, r] = np.bincount(self.dst, weights=self.counts[:, r], minlength=n)
+
+    def vector(self, weights: Dict[str, float]) -> np.ndarray:
+        """Pesos na ordem de `relations` (relação ausente em `weights` pesa 1.0, como na agregação)."""
+        return np.array([float(weights.get(rel, 1.0)) for rel in self.relations])
+
+    def edge_weights(self, weights: Dict[str, float]) -> np.ndarray:
+        return self.counts @ self.vector(weights)
+
+    def degree(self, weights: Dict[str, float]) -> np.ndarray:
+        """Grau ponderado total (entrada + saída), como `degree_centrality(weighted=True)`."""
+        return (self.out_counts + self.in_counts) @ self.vector(weights)
+
+    def pagerank(self, weights: Dict[str, float], start: Optional[np.ndarray] = None, damping: float = 0.85,
+                 max_iter: int = 100, tol: float = 1.0e-6) -> Tuple[np.ndarray, int]:
+        """PageRank do grafo integrado com os pesos dados; retorna (rank, iterações)."""
+        vector = self.vector(weights)
+        return weighted_pagerank(self.n, self.src, self.dst, self.counts @ vector, start=start,
+                                 damping=damping, max_iter=max_iter, tol=tol,
+                                 out_strength=self.out_counts @ vector)
+
+
+def _top_k(scores: np.ndarray, k: int) -> List[Tuple[int, float]]:
+    """Os `k` maiores (autor, pontuação), empates pelo menor índice."""
+    order = np.lexsort((np.arange(len(scores)), -scores))[:k]
+    return [(int(u), float(scores[u])) for u in order]
+
+
+@cached_metric
+def sweep_weights(n: int, edges_by_relation: Dict[str, object], grid: List[Dict[str, float]],
+                  baseline: Dict[str, float], k: int = 10, damping: float = 0.85, max_iter: int = 100,
+                  tol: float = 1.0e-6) -> Dict[str, object]:
+    """
+    Avalia cada vetor de pesos de `grid` contra `baseline`.
+
+    Retorna dict com:
+      'baseline': {'pagerank_top', 'degree_top'} (listas de (autor, pontuação));
+      'points': uma entrada por ponto da grade com 'weights', 'pagerank_top',
+        'degree_top', 'pagerank_tau' e 'degree_tau' (τ-b contra a linha de base
+        sobre todos os autores), 'pagerank_overlap' e 'degree_overlap' (autores
+        em comum com o top-k da linha de base) e 'pagerank_iterations'.
+    """
+    sweep = WeightSweep(n, edges_by_relation)
+    base_rank, _ = sweep.pagerank(baseline, damping=damping, max_iter=max_iter, tol=tol)
+    base_degree = sweep.degree(baseline)
+    base_rank_top = _top_k(base_rank, k)
+    base_degree_top = _top_k(base_degree, k)
+    base_rank_set = {u for u, _ in base_rank_top}
+    base_degree_set = {u for u, _ in base_degree_top}
+
+    points = []
+    previous = base_rank
+    for weights in grid:
+        rank, iterations = sweep.pagerank(weights, start=previous, damping=damping, max_iter=max_iter, tol=tol)
+        degree = sweep.degree(weights)
+        rank_top = _top_k(rank, k)
+        degree_top = _top_k(degree, k)
+        points.append({
+            'weights': dict(weights),
+            'pagerank_top': rank_top,
+            'degree_top': degree_top,
+            'pagerank_tau': kendall_tau(base_rank, rank),
+            'degree_tau': kendall_tau(base_degree, degree),
+            'pagerank_overlap': len(base_rank_set & {u for u, _ in rank_top}),
+            'degree_overlap': len(base_degree_set & {u for u, _ in degree_top}),
+            'pagerank_iterations': iterations,
+        })
+        previous = rank
+    return {
+        'baseline': {'pagerank_top': base_rank_top, 'degree_top': base_degree_top},
+        'points': points,
+    }
+
+
+__all__ = [
+    "WeightSweep",
+    "kendall_tau",
+    "sweep_weights",
+    "weight_grid",
+]
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections import deque
 
 class AbstractGraph(ABC):
     """
@@ -117,6 +118,36 @@ class AbstractGraph(ABC):
         """Verifica se o grafo é conexo."""
         pass
 
+    def isStronglyConnected(self) -> bool:
+        """
+        Verifica se todo vértice alcança todos os outros (uma única componente
+        fortemente conexa): o vértice 0 precisa alcançar todos pelas arestas e ser
+        alcançado por todos pelas arestas invertidas (duas BFS, O(n + m)).
+        """
+        if self._num_vertices == 0:
+            return True
+        adj_out = self.getAsAdjacencyList()
+        adj_in = [[] for _ in range(self._num_vertices)]
+        for u, nbrs in enumerate(adj_out):
+            for v in nbrs:
+                adj_in[v].append(u)
+
+        for neighbors in (adj_out, adj_in):
+            visited = [False] * self._num_vertices
+            visited[0] = True
+            queue = deque([0])
+            nodes_visited_count = 0
+            while queue:
+                u = queue.popleft()
+                nodes_visited_count += 1
+                for v in neighbors[u]:
+                    if not visited[v]:
+                        visited[v] = True
+                        queue.append(v)
+            if nodes_visited_count != self._num_vertices:
+                return False
+        return True
+
     def isEmptyGraph(self) -> bool:
         """Verifica se o grafo está vazio (não tem arestas)."""
         return self.getEdgeCount() == 0
@@ -11,8 +11,8 @@ from src.services.shared_queries import fetch_authors_and_edges
 from src.services.adjacency_list_service import display_adjacency_lists_streamlit
 from src.services.adjacency_matrix_service import df_to_svg
 from src.utils.neo4j_connector import get_neo4j_service
-from src.utils.streamlit_helpers import draw_graph_api_sidebar
-from src.utils.streamlit_filters import visualization_filters
+from src.utils.streamlit_helpers import draw_graph_api_sidebar, recarregar_dados_neo4j
+from src.utils.streamlit_filters import ego_view_filter, ego_view_options, visualization_filters
 
 # ============== FUNÇÃO APP ==============
 def app():
@@ -57,8 +57,13 @@ def app():
     filter_with_edges = st.sidebar.checkbox("Mostrar apenas autores com interações", value=True, key=f"{PAGE_ID}_filter_edges")
     limit = st.sidebar.number_input("Limitar autores (0 = sem limite)", min_value=0, value=0, step=10, key=f"{PAGE_ID}_limit")
     st.session_state[f"{PAGE_ID}_current_author_limit"] = limit
+    k_core = st.sidebar.number_input(
+        "Mostrar apenas o k-core (0 = desativado)", min_value=0, value=0, step=1, key=f"{PAGE_ID}_k_core",
+        help="Mantém só autores com número de core >= k: o núcleo denso da rede, sem a periferia.")
+    core_mode = st.sidebar.selectbox("Grau do k-core", ("total", "in", "out"), key=f"{PAGE_ID}_core_mode")
     
-    current_filter_state = (filter_with_edges, limit)
+    ego_options = ego_view_options(PAGE_ID, st.session_state.get("full_idx_to_name_map"))
+    current_filter_state = (filter_with_edges, limit, k_core, core_mode, ego_options)
     
     # --- LÓGICA DE CONEXÃO ---
     try:
@@ -67,12 +72,14 @@ def app():
         st.error(f"Erro ao obter conexão com Neo4j: {e}")
         st.stop()
 
+    recarregar_dados_neo4j(get_neo4j_service, key=f"{PAGE_ID}_reload_data")
+
     if st.button("Gerar e Analisar Grafo"):
         with st.spinner("Buscando dados e construindo grafo..."):
             try:
                 # 1. Busca dados
                 idx_to_name_full, edges = fetch_authors_and_edges(
-                    neo4j_service, enabled_interaction_types={"REVIEW", "APPROVED", "MERGE"})
+                    neo4j_service, enabled_interaction_types={"REVIEW", "APPROVED", "MERGE"}, store=st.session_state)
                 
                 if not idx_to_name_full:
                     st.warning("Nenhum nó (:Author) encontrado no Neo4j.")
@@ -116,19 +123,27 @@ def app():
         if st.session_state.get(ACTIVE_GRAPH_KEY) is None or st.session_state.get(FILTER_STATE_KEY) != current_filter_state:
 
             # 1. Lógica de Filtro: Obtém a lista de índices ORIGINAIS a serem incluídos
-            indices_to_render_original = visualization_filters(
-                graph=full_graph, 
-                filter_with_edges=filter_with_edges, 
-                limit=limit, 
-                idx_to_name_full=idx_to_name_full
-            )
+            #    (na visão ego, o subgrafo já sai pronto da BFS limitada a partir do autor)
+            if ego_options is not None:
+                indices_to_render_original, active_graph = ego_view_filter(full_graph, idx_to_name_full, *ego_options)
+            else:
+                indices_to_render_original = visualization_filters(
+                    graph=full_graph, 
+                    filter_with_edges=filter_with_edges, 
+                    limit=limit, 
+                    idx_to_name_full=idx_to_name_full,
+                    k_core=int(k_core),
+                    core_mode=core_mode
+                )
+                active_graph = None
             
             # 2. Constrói o Grafo ATIVO/FILTRADO (apenas se houver vértices para renderizar)
             if indices_to_render_original:
-                active_graph = graph_service.build_filtered_graph(
-                    full_graph=full_graph, 
-                    indices_to_include=indices_to_render_original
-                )
+                if active_graph is None:
+                    active_graph = graph_service.build_filtered_graph(
+                        full_graph=full_graph, 
+                        indices_to_include=indices_to_render_original
+                    )
                 st.session_state[ACTIVE_GRAPH_KEY] = active_graph
                 
                 # 3. Cria o novo mapeamento (Novo Índice -> Nome)
@@ -168,6 +183,8 @@ def app():
                 
                 # highlight_vertex e highlight_edges devem usar os índices do grafo ATIVO (0..N-1)
                 highlight_vertex = st.session_state.get("new_vertices", set())
+                if ego_options is not None:
+                    highlight_vertex = highlight_vertex | {0}  # autor central da visão ego
 
                 graph_service.draw_graph(
                     graph, # Grafo ATIVO
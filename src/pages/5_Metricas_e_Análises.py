@@ -18,10 +18,13 @@ import src.services.graph_service as graph_service
 from src.core.AbstractGraph import AbstractGraph
 from src.core.AdjacencyListGraph import AdjacencyListGraph
 from src.utils.neo4j_connector import get_neo4j_service
+from src.utils.streamlit_helpers import recarregar_dados_neo4j
 
 import src.ui.centrality_ui as centrality_ui
 import src.ui.community_ui as community_ui
 import src.ui.structure_ui as structure_ui
+import src.ui.temporal_ui as temporal_ui
+import src.ui.diff_ui as diff_ui
 import src.ui.sidebar_metrics as sidebar_metrics_ui
 
 # Imports dos Módulos de Cálculo e Query
@@ -31,6 +34,12 @@ if 'community_metrics' not in st.session_state:
     st.session_state.community_metrics = importlib.import_module('src.analysis.community_metrics')
 if 'structure_metrics' not in st.session_state:
     st.session_state.structure_metrics = importlib.import_module('src.analysis.structure_metrics')
+if 'hyperanf' not in st.session_state:
+    st.session_state.hyperanf = importlib.import_module('src.analysis.hyperanf')
+if 'temporal_metrics' not in st.session_state:
+    st.session_state.temporal_metrics = importlib.import_module('src.analysis.temporal_metrics')
+if 'graph_diff' not in st.session_state:
+    st.session_state.graph_diff = importlib.import_module('src.analysis.graph_diff')
 if 'shared_queries' not in st.session_state:
     st.session_state.shared_queries = importlib.import_module('src.services.shared_queries')
 
@@ -121,6 +130,8 @@ def app():
     if st.sidebar.button("Calcular", key="sidebar_calculate_structure"):
         sidebar_metrics_ui.sidebar_metrics(analysis_mode=analysis_mode, get_neo4j_service=get_neo4j_service)
 
+    recarregar_dados_neo4j(get_neo4j_service, key="metrics_reload_data")
+
     # --------------------------------------------------------
     # === VERIFICAÇÃO DE PRÉ-REQUISITOS (BLOQUEIO) ===
     # --------------------------------------------------------
@@ -192,8 +203,8 @@ def app():
 
 
     # --- Abas para Centralidade, Comunidade e Estrutura ---
-    tab_structure, tab_centrality, tab_community = st.tabs(
-        ["Estrutura e Coesão", "Centralidade", "Comunidade"]
+    tab_structure, tab_centrality, tab_community, tab_temporal, tab_diff = st.tabs(
+        ["Estrutura e Coesão", "Centralidade", "Comunidade", "Evolução Temporal", "Diferenças"]
     )
 
     # ====================================================================
@@ -221,5 +232,17 @@ def app():
     with tab_community:
         community_ui.display_community_metrics(out_adj, names_map, graph_choice_name)
 
+    # ====================================================================
+    # === Aba 4: Evolução Temporal (janelas deslizantes) ===
+    # ====================================================================
+    with tab_temporal:
+        temporal_ui.display_temporal_metrics(get_neo4j_service)
+
+    # ====================================================================
+    # === Aba 5: Diferenças entre snapshots (o que mudou entre coletas) ===
+    # ====================================================================
+    with tab_diff:
+        diff_ui.display_graph_diff(loaded_graphs, loaded_names_maps)
+
 if __name__ == "__main__":
     app()
\ No newline at end of file
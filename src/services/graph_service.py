@@ -1,5 +1,6 @@
 import streamlit as st
 from src.core.AbstractGraph import AbstractGraph
+from src.analysis import centrality_metrics, ego_network, link_prediction, reachability, shortest_paths
 from typing import cast
 import matplotlib.pyplot as plt
 import math
@@ -30,6 +31,30 @@ def _get_graph_from_session() -> AbstractGraph:
     
     return graph
 
+GRAPH_INDEX_KEY = "active_graph_indexes"
+
+def _session_index(key: tuple, build):
+    """
+    Índice derivado do grafo ativo (ex.: caminhos mínimos), guardado na sessão ao
+    lado do grafo: `build(lista_de_adjacência)` roda uma vez por grafo e as
+    consultas seguintes reaproveitam o objeto em memória, sem remontar a lista de
+    adjacência, recalcular a impressão digital nem ler o cache em disco.
+    Um grafo ativo novo (filtros alterados) ou uma modificação pela sidebar
+    descarta os índices guardados.
+    """
+    graph = _get_graph_from_session()
+    entry = st.session_state.get(GRAPH_INDEX_KEY)
+    if entry is None or entry["graph"] is not graph:
+        entry = {"graph": graph, "indexes": {}}
+        st.session_state[GRAPH_INDEX_KEY] = entry
+    if key not in entry["indexes"]:
+        entry["indexes"][key] = build(graph.getAsAdjacencyList())
+    return entry["indexes"][key]
+
+def _invalidate_indexes() -> None:
+    """Descarta os índices do grafo ativo (chamado após modificar o grafo)."""
+    st.session_state.pop(GRAPH_INDEX_KEY, None)
+
 def get_vertex_count() -> int:
     """Retorna o número de vértices no grafo."""
     graph = _get_graph_from_session()
@@ -57,6 +82,7 @@ def add_edge(u: int, v: int, weight: float = 1.0) -> bool:
         return False
 
     graph.addEdge(u, v, weight)
+    _invalidate_indexes()
 
     # Marca a aresta como recém-adicionada
     if "new_edges" not in st.session_state:
@@ -72,6 +98,7 @@ def remove_edge(u: int, v: int) -> None:
     """Remove a aresta (u, v)."""
     graph = _get_graph_from_session()
     graph.removeEdge(u, v)
+    _invalidate_indexes()
     # Nota: Isso modifica o grafo no state.
 
 def add_vertex() -> int:
@@ -79,6 +106,7 @@ def add_vertex() -> int:
 
     # Chama o método real da classe do grafo
     new_index = graph.addVertex()
+    _invalidate_indexes()
 
     # Atualiza o state com o grafo modificado
     st.session_state.graph_obj = graph
@@ -138,6 +166,7 @@ def set_edge_weight(u: int, v: int, weight: float) -> None:
     """Define o peso da aresta (u, v)."""
     graph = _get_graph_from_session()
     graph.setEdgeWeight(u, v, weight)
+    _invalidate_indexes()
 
 def get_edge_weight(u: int, v: int) -> float:
     """Retorna o peso da aresta (u, v)."""
@@ -149,6 +178,19 @@ def is_connected() -> bool:
     graph = _get_graph_from_session()
     return graph.isConnected()
 
+def is_strongly_connected() -> bool:
+    """Verifica se o grafo é fortemente conexo."""
+    graph = _get_graph_from_session()
+    return graph.isStronglyConnected()
+
+def can_reach(u: int, v: int) -> bool:
+    """Verifica se existe caminho dirigido de u até v (índice de alcançabilidade, mantido na sessão)."""
+    return _session_index(("reachability",), reachability.build_reachability_index).can_reach(u, v)
+
+def get_influence_size(v: int) -> int:
+    """Número de vértices alcançáveis a partir de v (conjunto de influência)."""
+    return _session_index(("reachability",), reachability.build_reachability_index).influence_size(v)
+
 def is_empty() -> bool:
     """Verifica se o grafo está vazio (sem arestas)."""
     graph = _get_graph_from_session()
@@ -174,6 +216,57 @@ def get_adjacency_matrix() -> list[list[float]]:
     graph = _get_graph_from_session()
     return graph.getAsAdjacencyMatrix()
 
+def find_shortest_path(u: int, v: int, weighted: bool = True, num_landmarks: int = 0) -> tuple[float, list[int], int]:
+    """
+    Caminho mínimo de u até v no grafo ativo: (custo, caminho, nós_fixados).
+    Ponderado usa custo = 1/peso; num_landmarks > 0 ativa o índice ALT, que
+    é pré-calculado uma vez por grafo ativo e mantido na sessão.
+    """
+    index = _session_index(("shortest_paths", weighted, num_landmarks),
+                           lambda adj: shortest_paths.build_shortest_path_index(adj, weighted, num_landmarks))
+    return index.query(u, v)
+
+def find_similar_vertices(v: int, k: int = 10, method: str = "adamic_adar", exclude_neighbors: bool = False,
+                          approximate: bool = False) -> list[tuple[int, float]]:
+    """
+    Os k vértices mais similares a v no grafo ativo: [(vértice, pontuação)].
+    approximate=True usa o índice MinHash-LSH (Jaccard estimado), indicado para grafos muito grandes.
+    """
+    if approximate:
+        index = _session_index(("minhash",), link_prediction.build_minhash_index)
+        return index.top_k(v, k, exclude_neighbors)
+    index = _session_index(("similarity",), link_prediction.build_similarity_index)
+    return index.top_k(v, k, method, exclude_neighbors)
+
+DEPARTURE_CENTRALITIES = ("degree", "pagerank", "betweenness", "harmonic")
+
+def simulate_departures(k: int = 10, centrality: str = "degree") -> dict:
+    """
+    Curva de "bus factor" do grafo ativo: remove os k vértices mais centrais
+    (pela centralidade escolhida), um a um, e devolve o dict de
+    `reachability.departure_resilience` (maior componente fraca e número de
+    componentes após cada remoção, mais a ordem de remoção).
+    """
+    if centrality not in DEPARTURE_CENTRALITIES:
+        raise ValueError(f"Centralidade desconhecida: {centrality!r} (use uma de {DEPARTURE_CENTRALITIES})")
+    graph = _get_graph_from_session()
+    adj_list = graph.getAsAdjacencyList()
+    out_adj = [[(v, float(w)) for v, w in nbrs.items()] for nbrs in adj_list]
+    if centrality == "degree":
+        in_adj = [[] for _ in adj_list]
+        for u, nbrs in enumerate(out_adj):
+            for v, w in nbrs:
+                in_adj[v].append((u, w))
+        scores = centrality_metrics.degree_centrality(out_adj, in_adj, weighted=True, mode="total")
+    elif centrality == "pagerank":
+        scores = centrality_metrics.pagerank(out_adj)
+    elif centrality == "betweenness":
+        scores = centrality_metrics.betweenness_centrality_weighted(out_adj)
+    else:
+        scores = centrality_metrics.harmonic_centrality(out_adj)
+    order = sorted(scores, key=lambda u: (-scores[u], u))[:k]
+    return reachability.departure_resilience(adj_list, order)
+
 def draw_graph(graph: AbstractGraph, idx_to_name: dict, indices_to_render: list, highlight_vertex=None, highlight_edges=None):    
 
     if highlight_edges is None:
@@ -299,7 +392,8 @@ def draw_graph(graph: AbstractGraph, idx_to_name: dict, indices_to_render: list,
                 )
 
     # Nós
-    highlight_vertex = st.session_state.get("new_vertices", set()) 
+    if highlight_vertex is None:
+        highlight_vertex = st.session_state.get("new_vertices", set())
 
     for i in subgraph_indices:
         x, y = positions[i]
@@ -366,4 +460,19 @@ def build_filtered_graph(full_graph: AbstractGraph, indices_to_include: list[int
                 # Adiciona a aresta ao novo subgrafo
                 subgraph.addEdge(u_new, v_new, weight)
                 
-    return subgraph
\ No newline at end of file
+    return subgraph
+
+def build_ego_graph(full_graph: AbstractGraph, center: int, hops: int = 1, max_nodes: int = 50,
+                    min_weight: float = 0.0) -> tuple[AbstractGraph, list[int]]:
+    """
+    Constrói o subgrafo da rede ego de `center` (ver `ego_network.ego_graph`),
+    com a mesma implementação do full_graph.
+
+    Retorna (subgrafo, índices originais): o vértice i do subgrafo é o índice
+    original na posição i da lista, com o centro no índice 0.
+    """
+    indices, edges = ego_network.ego_graph(full_graph, center, hops=hops, max_nodes=max_nodes,
+                                           min_weight=min_weight)
+    old_to_new_idx = {old_idx: new_idx for new_idx, old_idx in enumerate(indices)}
+    new_edges = [(old_to_new_idx[u], old_to_new_idx[v], w) for u, v, w in edges]
+    return build_graph(type(full_graph), len(indices), new_edges), indices
@@ -1,5 +1,10 @@
 from collections import defaultdict
-from typing import Dict, List, Tuple, Set
+from datetime import datetime, timezone
+from typing import Dict, List, MutableMapping, Optional, Tuple, Set
+
+import numpy as np
+
+from src.analysis.sparse_graph import aggregate_edges
 
 LABEL_AUTHOR = "Author"
 LABEL_ISSUE = "Issue"
@@ -77,21 +82,235 @@ RETURN id(src) AS srcId, id(dst) AS dstId
 """
 
 
-def fetch_authors_and_edges(neo4j_service, enabled_interaction_types: Set[str]) -> tuple[dict[int, str], list[tuple[int, int, float]]]:
+# --- Modelo bipartido autor -> artefato (Issue/PR) ---
+# Cada papel é carregado uma única vez em bloco, já agregado por (autor, artefato, dia do
+# evento); as relações entre autores são projeções locais desse modelo (ver RELATION_PROJECTIONS).
+# O dia vem do próprio evento (comentário, review, merge, fechamento); APPROVED não tem data
+# no banco e issues não guardam closedAt, então esses casos ficam sem dia (ver timed_edges).
+
+ROLES = ("created", "commented", "reviewed", "approved", "merged", "closed")
+
+ARTIFACTS_QUERY = f"""
+MATCH (t)
+WHERE t:{LABEL_ISSUE} OR t:{LABEL_PR}
+RETURN id(t) AS id, t:{LABEL_ISSUE} AS isIssue, t.createdAt AS createdAt
+"""
+
+ROLE_QUERIES = {
+    "created": f"""
+MATCH (a:{LABEL_AUTHOR})-[:{REL_CREATED}|OPENED]->(t)
+WHERE t:{LABEL_ISSUE} OR t:{LABEL_PR}
+RETURN id(a) AS authorId, id(t) AS artifactId, left(toString(t.createdAt), 10) AS day, count(*) AS n
+""",
+    "commented": f"""
+MATCH (a:{LABEL_AUTHOR})-[:{REL_AUTHORED_COMMENT}|COMMENTED]->(c:{LABEL_COMMENT})<-[:{REL_COMMENT_ON}|ON]-(t)
+WHERE t:{LABEL_ISSUE} OR t:{LABEL_PR}
+RETURN id(a) AS authorId, id(t) AS artifactId, left(toString(c.createdAt), 10) AS day, count(c) AS n
+""",
+    "reviewed": f"""
+MATCH (a:{LABEL_AUTHOR})-[:{REL_PERFORMED_REVIEW}]->(r:{LABEL_REVIEW})<-[:{REL_HAS_REVIEW}]-(t:{LABEL_PR})
+RETURN id(a) AS authorId, id(t) AS artifactId, left(toString(r.submittedAt), 10) AS day, count(r) AS n
+""",
+    "approved": f"""
+MATCH (a:{LABEL_AUTHOR})-[:{REL_APPROVED}]->(t:{LABEL_PR})
+RETURN id(a) AS authorId, id(t) AS artifactId, null AS day, count(*) AS n
+""",
+    "merged": f"""
+MATCH (a:{LABEL_AUTHOR})-[:{REL_MERGED}]->(t:{LABEL_PR})
+RETURN id(a) AS authorId, id(t) AS artifactId, left(toString(t.mergedAt), 10) AS day, count(*) AS n
+""",
+    "closed": f"""
+MATCH (a:{LABEL_AUTHOR})-[:{REL_CLOSED}]->(t:{LABEL_ISSUE})
+RETURN id(a) AS authorId, id(t) AS artifactId, left(toString(t.closedAt), 10) AS day, count(*) AS n
+""",
+}
+
+# relação -> (papel da origem, papel do destino, apenas issues?)
+RELATION_PROJECTIONS = {
+    "COMMENT_PR_ISSUE": ("commented", "created", False),
+    "OPENED_ISSUE_COMMENTED": ("commented", "created", True),
+    "REVIEW": ("reviewed", "created", False),
+    "APPROVED": ("approved", "created", False),
+    "MERGE": ("merged", "created", False),
+    "ISSUE_CLOSED": ("closed", "created", False),
+}
+
+
+def _parse_timestamp(value) -> float:
+    """Data (texto ISO 8601 do GitHub, dia AAAA-MM-DD ou DateTime do Neo4j) em segundos desde a época; nan se ausente."""
+    if value is None:
+        return float("nan")
+    if hasattr(value, "to_native"):
+        value = value.to_native()
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return float("nan")
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    return float("nan")
+
+
+class AuthorArtifactModel:
+    """
+    Grafo bipartido autor -> artefato em memória: para cada papel, vetores
+    alinhados (autor, artefato, multiplicidade, instante), onde a multiplicidade
+    conta, por exemplo, quantos comentários o autor fez naquele artefato naquele
+    dia e o instante é o início desse dia (segundos desde a época, nan se o
+    evento não tem data).
+
+    A relação "src comentou/revisou/... um artefato criado por dst" é a
+    projeção P = S · Cᵀ (S = papel da origem, C = criadores), calculada por
+    junção ordenada no índice do artefato; o número de interações do par
+    (src, dst) num artefato é mult_src * mult_dst, igual ao número de linhas
+    que a consulta Cypher multi-salto equivalente devolveria (somando os dias).
+
+    `artifact_time` guarda o createdAt de cada artefato (segundos desde a época,
+    nan se ausente); em séries temporais só é usado quando o evento não tem data.
+    """
+
+    def __init__(self, idx_to_name: Dict[int, str], artifact_is_issue: np.ndarray,
+                 incidences: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]],
+                 artifact_time: Optional[np.ndarray] = None):
+        self.idx_to_name = idx_to_name
+        self.num_authors = len(idx_to_name)
+        self.artifact_is_issue = np.asarray(artifact_is_issue, dtype=bool)
+        if artifact_time is None:
+            artifact_time = np.full(len(self.artifact_is_issue), np.nan)
+        self.artifact_time = np.asarray(artifact_time, dtype=np.float64)
+        self.incidences = incidences
+
+    @classmethod
+    def from_neo4j(cls, neo4j_service) -> "AuthorArtifactModel":
+        """Carrega autores, artefatos e os papéis (uma consulta agregada por papel)."""
+        id_to_index, idx_to_name = fetch_authors(neo4j_service)
+        artifact_rows = neo4j_service.query(ARTIFACTS_QUERY)
+        artifact_index = {row["id"]: i for i, row in enumerate(artifact_rows)}
+        artifact_is_issue = np.array([bool(row["isIssue"]) for row in artifact_rows], dtype=bool)
+        artifact_time = np.array([_parse_timestamp(row.get("createdAt")) for row in artifact_rows], dtype=np.float64)
+
+        incidences = {}
+        for role, query in ROLE_QUERIES.items():
+            rows = [row for row in neo4j_service.query(query)
+                    if row["authorId"] in id_to_index and row["artifactId"] in artifact_index]
+            incidences[role] = (
+                np.array([id_to_index[row["authorId"]] for row in rows], dtype=np.int64),
+                np.array([artifact_index[row["artifactId"]] for row in rows], dtype=np.int64),
+                np.array([row["n"] for row in rows], dtype=np.int64),
+                np.array([_parse_timestamp(row.get("day")) for row in rows], dtype=np.float64),
+            )
+        return cls(idx_to_name, artifact_is_issue, incidences, artifact_time)
+
+    def _join(self, src_role: str, dst_role: str,
+              issues_only: bool = False) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Junção dos papéis no índice do artefato: vetores alinhados
+        (src, dst, artefato, multiplicidade, instante), um elemento por
+        (src, dst, artefato, dia do evento de src) com src != dst. O instante é
+        o do evento da origem (o comentário, a review...), que é a interação.
+        """
+        src_author, src_artifact, src_mult, src_time = self.incidences[src_role]
+        dst_author, dst_artifact, dst_mult, _ = self.incidences[dst_role]
+        if issues_only:
+            keep = self.artifact_is_issue[src_artifact]
+            src_author, src_artifact, src_mult, src_time = (
+                src_author[keep], src_artifact[keep], src_mult[keep], src_time[keep])
+
+        order = np.argsort(dst_artifact, kind="stable")
+        dst_author, dst_artifact, dst_mult = dst_author[order], dst_artifact[order], dst_mult[order]
+        lo = np.searchsorted(dst_artifact, src_artifact, side="left")
+        lengths = np.searchsorted(dst_artifact, src_artifact, side="right") - lo
+        total = int(lengths.sum())
+        pos = np.repeat(lo - lengths.cumsum() + lengths, lengths) + np.arange(total)
+
+        src = np.repeat(src_author, lengths)
+        dst = dst_author[pos]
+        artifact = np.repeat(src_artifact, lengths)
+        mult = np.repeat(src_mult, lengths) * dst_mult[pos]
+        time = np.repeat(src_time, lengths)
+        keep = src != dst
+        return src[keep], dst[keep], artifact[keep], mult[keep], time[keep]
+
+    def project(self, src_role: str, dst_role: str, issues_only: bool = False) -> np.ndarray:
+        """
+        Pares (src, dst) de autores distintos ligados por um artefato em que src
+        tem o papel `src_role` e dst o papel `dst_role`: matriz (k, 2) com uma
+        linha por interação (pares repetidos conforme a multiplicidade).
+        """
+        src, dst, _, mult, _ = self._join(src_role, dst_role, issues_only)
+        return np.repeat(np.column_stack([src, dst]), mult, axis=0)
+
+    def relation_edges(self, relation: str) -> np.ndarray:
+        """Arestas (u, v) de uma relação de `RELATION_PROJECTIONS`, uma por interação."""
+        return self.project(*RELATION_PROJECTIONS[relation])
+
+    def timed_edges(self, relations, weights: Optional[Dict[str, float]] = None
+                    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Interações datadas das relações pedidas: vetores alinhados
+        (src, dst, peso, instante), um elemento por (src, dst, artefato, dia). O
+        peso é weights[relação] * multiplicidade e o instante é o dia do evento
+        (comentário, review, merge, fechamento); eventos sem data (aprovações,
+        fechamento de issues) caem para o createdAt do artefato.
+        """
+        weights = WEIGHTS if weights is None else weights
+        parts = []
+        for rel in relations:
+            src, dst, artifact, mult, time = self._join(*RELATION_PROJECTIONS[rel])
+            time = np.where(np.isnan(time), self.artifact_time[artifact], time)
+            parts.append((src, dst, float(weights.get(rel, 1.0)) * mult, time))
+        if not parts:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty, np.zeros(0), np.zeros(0)
+        return tuple(np.concatenate(column) for column in zip(*parts))
+
+
+MODEL_SESSION_KEY = "author_artifact_model"
+
+
+def get_author_artifact_model(neo4j_service, refresh: bool = False,
+                              store: Optional[MutableMapping] = None) -> AuthorArtifactModel:
+    """
+    Modelo bipartido carregado do Neo4j.
+
+    Com `store` (um mapeamento como `st.session_state`), o modelo fica guardado
+    nele e só volta ao banco com refresh=True (ex.: após uma nova coleta); sem
+    `store`, cada chamada consulta o banco.
+    """
+    if store is None:
+        return AuthorArtifactModel.from_neo4j(neo4j_service)
+    if refresh or store.get(MODEL_SESSION_KEY) is None:
+        store[MODEL_SESSION_KEY] = AuthorArtifactModel.from_neo4j(neo4j_service)
+    return store[MODEL_SESSION_KEY]
+
+
+def fetch_authors_and_edges(neo4j_service, enabled_interaction_types: Set[str],
+                            weights: Optional[Dict[str, float]] = None, store: Optional[MutableMapping] = None,
+                            refresh: bool = False) -> tuple[dict[int, str], list[tuple[int, int, float]]]:
     """
     Função principal para buscar autores e arestas, com configuração dos tipos de interação.
+
+    Os dados vêm do modelo bipartido (`get_author_artifact_model`): com `store`, só a
+    primeira chamada (ou uma com refresh=True) consulta o Neo4j, e trocar os tipos
+    habilitados ou os pesos (`weights`, padrão WEIGHTS) apenas recalcula as projeções
+    localmente.
     """
-    print("Buscando todos os autores...")
-    id_to_index, idx_to_name = fetch_authors(neo4j_service)
-    if not id_to_index:
+    model = get_author_artifact_model(neo4j_service, refresh=refresh, store=store)
+    idx_to_name = model.idx_to_name
+    if not idx_to_name:
         print("Nenhum autor encontrado no Neo4j.")
         return {}, []
     print(f"Encontrados {len(idx_to_name)} autores.") 
 
-    # Busca as arestas, considerando APENAS os tipos de interação habilitados
-    edges_by_relation = fetch_edges_by_relation(neo4j_service, id_to_index, enabled_interaction_types)
+    # Projeta as arestas, considerando APENAS os tipos de interação habilitados
+    edges_by_relation = {rel: model.relation_edges(rel) for rel in RELATION_PROJECTIONS
+                         if rel in enabled_interaction_types}
 
-    filtered_weights = {k: v for k, v in WEIGHTS.items() if k in enabled_interaction_types}
+    weights = WEIGHTS if weights is None else weights
+    filtered_weights = {k: v for k, v in weights.items() if k in enabled_interaction_types}
 
     # Constrói as arestas integradas com os pesos filtrados
     edges = build_integrated_edges(edges_by_relation, filtered_weights)
@@ -186,13 +405,7 @@ def build_integrated_edges(edges_by_relation: Dict[str, List[Tuple[int, int]]],
                            weights: Dict[str, float]) -> List[Tuple[int, int, float]]:
     """Agrega arestas por par (u,v) somando pesos conforme o mapeamento weights.
 
-    Retorna lista de (u_index, v_index, total_weight).
+    Retorna lista de (u_index, v_index, total_weight), ordenada por (u, v); laços (u == v) são descartados.
     """
-    agg = defaultdict(float)
-    for rel, pairs in edges_by_relation.items():
-        w = float(weights.get(rel, 1))
-        for u, v in pairs:
-            if u == v:
-                continue
-            agg[(u, v)] += w
-    return [(u, v, total) for (u, v), total in agg.items()]
+    src, dst, totals = aggregate_edges(edges_by_relation, weights, default_weight=1.0, drop_self_loops=True)
+    return list(zip(src.tolist(), dst.tolist(), totals.tolist()))
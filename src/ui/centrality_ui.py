@@ -18,13 +18,13 @@ def display_centrality_metrics(out_adj: List[List[Tuple[int, float]]], in_adj: L
     with st.form("centrality_metrics_form"):
         metric_choice = st.selectbox(
             "Escolha a métrica:",
-            ("Degree (weighted)", "Betweenness (weighted)", "PageRank", "Eigenvector Centrality"),
+            ("Degree (weighted)", "Betweenness (weighted)", "Closeness", "Harmonic", "PageRank", "Eigenvector Centrality", "Core Number (k-core)", "Influence Reach (HyperANF)"),
             key="centrality_choice"
         )
 
         col_top, col_mode = st.columns([1, 2])
         top_n = col_top.number_input("Top N (0 = todos)", min_value=0, value=10, step=1)
-        degree_mode = col_mode.selectbox("Modo (Degree)", ("total", "out", "in"))
+        degree_mode = col_mode.selectbox("Modo (Degree / k-core)", ("total", "out", "in"))
 
         st.markdown("---")
         st.subheader("Configurações Avançadas:")
@@ -32,6 +32,7 @@ def display_centrality_metrics(out_adj: List[List[Tuple[int, float]]], in_adj: L
         damping = col_pr.slider("Damping (PageRank)", min_value=0.0, max_value=1.0, value=0.85)
         pr_iters = col_pr.number_input("Iterações (PageRank)", min_value=10, value=100, step=10)
         eig_iters = col_eig.number_input("Iterações (Eigenvector)", min_value=10, value=100, step=10)
+        reach_hops = col_eig.number_input("Saltos (Influence Reach)", min_value=1, value=2, step=1)
 
         submitted_centrality = st.form_submit_button("Calcular Centralidade")
 
@@ -50,12 +51,40 @@ def display_centrality_metrics(out_adj: List[List[Tuple[int, float]]], in_adj: L
                 elif metric_choice == "Betweenness (weighted)":
                     scores = st.session_state.centrality_metrics.betweenness_centrality_weighted(out_adj)
                     expl = "Betweenness: contribuição em caminhos mínimos ponderados."
+                elif metric_choice == "Closeness":
+                    # Com Top N > 0 usamos a versão top-k, que interrompe as BFS sem chance de entrar no ranking
+                    if top_n > 0:
+                        scores = st.session_state.centrality_metrics.top_k_closeness(out_adj, k=int(top_n))
+                    else:
+                        scores = st.session_state.centrality_metrics.closeness_centrality(out_adj)
+                    expl = "Closeness: nós alcançáveis divididos pela soma das distâncias (BFS não-ponderada)."
+                elif metric_choice == "Harmonic":
+                    if top_n > 0:
+                        scores = st.session_state.centrality_metrics.top_k_harmonic(out_adj, k=int(top_n))
+                    else:
+                        scores = st.session_state.centrality_metrics.harmonic_centrality(out_adj)
+                    expl = "Harmonic: soma de 1/distância para os nós alcançáveis (BFS não-ponderada)."
                 elif metric_choice == "PageRank":
-                    scores = st.session_state.centrality_metrics.pagerank(out_adj, damping=damping, max_iter=pr_iters)
+                    if top_n > 0:
+                        scores = st.session_state.centrality_metrics.top_k_pagerank(out_adj, k=int(top_n), damping=damping, max_iter=int(pr_iters))
+                    else:
+                        scores = st.session_state.centrality_metrics.pagerank(out_adj, damping=damping, max_iter=pr_iters)
                     expl = "PageRank: importância distribuída via arestas ponderadas (iteração de potência)."
                 elif metric_choice == "Eigenvector Centrality":
                     scores = st.session_state.centrality_metrics.eigenvector_centrality(out_adj, in_adj, max_iter=int(eig_iters))
                     expl = "Eigenvector: influência considerando a importância dos vizinhos (autovetor)."
+                elif metric_choice == "Core Number (k-core)":
+                    cores = st.session_state.structure_metrics.calculate_core_numbers(out_adj, mode=degree_mode)
+                    scores = dict(enumerate(cores))
+                    expl = "Core Number: maior k tal que o autor pertence ao k-core (grau do modo selecionado, Batagelj-Zaversnik)."
+                elif metric_choice == "Influence Reach (HyperANF)":
+                    hyperanf = st.session_state.hyperanf
+                    # uma execução (e uma consulta ao cache) serve ao alcance e ao diâmetro efetivo
+                    anf = hyperanf.hyperanf(out_adj)
+                    scores = hyperanf.reach_at(anf, int(reach_hops))
+                    eff_diam = hyperanf.effective_diameter(anf['neighbourhood_function'])
+                    expl = (f"Influence Reach: estimativa (HyperLogLog) de quantos autores são alcançáveis em até "
+                            f"{int(reach_hops)} saltos. Diâmetro efetivo (90% dos pares alcançáveis): {eff_diam:.2f}.")
 
                 items = sorted(scores.items(), key=lambda it: it[1], reverse=True)
                 if top_n > 0:
@@ -10,85 +10,159 @@ import plotly.express as px # Importa Plotly para gráficos interativos
 # (ou acessível via st.session_state como no seu código original)
 from src.analysis import community_metrics 
 
+def _brokerage_df(out_adj: List[List[Tuple[int, float]]], names_map: Dict[int, str]) -> pd.DataFrame:
+    """Tabela de buracos estruturais (Burt) por autor, dos maiores corretores (menor constraint) para os menores."""
+    holes = st.session_state.community_metrics.structural_holes(out_adj)
+    df = pd.DataFrame({
+        'Autor': [names_map.get(i, str(i)) for i in range(len(holes['constraint']))],
+        'Constraint': holes['constraint'],
+        'Tamanho Efetivo': holes['effective_size'],
+        'Eficiência': holes['efficiency'],
+    }).dropna()
+    return df.sort_values(by=['Constraint', 'Tamanho Efetivo'], ascending=[True, False]).reset_index(drop=True)
+
 def display_community_metrics(out_adj: List[List[Tuple[int, float]]], names_map: Dict[int, str], graph_choice_name: str):
     """
     Desenha o formulário de Comunidade, calcula a métrica escolhida 
     e exibe os resultados com visualizações aprimoradas.
     """
-    st.header("Cálculo de Comunidade (Girvan-Newman & Bridging Ties)")
+    st.header("Cálculo de Comunidade (Girvan-Newman, Louvain & Bridging Ties)")
 
     with st.form("community_metrics_form_page"):
         col_split, col_metric = st.columns(2)
         max_splits = col_split.number_input("Max Divisões (G-N)", min_value=1, value=5, step=1, key="page_comm_max_splits")
+        sample_sources = col_split.number_input(
+            "Fontes amostradas por componente (0 = exato)", min_value=0, value=0, step=50, key="page_comm_sample_sources",
+            help="Modo aproximado: estima a betweenness de aresta a partir de uma amostra de fontes em cada componente."
+        )
 
         comm_metric_choice = col_metric.selectbox(
             "Escolha a métrica:",
-            ("Community Detection (Girvan-Newman)", "Bridging Ties"),
+            ("Community Detection", "Bridging Ties", "Structural Bridges (linear)"),
             key="page_comm_choice"
         )
+        algorithm_choice = col_metric.selectbox(
+            "Algoritmo de comunidades:",
+            ("Girvan-Newman", "Louvain (Modularidade)"),
+            key="page_comm_algorithm",
+            help="Louvain otimiza a modularidade em tempo quase linear; Girvan-Newman é O(m²n)."
+        )
+        col_weighted, col_directed = col_metric.columns(2)
+        use_weights = col_weighted.checkbox("Ponderado", value=True, key="page_comm_weighted")
+        use_direction = col_directed.checkbox("Dirigido", value=False, key="page_comm_directed")
         
         submitted_community = st.form_submit_button("Calcular Comunidade")
         
     if submitted_community:
         with st.spinner(f"Calculando {comm_metric_choice} para {graph_choice_name}..."):
             try:
-                # O cálculo G-N é necessário para ambas as métricas
-                # Mantendo o acesso via st.session_state.community_metrics conforme seu código original
-                communities = st.session_state.community_metrics.girvan_newman_community_detection(out_adj, max_splits=int(max_splits))
-                
-                if comm_metric_choice == "Community Detection (Girvan-Newman)":
-                    expl = f"Comunidades encontradas após {len(communities)} partições (máximo {max_splits} remoções de arestas)."
-                    
-                    data = []
-                    for i, community in enumerate(communities):
-                        community_members = [names_map.get(node_idx, str(node_idx)) for node_idx in community]
-                        data.append({
-                            'Comunidade ID': i + 1,
-                            'Tamanho': len(community),
-                            'Membros': "<br>".join(community_members), # <-- MODIFICADO: Usa <br> para quebras de linha no hover
-                            'Membros_Lista': community_members # Lista para exibição detalhada no expander
-                        })
-                    
-                    df = pd.DataFrame(data)
-                    # <-- MODIFICADO: Ordena as comunidades por tamanho antes de armazenar
-                    df = df.sort_values(by='Tamanho', ascending=False).reset_index(drop=True)
-                    # Convert 'Comunidade ID' para string para garantir tratamento categórico no Plotly
-                    df['Comunidade ID'] = df['Comunidade ID'].astype(str)
+                if comm_metric_choice == "Structural Bridges (linear)":
+                    # Pontes e pontos de articulação em O(n + m), sem detecção de comunidades
+                    structure = st.session_state.community_metrics.biconnected_structure(out_adj)
+                    ties = st.session_state.community_metrics.find_structural_bridging_ties(out_adj)
+                    expl = (f"{len(structure['bridges'])} ponte(s) e {len(structure['articulation_points'])} ponto(s) de articulação "
+                            f"na visão não-direcionada: remover uma ponte ou um desses autores desconecta a rede.")
+
+                    if ties:
+                        df = pd.DataFrame([{'Origem': names_map.get(u, str(u)), 'Destino': names_map.get(v, str(v)), 'Peso': float(w)}
+                                           for u, v, w in ties]).sort_values(by='Peso', ascending=False).reset_index(drop=True)
+                    else:
+                        df = pd.DataFrame(columns=['Origem', 'Destino', 'Peso'])
+
+                    impact = structure['articulation_impact']
+                    articulation_df = pd.DataFrame([
+                        {'Autor': names_map.get(v, str(v)), 'Partes sem o autor': parts, 'Autores desligados': detached}
+                        for v, (parts, detached) in impact.items()
+                    ], columns=['Autor', 'Partes sem o autor', 'Autores desligados'])
+                    articulation_df = articulation_df.sort_values(by='Autores desligados', ascending=False).reset_index(drop=True)
 
                     st.session_state.community_results = {
                         'metric': comm_metric_choice,
                         'expl': expl,
                         'df': df,
-                        'is_bridge': False,
-                        'num_comm': len(communities)
+                        'is_bridge': True,
+                        'num_comm': len(structure['biconnected_components']),
+                        'modularity': None,
+                        'articulation_df': articulation_df,
+                        'brokerage_df': _brokerage_df(out_adj, names_map)
                     }
-
-                elif comm_metric_choice == "Bridging Ties":
+                else:
+                    # A detecção de comunidades é necessária para ambas as métricas
                     # Mantendo o acesso via st.session_state.community_metrics conforme seu código original
-                    bridging_ties = st.session_state.community_metrics.find_bridging_ties(out_adj, communities)
-                    expl = f"Arestas de ponte que conectam as {len(communities)} comunidades encontradas."
+                    modularity_levels = None
+                    if algorithm_choice == "Girvan-Newman":
+                        # O dendrograma fica em cache por grafo: outro "Max Divisões" ou a aba
+                        # Bridging Ties reaproveitam as remoções já calculadas
+                        dendrogram = st.session_state.community_metrics.girvan_newman_dendrogram(out_adj, max_splits=int(max_splits), sample_sources=int(sample_sources))
+                        communities = dendrogram.communities_at(int(max_splits))
+                        algorithm_expl = f"após {len(communities)} partições (máximo {max_splits} remoções de arestas)"
+                        levels = dendrogram.modularity_by_level(out_adj, num_removals=int(max_splits), weighted=use_weights, directed=use_direction)
+                        modularity_levels = pd.DataFrame(levels, columns=['Arestas Removidas', 'Comunidades', 'Modularidade (Q)'])
+                    else:
+                        communities = st.session_state.community_metrics.louvain_community_detection(out_adj, weighted=use_weights, directed=use_direction)
+                        algorithm_expl = "pela otimização de modularidade (Louvain)"
+
+                    # Modularidade calculada com as mesmas opções para os dois algoritmos, para permitir comparação
+                    modularity = st.session_state.community_metrics.modularity(out_adj, communities, weighted=use_weights, directed=use_direction)
+
+                    if comm_metric_choice == "Community Detection":
+                        expl = f"{len(communities)} comunidades encontradas {algorithm_expl}."
                     
-                    data = []
-                    for u, v, w in bridging_ties:
-                        data.append({
-                            'Origem': names_map.get(u, str(u)),
-                            'Destino': names_map.get(v, str(v)),
-                            'Peso': float(w)
-                        })
+                        data = []
+                        for i, community in enumerate(communities):
+                            community_members = [names_map.get(node_idx, str(node_idx)) for node_idx in community]
+                            data.append({
+                                'Comunidade ID': i + 1,
+                                'Tamanho': len(community),
+                                'Membros': "<br>".join(community_members), # <-- MODIFICADO: Usa <br> para quebras de linha no hover
+                                'Membros_Lista': community_members # Lista para exibição detalhada no expander
+                            })
                     
-                    if data: # Se a lista 'data' não estiver vazia
-                        df = pd.DataFrame(data).sort_values(by='Peso', ascending=False).reset_index(drop=True)
-                    else: # Se a lista 'data' estiver vazia, cria um DataFrame vazio com as colunas esperadas
-                        df = pd.DataFrame(columns=['Origem', 'Destino', 'Peso'])
+                        df = pd.DataFrame(data)
+                        # <-- MODIFICADO: Ordena as comunidades por tamanho antes de armazenar
+                        df = df.sort_values(by='Tamanho', ascending=False).reset_index(drop=True)
+                        # Convert 'Comunidade ID' para string para garantir tratamento categórico no Plotly
+                        df['Comunidade ID'] = df['Comunidade ID'].astype(str)
+
+                        st.session_state.community_results = {
+                            'metric': f"{comm_metric_choice} ({algorithm_choice})",
+                            'expl': expl,
+                            'df': df,
+                            'is_bridge': False,
+                            'num_comm': len(communities),
+                            'modularity': modularity,
+                            'modularity_levels': modularity_levels
+                        }
+
+                    elif comm_metric_choice == "Bridging Ties":
+                        # Mantendo o acesso via st.session_state.community_metrics conforme seu código original
+                        bridging_ties = st.session_state.community_metrics.find_bridging_ties(out_adj, communities)
+                        expl = f"Arestas de ponte que conectam as {len(communities)} comunidades encontradas."
                     
-                    st.session_state.community_results = {
-                        'metric': comm_metric_choice,
-                        'expl': expl,
-                        'df': df,
-                        'is_bridge': True,
-                        'num_comm': len(communities)
-                    }
-                
+                        data = []
+                        for u, v, w in bridging_ties:
+                            data.append({
+                                'Origem': names_map.get(u, str(u)),
+                                'Destino': names_map.get(v, str(v)),
+                                'Peso': float(w)
+                            })
+                    
+                        if data: # Se a lista 'data' não estiver vazia
+                            df = pd.DataFrame(data).sort_values(by='Peso', ascending=False).reset_index(drop=True)
+                        else: # Se a lista 'data' estiver vazia, cria um DataFrame vazio com as colunas esperadas
+                            df = pd.DataFrame(columns=['Origem', 'Destino', 'Peso'])
+                    
+                        st.session_state.community_results = {
+                            'metric': f"{comm_metric_choice} ({algorithm_choice})",
+                            'expl': expl,
+                            'df': df,
+                            'is_bridge': True,
+                            'num_comm': len(communities),
+                            'modularity': modularity,
+                            'modularity_levels': modularity_levels,
+                            'brokerage_df': _brokerage_df(out_adj, names_map)
+                        }
+
                 st.toast('Cálculo de comunidade finalizado!', icon='✅')
 
             except Exception as e:
@@ -101,11 +175,36 @@ def display_community_metrics(out_adj: List[List[Tuple[int, float]]], names_map:
         res = st.session_state.community_results
         st.subheader("Resultados")
         st.write(res['expl'])
+        if res.get('modularity') is not None:
+            st.metric("Modularidade (Q)", f"{res['modularity']:.4f}", help="Qualidade da partição: fração de peso interno às comunidades menos o esperado ao acaso.")
+        levels_df = res.get('modularity_levels')
+        if levels_df is not None and len(levels_df) > 1:
+            with st.expander("Modularidade por nível do dendrograma (Girvan-Newman)"):
+                fig_levels = px.line(levels_df, x='Arestas Removidas', y='Modularidade (Q)', markers=True,
+                                     hover_data={'Comunidades': True},
+                                     title='Modularidade após cada divisão de componente')
+                st.plotly_chart(fig_levels, use_container_width=True)
         
         df_display = res['df']
         
         if res['is_bridge']: # Visualização de Arestas de Ponte
             st.markdown(f"**{res['metric']}** (Total: {len(df_display)})")
+
+            articulation_df = res.get('articulation_df')
+            if articulation_df is not None:
+                st.markdown("### Pontos de Articulação (Bus Factor)")
+                if articulation_df.empty:
+                    st.info("Nenhum autor isolado desconecta a rede.")
+                else:
+                    st.caption("Autores cuja saída divide a rede; 'Autores desligados' conta quem perde contato com a maior parte restante.")
+                    st.dataframe(articulation_df, use_container_width=True)
+
+            brokerage_df = res.get('brokerage_df')
+            if brokerage_df is not None and not brokerage_df.empty:
+                with st.expander("Corretores: Buracos Estruturais (Burt)"):
+                    st.caption("Constraint baixo e tamanho efetivo alto indicam autores que ligam grupos sem contato direto "
+                               "entre si. Calculado em uma passada sobre os caminhos de dois saltos, sem detecção de comunidades.")
+                    st.dataframe(brokerage_df.head(50), use_container_width=True)
             
             if not df_display.empty:
                 # Gráfico para Arestas de Ponte
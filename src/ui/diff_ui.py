@@ -0,0 +1,102 @@
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+from datetime import date
+from typing import Dict, Any
+
+LOADED_PREFIX = "Grafo carregado: "
+
+
+def _resolve_snapshot(choice: str, loaded_graphs: Dict[str, Any], loaded_names_maps: Dict[str, Dict[int, str]]):
+    """Snapshot (idx_to_name, arestas) de um grafo carregado ou de um snapshot salvo."""
+    graph_diff = st.session_state.graph_diff
+    if choice.startswith(LOADED_PREFIX):
+        graph_name = choice[len(LOADED_PREFIX):]
+        return graph_diff.snapshot_from_graph(loaded_graphs[graph_name], loaded_names_maps.get(graph_name, {}))
+    return graph_diff.load_snapshot(choice)
+
+
+def display_graph_diff(loaded_graphs: Dict[str, Any], loaded_names_maps: Dict[str, Dict[int, str]]):
+    """
+    Salva snapshots dos grafos carregados e compara dois deles (ou um snapshot
+    com o grafo atual) pelo login dos autores: o que entrou, saiu ou mudou de peso.
+    """
+    graph_diff = st.session_state.graph_diff
+    st.header("Snapshots e Diferenças entre Coletas")
+
+    with st.expander("Salvar snapshot de um grafo carregado"):
+        graph_name = st.selectbox("Grafo:", list(loaded_graphs.keys()), key="snapshot_graph_choice")
+        default_name = f"{graph_name.replace(' ', '_')}_{date.today().isoformat()}"
+        snapshot_name = st.text_input("Nome do snapshot", value=default_name, key="snapshot_name")
+        if st.button("Salvar Snapshot", key="snapshot_save"):
+            try:
+                idx_to_name, edges = graph_diff.snapshot_from_graph(loaded_graphs[graph_name],
+                                                                    loaded_names_maps.get(graph_name, {}))
+                path = graph_diff.save_snapshot(snapshot_name, idx_to_name, edges)
+                st.success(f"Snapshot salvo em {path}")
+            except Exception as e:
+                st.error(f"Erro ao salvar snapshot: {e}")
+
+    options = graph_diff.list_snapshots() + [LOADED_PREFIX + name for name in loaded_graphs]
+    if len(options) < 2:
+        st.info("Salve ao menos um snapshot para comparar com o grafo atual.")
+        return
+
+    with st.form("graph_diff_form"):
+        col_old, col_new = st.columns(2)
+        old_choice = col_old.selectbox("Antes:", options, index=0)
+        new_choice = col_new.selectbox("Depois:", options, index=len(options) - 1)
+        top_n = st.number_input("Autores no gráfico de variação de grau", min_value=1, value=15, step=1)
+        submitted = st.form_submit_button("Comparar")
+
+    if submitted:
+        with st.spinner("Comparando snapshots..."):
+            try:
+                diff = graph_diff.diff_snapshots(
+                    _resolve_snapshot(old_choice, loaded_graphs, loaded_names_maps),
+                    _resolve_snapshot(new_choice, loaded_graphs, loaded_names_maps),
+                )
+                st.session_state.graph_diff_results = {'diff': diff, 'old': old_choice, 'new': new_choice,
+                                                       'top_n': int(top_n)}
+            except Exception as e:
+                st.error(f"Erro ao comparar: {e}")
+                st.exception(e)
+
+    res = st.session_state.get('graph_diff_results')
+    if not res:
+        return
+    diff = res['diff']
+    summary = diff['summary']
+    st.subheader(f"{res['old']} → {res['new']}")
+
+    col1, col2, col3, col4, col5 = st.columns(5)
+    col1.metric("Autores novos", summary['added_vertices'])
+    col2.metric("Autores que saíram", summary['removed_vertices'])
+    col3.metric("Arestas novas", summary['added_edges'])
+    col4.metric("Arestas removidas", summary['removed_edges'])
+    col5.metric("Pesos alterados", summary['reweighted_edges'])
+
+    df_degree = pd.DataFrame(diff['degree_delta']).rename(columns={
+        'author': "Autor", 'old_degree': "Grau Antes", 'new_degree': "Grau Depois",
+        'delta': "Δ Grau", 'out_delta': "Δ Saída", 'in_delta': "Δ Entrada",
+    })
+    if not df_degree.empty:
+        fig = px.bar(df_degree.head(res['top_n']), x="Autor", y="Δ Grau",
+                     title="Maiores variações de grau ponderado (entrada + saída)")
+        st.plotly_chart(fig, use_container_width=True)
+
+    with st.expander(f"Variação de grau por autor ({summary['authors_with_degree_change']})"):
+        st.dataframe(df_degree, use_container_width=True, hide_index=True)
+    with st.expander("Autores novos / que saíram"):
+        col_added, col_removed = st.columns(2)
+        col_added.dataframe(pd.DataFrame({"Novos": diff['added_vertices']}), hide_index=True)
+        col_removed.dataframe(pd.DataFrame({"Saíram": diff['removed_vertices']}), hide_index=True)
+    with st.expander("Arestas novas"):
+        st.dataframe(pd.DataFrame(diff['added_edges'], columns=["Origem", "Destino", "Peso"]),
+                     use_container_width=True, hide_index=True)
+    with st.expander("Arestas removidas"):
+        st.dataframe(pd.DataFrame(diff['removed_edges'], columns=["Origem", "Destino", "Peso"]),
+                     use_container_width=True, hide_index=True)
+    with st.expander("Arestas com peso alterado"):
+        st.dataframe(pd.DataFrame(diff['reweighted_edges'], columns=["Origem", "Destino", "Peso Antes", "Peso Depois"]),
+                     use_container_width=True, hide_index=True)
@@ -1,3 +1,4 @@
+import numpy as np
 import streamlit as st
 from src.core.AdjacencyListGraph import AdjacencyListGraph
 import src.ui.structure_ui as structure_ui
@@ -33,7 +34,8 @@ def sidebar_metrics(analysis_mode, get_neo4j_service):
         with st.spinner(f"Calculando métricas estruturais para {analysis_mode}..."):
             
             # Buscar Dados e construir o grafo temporário
-            idx_to_name, edges = st.session_state.shared_queries.fetch_authors_and_edges(neo4j_service, interaction_types)
+            idx_to_name, edges = st.session_state.shared_queries.fetch_authors_and_edges(neo4j_service, interaction_types,
+                                                                                        store=st.session_state)
             
             # Gerar um sufixo de chave consistente e o nome de exibição desejado
             dynamic_graph_key_suffix = analysis_mode.replace(' ', '_').replace('(', '').replace(')', '')
@@ -57,32 +59,29 @@ def sidebar_metrics(analysis_mode, get_neo4j_service):
                      del st.session_state['last_calculated_graph_name']
             else:
                 vertex_count = len(idx_to_name)
-                edge_count = len(edges)
                 
                 graph = build_simple_graph(AdjacencyListGraph, vertex_count, edges)
                 adj_list = graph.getAsAdjacencyList()
                 
-                # Calcular Métricas
-                density = st.session_state.structure_metrics.calculate_density(vertex_count, edge_count)
+                # Calcular Métricas (densidade, assortatividade, reciprocidade e graus em uma passada)
+                summary = st.session_state.structure_metrics.calculate_structural_summary(adj_list)
                 clustering = st.session_state.structure_metrics.calculate_average_clustering_coefficient(adj_list)
-                assortativity = st.session_state.structure_metrics.calculate_assortativity(adj_list)
+                local_clustering = st.session_state.structure_metrics.calculate_local_clustering_coefficients(adj_list)
+                triad_census = st.session_state.structure_metrics.calculate_triad_census(adj_list)
+                # Diâmetro exato (iFUB) e caminho médio amostrado nas visões fraca e forte
+                distances = {}
+                for view, strong in (('weak', False), ('strong', True)):
+                    distances[view] = st.session_state.structure_metrics.calculate_distance_summary(adj_list, strong=strong)
                 
-                # Preparar dados do scatter plot
-                degrees = [0] * vertex_count
-                for u, neighbors in enumerate(adj_list):
-                    degrees[u] += len(neighbors)
-                    for v in neighbors:
-                        degrees[v] += 1
-                
-                scatter_data = []
-                for u, neighbors in enumerate(adj_list):
-                    for v in neighbors:
-                        scatter_data.append({
-                            "Grau Origem": degrees[u],
-                            "Grau Destino": degrees[v],
-                            "Autor Origem": idx_to_name.get(u, str(u)),
-                            "Autor Destino": idx_to_name.get(v, str(v))
-                        })
+                # Dados do scatter plot em colunas (vetores), sem um dict por aresta
+                degrees = summary['total_degree']
+                names_arr = np.array([idx_to_name.get(i, str(i)) for i in range(vertex_count)], dtype=object)
+                scatter_data = {
+                    "Grau Origem": degrees[summary['src']],
+                    "Grau Destino": degrees[summary['dst']],
+                    "Autor Origem": names_arr[summary['src']],
+                    "Autor Destino": names_arr[summary['dst']]
+                }
                 
                 # *** ARMAZENA RESULTADOS DE ESTRUTURA POR NOME DE GRAFO ***
                 if 'all_graphs_structure_results' not in st.session_state:
@@ -90,11 +89,16 @@ def sidebar_metrics(analysis_mode, get_neo4j_service):
                 
                 st.session_state.all_graphs_structure_results[dynamic_graph_display_name] = {
                     'analysis_mode': analysis_mode,
-                    'density': density,
+                    'density': summary['density'],
                     'clustering': clustering,
-                    'assortativity': assortativity,
+                    'local_clustering': local_clustering,
+                    'assortativity': summary['assortativity'],
+                    'reciprocity': summary['reciprocity'],
+                    'triad_census': triad_census,
+                    'degree_ccdf': {label: summary[f'{label}_ccdf'] for label in ('in', 'out', 'total')},
+                    'distances': distances,
                     'scatter_data': scatter_data,
-                    'max_degree': max(degrees) if degrees else 0,
+                    'max_degree': int(degrees.max()) if len(degrees) else 0,
                     'idx_to_name': idx_to_name # Opcional, para usar na display_structure_results se necessário
                 }
                 
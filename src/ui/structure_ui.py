@@ -8,7 +8,7 @@ def display_structure_results(res: Dict[str, Any]):
     st.divider()
     st.subheader(f"Resultados para: {res['analysis_mode']}")
     
-    col1, col2, col3 = st.columns(3)
+    col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         st.metric(label="Densidade da Rede", value=f"{res['density']:.5f}", help="Proporção de conexões existentes vs. possíveis.")
@@ -16,6 +16,22 @@ def display_structure_results(res: Dict[str, Any]):
         st.metric(label="Coef. de Aglomeração (Médio)", value=f"{res['clustering']:.4f}", help="Probabilidade de dois vizinhos de um nó serem vizinhos entre si.")
     with col3:
         st.metric(label="Assortatividade", value=f"{res['assortativity']:.4f}", help="Correlação de grau.")
+    with col4:
+        if res.get('reciprocity') is not None:
+            st.metric(label="Reciprocidade", value=f"{res['reciprocity']:.4f}", help="Fração das interações (u → v) correspondidas por (v → u).")
+
+    distances = res.get('distances')
+    if distances:
+        st.markdown("**Distâncias na maior componente**")
+        views = (('weak', "Fracamente conexa (sem direção)"), ('strong', "Fortemente conexa (dirigida)"))
+        for view, label in views:
+            d = distances[view]
+            col_size, col_diam, col_aspl = st.columns(3)
+            col_size.metric(label=f"{label}: Nós", value=f"{d['component_size']}")
+            col_diam.metric(label="Diâmetro", value=f"{d['diameter']}",
+                            help=f"Exato (iFUB), calculado com {d['bfs_runs']} BFS.")
+            col_aspl.metric(label="Caminho Médio", value=f"{d['aspl']:.3f}",
+                            help=f"Estimado com {d['samples']} fontes; IC 95%: [{d['low']:.3f}, {d['high']:.3f}].")
 
     st.subheader("Interpretação")
     density = res['density']
@@ -36,13 +52,59 @@ def display_structure_results(res: Dict[str, Any]):
         assort_interp = "rede neutra (sem preferência clara de conexão)"
     st.markdown(f"- **Assortatividade:** Indica uma **{assort_interp}**.")
 
+    # --- AGLOMERAÇÃO LOCAL POR AUTOR ---
+    local_clustering = res.get('local_clustering')
+    if local_clustering:
+        idx_to_name = res.get('idx_to_name', {})
+        with st.expander("Coeficiente de Aglomeração Local por Autor"):
+            df_local = pd.DataFrame({
+                'Autor': [idx_to_name.get(i, str(i)) for i in range(len(local_clustering))],
+                'Aglomeração Local': local_clustering,
+            })
+            fig_local = px.histogram(df_local, x='Aglomeração Local', nbins=20,
+                                     title='Distribuição do Coeficiente de Aglomeração Local')
+            st.plotly_chart(fig_local, use_container_width=True)
+            st.dataframe(df_local.sort_values(by='Aglomeração Local', ascending=False).reset_index(drop=True),
+                         use_container_width=True)
+
+    # --- DISTRIBUIÇÃO DE GRAUS (CCDF) ---
+    degree_ccdf = res.get('degree_ccdf')
+    if degree_ccdf and len(degree_ccdf['total']) > 1:
+        with st.expander("Distribuição de Graus (CCDF)"):
+            labels = {'in': 'Entrada', 'out': 'Saída', 'total': 'Total'}
+            df_ccdf = pd.concat([
+                pd.DataFrame({'Grau': range(len(ccdf)), 'P(K ≥ k)': ccdf, 'Tipo': labels[key]})
+                for key, ccdf in degree_ccdf.items()
+            ])
+            df_ccdf = df_ccdf[(df_ccdf['Grau'] > 0) & (df_ccdf['P(K ≥ k)'] > 0)]
+            fig_ccdf = px.line(df_ccdf, x='Grau', y='P(K ≥ k)', color='Tipo', log_x=True, log_y=True,
+                               title='CCDF dos Graus (escala log-log)')
+            st.plotly_chart(fig_ccdf, use_container_width=True)
+
+    # --- CENSO DE TRÍADES ---
+    triad_census = res.get('triad_census')
+    if triad_census:
+        with st.expander("Censo de Tríades (motivos dirigidos)"):
+            connected = sum(count for triad, count in triad_census.items() if triad not in ("003", "012", "102"))
+            df_triads = pd.DataFrame({'Tríade': list(triad_census), 'Quantidade': list(triad_census.values())})
+            df_triads['% das Tríades Conexas'] = [
+                100.0 * count / connected if connected and triad not in ("003", "012", "102") else None
+                for triad, count in triad_census.items()
+            ]
+            fig_triads = px.bar(df_triads[df_triads['Quantidade'] > 0], x='Tríade', y='Quantidade', log_y=True,
+                                title='Censo de Tríades (escala log)')
+            st.plotly_chart(fig_triads, use_container_width=True)
+            st.caption("Notação MAN: dígitos = díades Mútuas, Assimétricas e Nulas. "
+                       "Tipos com díade mútua (102, 111, 201, 120, 210, 300) refletem revisão/comentário recíprocos; "
+                       "030T indica hierarquia transitiva e 030C, ciclos.")
+            st.dataframe(df_triads, use_container_width=True)
+
     # --- GRÁFICO EXTRA: DISPERSÃO DE GRAUS ---
     st.subheader("Visualizando a Assortatividade")
-    scatter_data = res['scatter_data']
+    df_scatter = pd.DataFrame(res['scatter_data'])
     max_degree = res['max_degree']
 
-    if len(scatter_data) > 0:
-        df_scatter = pd.DataFrame(scatter_data)
+    if len(df_scatter) > 0:
         if len(df_scatter) > 5000:
                 df_scatter = df_scatter.sample(n=5000, random_state=42).copy()
                 st.caption("Nota: Exibindo amostra de 5000 conexões aleatórias para performance.")
@@ -0,0 +1,85 @@
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+from typing import Callable
+
+FREQUENCY_OPTIONS = {"Semanal": "W", "Mensal": "M"}
+
+
+def display_temporal_metrics(get_neo4j_service: Callable):
+    """
+    Desenha o formulário da série temporal (janelas deslizantes), calcula grau,
+    PageRank e comunidades por janela e exibe a evolução dos principais autores.
+    """
+    st.header("Evolução Temporal (Janelas Deslizantes)")
+    st.markdown("Cada interação recebe a data do próprio evento (comentário, review, merge); "
+                "aprovações e fechamentos de issue, que não têm data no banco, usam a criação da Issue/PR. "
+                "As janelas avançam de forma incremental (interações entram e expiram), "
+                "com PageRank e Louvain partindo do resultado da janela anterior.")
+
+    weights = st.session_state.shared_queries.WEIGHTS
+    with st.form("temporal_metrics_form"):
+        relations = st.multiselect("Tipos de interação:", list(weights.keys()), default=list(weights.keys()))
+        col_freq, col_span, col_step = st.columns(3)
+        frequency = col_freq.selectbox("Período", list(FREQUENCY_OPTIONS.keys()))
+        span = col_span.number_input("Períodos por janela", min_value=1, value=4, step=1)
+        step = col_step.number_input("Avanço (períodos)", min_value=1, value=1, step=1)
+        col_metric, col_top = st.columns(2)
+        metric = col_metric.selectbox("Métrica por autor", ("PageRank", "Degree (weighted)"))
+        top_n = col_top.number_input("Autores no gráfico (maior pico)", min_value=1, value=10, step=1)
+        use_communities = st.checkbox("Contar comunidades (Louvain) por janela", value=True)
+        submitted = st.form_submit_button("Calcular Série Temporal")
+
+    if submitted:
+        with st.spinner("Calculando métricas por janela..."):
+            try:
+                model = st.session_state.shared_queries.get_author_artifact_model(get_neo4j_service(),
+                                                                                store=st.session_state)
+                src, dst, edge_weights, times = model.timed_edges(relations, weights)
+                series = st.session_state.temporal_metrics.sliding_window_metrics(
+                    model.num_authors, src, dst, edge_weights, times,
+                    freq=FREQUENCY_OPTIONS[frequency], span=int(span), step=int(step),
+                    communities=use_communities,
+                )
+                st.session_state.temporal_results = {
+                    'series': series,
+                    'idx_to_name': model.idx_to_name,
+                    'metric': metric,
+                    'top_n': int(top_n),
+                }
+            except Exception as e:
+                st.error(f"Erro ao calcular a série temporal: {e}")
+                st.exception(e)
+
+    res = st.session_state.get('temporal_results')
+    if not res:
+        return
+    series = res['series']
+    if not series['labels']:
+        st.warning("Nenhuma interação datada encontrada para os tipos selecionados.")
+        return
+
+    idx_to_name = res['idx_to_name']
+    values = series['pagerank'] if res['metric'] == "PageRank" else series['degree']
+    top = values.max(axis=0).argsort()[::-1][:res['top_n']]
+    df = pd.DataFrame(values[:, top], index=pd.to_datetime(series['labels']),
+                      columns=[idx_to_name.get(int(u), str(u)) for u in top])
+    df.index.name = "Início da Janela"
+    df_long = df.reset_index().melt(id_vars="Início da Janela", var_name="Autor", value_name=res['metric'])
+    st.plotly_chart(px.line(df_long, x="Início da Janela", y=res['metric'], color="Autor",
+                            title=f"{res['metric']} por janela (top {len(top)} autores)"),
+                    use_container_width=True)
+
+    df_summary = pd.DataFrame({
+        "Início da Janela": pd.to_datetime(series['labels']),
+        "Autores Ativos": series['active_authors'],
+        "Interações": series['interactions'],
+        "Iterações PageRank": series['pagerank_iterations'],
+    })
+    if series['communities'] is not None:
+        df_summary["Comunidades"] = series['communities']
+    summary_cols = [c for c in ("Autores Ativos", "Comunidades") if c in df_summary]
+    st.plotly_chart(px.line(df_summary, x="Início da Janela", y=summary_cols, title="Atividade e comunidades por janela"),
+                    use_container_width=True)
+    with st.expander("Tabela por janela"):
+        st.dataframe(df_summary, use_container_width=True)
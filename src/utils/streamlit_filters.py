@@ -1,10 +1,13 @@
 import streamlit as st
 from src.core.AbstractGraph import AbstractGraph
+from src.analysis.structure_metrics import calculate_core_numbers
+import src.services.graph_service as graph_service
 
-def visualization_filters(graph: AbstractGraph, filter_with_edges: bool, limit: int, idx_to_name_full: dict) -> list[int]: 
+def visualization_filters(graph: AbstractGraph, filter_with_edges: bool, limit: int, idx_to_name_full: dict,
+                          k_core: int = 0, core_mode: str = "total") -> list[int]: 
     """
     Aplica filtros de visualização ao grafo COMPLETO, limitando autores por out-degree
-    e/ou removendo autores sem arestas (se solicitado).
+    e/ou removendo autores sem arestas (se solicitado) e/ou mantendo apenas o k-core.
     
     Retorna a lista de ÍNDICES ORIGINAIS (do grafo completo) que devem ser incluídos 
     no subgrafo ativo.
@@ -13,6 +16,8 @@ def visualization_filters(graph: AbstractGraph, filter_with_edges: bool, limit:
     :param filter_with_edges: Mostrar apenas autores com interações
     :param limit: Limite de autores
     :param idx_to_name_full: Mapeamento de índice original -> nome (completo)
+    :param k_core: Mostrar apenas o k-core (autores com número de core >= k; 0 = desativado)
+    :param core_mode: Grau usado no k-core ("total", "in" ou "out")
     :return: Lista de índices ORIGINAIS que passaram pelos filtros
     """
     author_activity = []
@@ -30,6 +35,11 @@ def visualization_filters(graph: AbstractGraph, filter_with_edges: bool, limit:
 
     author_activity = author_activity_filtered
 
+    # 2b. ===== MANTÉM APENAS O K-CORE (Batagelj-Zaversnik, O(m)) =====
+    if k_core > 0:
+        core = calculate_core_numbers(graph.getAsAdjacencyList(), mode=core_mode)
+        author_activity = [item for item in author_activity if core[item[0]] >= k_core]
+
     # 3. ===== ORDENAR PELO OUT DEGREE =====
     author_activity.sort(key=lambda item: item[1], reverse=True)
 
@@ -41,6 +51,13 @@ def visualization_filters(graph: AbstractGraph, filter_with_edges: bool, limit:
     indices_to_render_original = [i for i, degree in author_activity]
 
     # 6. ===== ATUALIZAÇÕES DO SESSION STATE PARA SIDEBARS =====
+    _update_vertex_names(indices_to_render_original, idx_to_name_full)
+    
+    return indices_to_render_original
+
+
+def _update_vertex_names(indices_to_render_original: list[int], idx_to_name_full: dict) -> None:
+    """Atualiza a lista de nomes e o mapa nome -> índice original usados pelas sidebars."""
     filtered_vertex_names_list = []
     filtered_name_to_idx_map = {}
 
@@ -51,5 +68,49 @@ def visualization_filters(graph: AbstractGraph, filter_with_edges: bool, limit:
 
     st.session_state.vertex_names_list = sorted(filtered_vertex_names_list)
     st.session_state.name_to_idx_map = filtered_name_to_idx_map
-    
-    return indices_to_render_original
\ No newline at end of file
+
+
+def ego_view_options(page_id: str, idx_to_name_full: dict | None) -> tuple | None:
+    """
+    Desenha na sidebar as opções da visão ego (vizinhança de um autor).
+
+    Retorna (login do autor central, saltos, máx. de autores, peso mínimo), ou
+    None se a visão ego estiver desativada. O autor vai pelo login, e não pelo
+    índice, para continuar válido quando o grafo completo é regerado.
+    """
+    st.sidebar.header("Visão Ego (Vizinhança de um Autor)")
+    enabled = st.sidebar.checkbox(
+        "Mostrar apenas a vizinhança de um autor", value=False, key=f"{page_id}_ego_enabled",
+        help="Desenha só os autores a até k saltos do autor escolhido, em vez do grafo filtrado inteiro. "
+             "Os filtros acima são ignorados enquanto esta opção estiver ativa.")
+    if not enabled or not idx_to_name_full:
+        return None
+
+    center_name = st.sidebar.selectbox("Autor central", sorted(idx_to_name_full.values()), key=f"{page_id}_ego_center")
+    hops = st.sidebar.number_input("Saltos (k)", min_value=1, max_value=5, value=1, step=1, key=f"{page_id}_ego_hops")
+    max_nodes = st.sidebar.number_input(
+        "Máximo de autores", min_value=2, value=50, step=10, key=f"{page_id}_ego_max_nodes",
+        help="Ao atingir o limite, ficam os vizinhos com laços mais fortes com o nível anterior.")
+    min_weight = st.sidebar.number_input(
+        "Peso mínimo da aresta", min_value=0.0, value=0.0, step=1.0, key=f"{page_id}_ego_min_weight")
+    return center_name, int(hops), int(max_nodes), float(min_weight)
+
+
+def ego_view_filter(graph: AbstractGraph, idx_to_name_full: dict, center_name: str, hops: int, max_nodes: int,
+                    min_weight: float) -> tuple[list[int], AbstractGraph | None]:
+    """
+    Visão ego sobre o grafo COMPLETO: monta o subgrafo da vizinhança do autor
+    `center_name` (BFS limitada a `hops` saltos e `max_nodes` autores) e
+    atualiza os nomes das sidebars.
+
+    Retorna (índices ORIGINAIS incluídos, com o centro primeiro; subgrafo ativo),
+    ou ([], None) se o autor não estiver no grafo.
+    """
+    center = next((idx for idx, name in idx_to_name_full.items() if name == center_name), None)
+    if center is None:
+        _update_vertex_names([], idx_to_name_full)
+        return [], None
+    active_graph, indices_to_render_original = graph_service.build_ego_graph(
+        graph, center, hops=hops, max_nodes=max_nodes, min_weight=min_weight)
+    _update_vertex_names(indices_to_render_original, idx_to_name_full)
+    return indices_to_render_original, active_graph
\ No newline at end of file
@@ -6,6 +6,22 @@ import altair as alt
 from src.analysis import centrality_metrics
 from typing import List, Tuple
 from src.analysis import community_metrics 
+from src.services import shared_queries
+
+def recarregar_dados_neo4j(get_neo4j_service, key: str):
+    """
+    Botão na sidebar que recarrega do Neo4j o modelo autor-artefato guardado na
+    sessão (ex.: após uma nova coleta). Os grafos já gerados continuam os mesmos
+    até serem gerados de novo.
+    """
+    if st.sidebar.button("Recarregar dados do Neo4j", key=key,
+                         help="Consulta o banco de novo; sem isso a sessão reaproveita os dados já carregados."):
+        try:
+            with st.spinner("Recarregando dados do Neo4j..."):
+                shared_queries.get_author_artifact_model(get_neo4j_service(), refresh=True, store=st.session_state)
+            st.sidebar.success("Dados recarregados. Gere o grafo novamente para usá-los.")
+        except Exception as e:
+            st.sidebar.error(f"Erro ao recarregar dados: {e}")
 
 def draw_graph_api_sidebar():
     """
@@ -62,6 +78,15 @@ def draw_graph_api_sidebar():
     # --- Expander 3: Análise de Aresta (u, v) ---
     analise_arestas(vertex_names, name_to_idx_active) 
 
+    # --- Expander 3b: Caminho Mínimo (u → v) ---
+    caminho_minimo(vertex_names, name_to_idx_active, idx_to_name_active)
+
+    # --- Expander 3c: Contribuidores Similares / Revisores Sugeridos ---
+    contribuidores_similares(vertex_names, name_to_idx_active, idx_to_name_active)
+
+    # --- Expander 3d: Resiliência à Saída de Mantenedores ---
+    resiliencia_saidas(idx_to_name_active)
+
     # --- Expander 4: Convergência / Divergência (2 Arestas) ---
     convergencia_divergencia(vertex_names, name_to_idx_active) 
 
@@ -90,6 +115,7 @@ def propriedades_gerais():
             col1.metric("É Conexo?", "Sim" if graph_service.is_connected() else "Não")
             col2.metric("É Vazio?", "Sim" if graph_service.is_empty() else "Não")
             col1.metric("É Completo?", "Sim" if graph_service.is_complete() else "Não")
+            col2.metric("Fortemente Conexo?", "Sim" if graph_service.is_strongly_connected() else "Não")
         except Exception as e:
             st.error(f"Erro na API: {e}")
 
@@ -108,6 +134,8 @@ def analise_vertices(vertex_names, name_to_idx):
                 st.metric("Grau de Entrada (In)", graph_service.get_vertex_in_degree(v_idx))
                 st.metric("Grau de Saída (Out)", graph_service.get_vertex_out_degree(v_idx))
                 st.metric("Peso do Vértice", f"{graph_service.get_vertex_weight(v_idx):.2f}")
+                st.metric("Influência (alcançáveis)", graph_service.get_influence_size(v_idx),
+                          help="Vértices alcançáveis a partir deste por caminhos dirigidos.")
             except Exception as e:
                 st.error(f"Erro ao obter dados para {selected_v_name}: {e}")
 
@@ -139,6 +167,11 @@ def analise_arestas(vertex_names, name_to_idx):
                 else:
                     st.info(f"Não, ({v_name}, {u_name}) não existe (Não é Predecessor).")
 
+                if graph_service.can_reach(u_idx, v_idx):
+                    st.info(f"{v_name} é alcançável a partir de {u_name} por um caminho dirigido.")
+                else:
+                    st.info(f"{v_name} NÃO é alcançável a partir de {u_name}.")
+
                 is_u_incident = graph_service.is_incident(u_idx, v_idx, u_idx)
                 is_v_incident = graph_service.is_incident(u_idx, v_idx, v_idx)
                 
@@ -151,6 +184,98 @@ def analise_arestas(vertex_names, name_to_idx):
             except Exception as e:
                 st.error(f"Erro: {e}")
 
+def caminho_minimo(vertex_names, name_to_idx, idx_to_name):
+    """ Responde "como X se conecta a Y" no grafo ATIVO (busca bidirecional, ALT opcional). """
+    with st.sidebar.expander("Caminho Mínimo (u → v)"):
+        u_name = st.selectbox("Vértice de Origem (u):", vertex_names, key="sidebar_u_path")
+        v_name = st.selectbox("Vértice de Destino (v):", vertex_names, key="sidebar_v_path")
+        weighted = st.checkbox("Ponderado (custo = 1/peso)", value=True, key="sidebar_path_weighted",
+                               help="Interações mais fortes (peso maior) resultam em caminhos mais curtos.")
+        num_landmarks = st.number_input("Landmarks ALT (0 = sem índice)", min_value=0, max_value=32, value=8, step=1,
+                                        key="sidebar_path_landmarks",
+                                        help="Índice pré-calculado uma vez por grafo que acelera consultas repetidas.")
+
+        if st.button("Encontrar Caminho", key="sidebar_find_path"):
+            try:
+                u_idx = name_to_idx[u_name]
+                v_idx = name_to_idx[v_name]
+                cost, path, settled = graph_service.find_shortest_path(u_idx, v_idx, weighted, int(num_landmarks))
+
+                if not path:
+                    st.error(f"Não há caminho de {u_name} até {v_name}.")
+                else:
+                    st.success(" → ".join(idx_to_name.get(i, str(i)) for i in path))
+                    col1, col2 = st.columns(2)
+                    col1.metric("Saltos", len(path) - 1)
+                    col2.metric("Custo", f"{cost:.3f}" if weighted else f"{cost:.0f}")
+                    if settled:
+                        st.caption(f"{settled} vértices fixados pela busca.")
+            except Exception as e:
+                st.error(f"Erro: {e}")
+
+def contribuidores_similares(vertex_names, name_to_idx, idx_to_name):
+    """ Sugere revisores / contribuidores similares a um vértice (vizinhança compartilhada). """
+    with st.sidebar.expander("Contribuidores Similares / Revisores Sugeridos"):
+        v_name = st.selectbox("Vértice (v):", vertex_names, key="sidebar_v_similar")
+        method_labels = {
+            "Adamic-Adar": "adamic_adar",
+            "Jaccard": "jaccard",
+            "Vizinhos em Comum": "common_neighbors",
+            "Cosseno (ponderado)": "cosine",
+        }
+        method_label = st.selectbox("Métrica:", list(method_labels), key="sidebar_similar_method")
+        k = st.number_input("Quantidade (k)", min_value=1, max_value=50, value=10, step=1, key="sidebar_similar_k")
+        exclude = st.checkbox("Apenas quem ainda não interage com v (revisores sugeridos)", value=True,
+                              key="sidebar_similar_exclude")
+        approximate = st.checkbox("Aproximado (MinHash-LSH, Jaccard estimado)", value=False,
+                                  key="sidebar_similar_lsh",
+                                  help="Para grafos muito grandes: compara v só com candidatos dos mesmos baldes LSH.")
+
+        if st.button("Buscar Similares", key="sidebar_find_similar"):
+            try:
+                v_idx = name_to_idx[v_name]
+                similar = graph_service.find_similar_vertices(v_idx, int(k), method_labels[method_label],
+                                                              exclude, approximate)
+                if not similar:
+                    st.info(f"Nenhum vértice compartilha vizinhos com {v_name}.")
+                else:
+                    st.dataframe(pd.DataFrame(
+                        [{"Autor": idx_to_name.get(u, str(u)), "Score": round(score, 4)} for u, score in similar]
+                    ), use_container_width=True)
+            except Exception as e:
+                st.error(f"Erro: {e}")
+
+def resiliencia_saidas(idx_to_name):
+    """ Curva de "bus factor": conectividade após a saída dos k autores mais centrais. """
+    with st.sidebar.expander("Resiliência: Saída de Mantenedores"):
+        centrality_labels = {
+            "Degree (ponderado)": "degree",
+            "PageRank": "pagerank",
+            "Betweenness (ponderado)": "betweenness",
+            "Harmonic": "harmonic",
+        }
+        centrality_label = st.selectbox("Remover por:", list(centrality_labels), key="sidebar_departure_centrality")
+        k = st.number_input("Autores removidos (k)", min_value=1, max_value=500, value=10, step=1,
+                            key="sidebar_departure_k")
+
+        if st.button("Simular Saídas", key="sidebar_simulate_departures"):
+            try:
+                curve = graph_service.simulate_departures(int(k), centrality_labels[centrality_label])
+                df = pd.DataFrame({
+                    "Removidos": range(len(curve['largest_component'])),
+                    "Autor Removido": ["-"] + [idx_to_name.get(u, str(u)) for u in curve['removed']],
+                    "Maior Componente": curve['largest_component'],
+                    "Componentes": curve['num_components'],
+                })
+                st.line_chart(df, x="Removidos", y=["Maior Componente", "Componentes"])
+                st.dataframe(df, use_container_width=True, hide_index=True)
+                start, end = curve['largest_component'][0], curve['largest_component'][-1]
+                if start:
+                    st.caption(f"A maior componente cai de {start} para {end} vértices "
+                               f"({100 * (start - end) / start:.1f}%) após {len(curve['removed'])} saídas.")
+            except Exception as e:
+                st.error(f"Erro: {e}")
+
 def convergencia_divergencia(vertex_names, name_to_idx):
     """ 
     Verifica se as arestas (u1, v1) e (u2, v2) são convergentes ou divergentes,
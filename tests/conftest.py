@@ -2,6 +2,7 @@ import pytest
 from src.services.neo4j_service import Neo4jService
 from src.collectors.github_collector import GithubCollector
 from config.settings import NEO4J_URI, NEO4J_USERNAME, NEO4J_PASSWORD, GITHUB_BASE_URL, REQUEST_DELAY_SECONDS
+from src.analysis import metric_cache
 
 # Fixture para o serviço Neo4j
 @pytest.fixture(scope="module")
@@ -28,4 +29,17 @@ def github_collector():
     Cria uma instância de GithubCollector para os testes.
     """
     collector = GithubCollector(base_url=GITHUB_BASE_URL, delay_seconds=0.1) 
-    yield collector
\ No newline at end of file
+    yield collector
+
+# Cache de métricas isolado por teste
+@pytest.fixture(autouse=True)
+def isolated_metric_cache(tmp_path):
+    """
+    Aponta o cache em disco das métricas para um diretório temporário,
+    evitando que os testes leiam ou poluam o cache real do projeto.
+    """
+    cache = metric_cache.get_cache()
+    previous = (cache.cache_dir, cache.max_bytes, cache.enabled)
+    metric_cache.configure(cache_dir=str(tmp_path / "metric_cache"))
+    yield cache
+    cache.cache_dir, cache.max_bytes, cache.enabled = previous
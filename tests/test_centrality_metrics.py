@@ -0,0 +1,171 @@
+import random
+
+import pytest
+
+from src.analysis.centrality_metrics import (
+    betweenness_centrality,
+    betweenness_centrality_weighted,
+    build_adjlists,
+    build_integrated_edges,
+    build_relation_graphs_adjlists,
+    closeness_centrality,
+    compute_centralities,
+    eigenvector_centrality,
+    harmonic_centrality,
+    pagerank,
+    top_k_closeness,
+    top_k_harmonic,
+    top_k_pagerank,
+)
+
+
+def _random_graph(seed: int, n: int = 30, m: int = 80):
+    """Gera um grafo dirigido ponderado aleatório (sem laços) como listas de adjacência."""
+    rng = random.Random(seed)
+    edges = {}
+    for _ in range(m):
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            edges[(u, v)] = float(rng.randint(1, 5))
+    return build_adjlists(n, [(u, v, w) for (u, v), w in edges.items()])
+
+
+def _top(scores, k):
+    return sorted(scores.items(), key=lambda kv: kv[1], reverse=True)[:k]
+
+
+def test_top_k_closeness_matches_full_ranking():
+    """O top-k com corte de BFS deve devolver exatamente o ranking da versão completa."""
+    for seed in range(20):
+        out_adj, _ = _random_graph(seed)
+        for k in (1, 5, 10):
+            assert list(top_k_closeness(out_adj, k).items()) == _top(closeness_centrality(out_adj), k)
+
+
+def test_top_k_harmonic_matches_full_scores():
+    for seed in range(20):
+        out_adj, _ = _random_graph(seed)
+        expected = [score for _, score in _top(harmonic_centrality(out_adj), 10)]
+        got = list(top_k_harmonic(out_adj, 10).values())
+        assert len(got) == len(expected)
+        assert all(abs(a - b) < 1e-9 for a, b in zip(got, expected))
+
+
+def test_top_k_pagerank_matches_converged_pagerank():
+    out_adj, _ = _random_graph(7)
+    expected = [idx for idx, _ in _top(pagerank(out_adj, tol=1e-12, max_iter=500), 5)]
+    assert list(top_k_pagerank(out_adj, k=5, tol=1e-12, max_iter=500, stable_iters=500)) == expected
+
+
+def test_top_k_empty_graph():
+    assert top_k_closeness([], 3) == {}
+    assert top_k_harmonic([], 3) == {}
+    assert top_k_pagerank([], 3) == {}
+
+
+def _bfs_distances(out_adj, s):
+    dist = {s: 0}
+    frontier = [s]
+    while frontier:
+        nxt = []
+        for v in frontier:
+            for w, _ in out_adj[v]:
+                if w not in dist:
+                    dist[w] = dist[v] + 1
+                    nxt.append(w)
+        frontier = nxt
+    return dist
+
+
+def test_closeness_ms_bfs_matches_single_source_bfs():
+    """A closeness via MS-BFS (lotes pequenos para forçar vários lotes) deve bater com BFS simples."""
+    out_adj, _ = _random_graph(3, n=50, m=120)
+    scores = closeness_centrality(out_adj, batch_size=8)
+    for s in range(len(out_adj)):
+        dists = [d for d in _bfs_distances(out_adj, s).values() if d > 0]
+        expected = len(dists) / sum(dists) if dists else 0.0
+        assert scores[s] == pytest.approx(expected)
+
+
+def test_betweenness_ms_bfs_on_path_and_diamond():
+    # Caminho 0 -> 1 -> 2 -> 3: o nó 1 está em (0,2),(0,3); o nó 2 em (0,3),(1,3)
+    out_adj, _ = build_adjlists(4, [(0, 1, 1.0), (1, 2, 1.0), (2, 3, 1.0)])
+    assert betweenness_centrality(out_adj, batch_size=2) == {0: 0.0, 1: 2.0, 2: 2.0, 3: 0.0}
+
+    # Losango 0 -> {1, 2} -> 3: dois caminhos mínimos, cada intermediário recebe 1/2
+    out_adj, _ = build_adjlists(4, [(0, 1, 1.0), (0, 2, 1.0), (1, 3, 1.0), (2, 3, 1.0)])
+    assert betweenness_centrality(out_adj) == {0: 0.0, 1: 0.5, 2: 0.5, 3: 0.0}
+
+
+def test_compute_centralities_matches_individual_metrics():
+    """A varredura única deve reproduzir as funções individuais."""
+    for seed in range(5):
+        out_adj, _ = _random_graph(seed)
+        fused = compute_centralities(out_adj, metrics=["betweenness", "closeness", "harmonic", "eccentricity"])
+        bc = betweenness_centrality(out_adj)
+        cc = closeness_centrality(out_adj)
+        hc = harmonic_centrality(out_adj)
+        for v in range(len(out_adj)):
+            assert fused["betweenness"][v] == pytest.approx(bc[v])
+            assert fused["closeness"][v] == pytest.approx(cc[v])
+            assert fused["harmonic"][v] == pytest.approx(hc[v])
+            dists = _bfs_distances(out_adj, v).values()
+            assert fused["eccentricity"][v] == max(dists)
+
+        weighted = compute_centralities(out_adj, metrics=["betweenness"], weighted=True)
+        bc_w = betweenness_centrality_weighted(out_adj)
+        assert set(weighted) == {"betweenness"}
+        assert all(weighted["betweenness"][v] == pytest.approx(bc_w[v]) for v in range(len(out_adj)))
+
+
+def test_compute_centralities_does_not_depend_on_batch_size():
+    """Lotes pequenos da MS-BFS (várias fontes por lote, vários lotes) dão o mesmo resultado."""
+    out_adj, _ = _random_graph(7)
+    metrics = ["betweenness", "closeness", "harmonic", "eccentricity"]
+    single = compute_centralities(out_adj, metrics=metrics, batch_size=1)
+    batched = compute_centralities(out_adj, metrics=metrics, batch_size=3)
+    for m in metrics:
+        assert batched[m] == pytest.approx(single[m])
+
+
+def test_compute_centralities_rejects_unknown_metric():
+    with pytest.raises(ValueError):
+        compute_centralities([[]], metrics=["pagerank"])
+
+
+def test_build_integrated_edges_sums_weights_per_pair():
+    edges = build_integrated_edges(
+        {"A": [(0, 1), (0, 1), (2, 0)], "B": [(0, 1)], "C": []},
+        {"A": 2.0, "B": 0.5},
+    )
+    assert edges == [(0, 1, 4.5), (2, 0, 2.0)]
+    assert build_integrated_edges({}, {}) == []
+
+
+def test_relation_graphs_match_build_adjlists():
+    rng = random.Random(7)
+    pairs = [(rng.randrange(12), rng.randrange(12)) for _ in range(60)]
+    out_adj, in_adj = build_relation_graphs_adjlists(12, {"A": pairs})["A"]
+    ref_out, ref_in = build_adjlists(12, [(u, v, 1.0) for u, v in pairs])
+    assert len(out_adj) == 12
+    assert [sorted(x) for x in out_adj] == [sorted(x) for x in ref_out]
+    assert [sorted(x) for x in in_adj] == [sorted(x) for x in ref_in]
+    assert pagerank.uncached(out_adj) == pytest.approx(pagerank.uncached(ref_out))
+
+
+def test_csr_power_iterations_match_list_versions():
+    """PageRank, top-k e autovetor sobre ArrayAdjacency coincidem com as versões em listas."""
+    rng = random.Random(11)
+    # nós 18 e 19 sem arestas de saída (massa pendente redistribuída)
+    pairs = [(rng.randrange(18), rng.randrange(20)) for _ in range(90)]
+    out_adj, in_adj = build_relation_graphs_adjlists(20, {"A": pairs})["A"]
+    ref_out, ref_in = build_adjlists(20, [(u, v, 1.0) for u, v in pairs])
+
+    expected = pagerank.uncached(ref_out)
+    got = pagerank.uncached(out_adj)
+    assert all(isinstance(x, float) for x in got.values())
+    assert got == pytest.approx(expected)
+    assert list(top_k_pagerank.uncached(out_adj, 5)) == list(top_k_pagerank.uncached(ref_out, 5))
+    assert top_k_pagerank.uncached(out_adj, 5) == pytest.approx(top_k_pagerank.uncached(ref_out, 5))
+    assert eigenvector_centrality.uncached(out_adj, in_adj) == \
+        pytest.approx(eigenvector_centrality.uncached(ref_out, ref_in))
@@ -0,0 +1,128 @@
+import math
+
+import pytest
+
+from src.analysis.centrality_metrics import build_adjlists
+from src.analysis.community_metrics import (
+    biconnected_structure,
+    find_structural_bridging_ties,
+    girvan_newman_community_detection,
+    girvan_newman_dendrogram,
+    louvain_community_detection,
+    modularity,
+    structural_holes,
+)
+
+
+def _two_triangles_with_bridge():
+    """Dois triângulos {0,1,2} e {3,4,5} ligados pela ponte 2 -> 3, mais um par isolado {6,7}."""
+    edges = [(0, 1), (1, 2), (2, 0), (3, 4), (4, 5), (5, 3), (2, 3), (6, 7)]
+    out_adj, _ = build_adjlists(8, [(u, v, 1.0) for u, v in edges])
+    return out_adj
+
+
+def _normalize(communities):
+    return sorted(sorted(c) for c in communities)
+
+
+def test_girvan_newman_removes_bridge_first():
+    communities = girvan_newman_community_detection(_two_triangles_with_bridge(), max_splits=1)
+    assert _normalize(communities) == [[0, 1, 2], [3, 4, 5], [6, 7]]
+
+
+def test_girvan_newman_sampled_mode_finds_same_bridge():
+    communities = girvan_newman_community_detection(_two_triangles_with_bridge(), max_splits=1,
+                                                    sample_sources=4, seed=1)
+    assert _normalize(communities) == [[0, 1, 2], [3, 4, 5], [6, 7]]
+
+
+def test_girvan_newman_empty_graph():
+    assert girvan_newman_community_detection([], max_splits=3) == []
+
+
+def test_modularity_two_triangles():
+    # m = 7 arestas; cada triângulo tem 3 internas e soma de graus 7: Q = 6/7 - 2 * (7/14)^2
+    edges = [(0, 1), (1, 2), (2, 0), (3, 4), (4, 5), (5, 3), (2, 3)]
+    out_adj, _ = build_adjlists(6, [(u, v, 1.0) for u, v in edges])
+    q = modularity(out_adj, [[0, 1, 2], [3, 4, 5]], weighted=False)
+    assert q == pytest.approx(6 / 7 - 0.5)
+
+
+def test_louvain_recovers_planted_communities():
+    out_adj = _two_triangles_with_bridge()
+    communities = louvain_community_detection(out_adj)
+    assert _normalize(communities) == [[0, 1, 2], [3, 4, 5], [6, 7]]
+    assert _normalize(louvain_community_detection(out_adj, directed=True)) == [[0, 1, 2], [3, 4, 5], [6, 7]]
+
+
+def test_louvain_warm_start_from_previous_partition():
+    out_adj = _two_triangles_with_bridge()
+    # partição já ótima: mantida; partição com um nó trocado de lado: corrigida
+    assert _normalize(louvain_community_detection(out_adj, initial_membership=[0, 0, 0, 1, 1, 1, 2, 2])) == \
+        [[0, 1, 2], [3, 4, 5], [6, 7]]
+    assert _normalize(louvain_community_detection(out_adj, initial_membership=[0, 0, 1, 1, 1, 1, 2, 2])) == \
+        [[0, 1, 2], [3, 4, 5], [6, 7]]
+
+
+def test_louvain_rejects_membership_of_wrong_length():
+    with pytest.raises(ValueError):
+        louvain_community_detection(_two_triangles_with_bridge(), initial_membership=[0, 0, 1])
+
+
+def test_louvain_pass_limit_still_returns_a_partition():
+    """Com uma única passada por nível o resultado continua cobrindo todos os nós."""
+    edges = [(u, (u * 7 + 3) % 40, 1.0) for u in range(40)] + [(u, (u + 1) % 40, 1.0) for u in range(40)]
+    out_adj, _ = build_adjlists(40, edges)
+    communities = louvain_community_detection(out_adj, max_passes=1)
+    assert sorted(v for c in communities for v in c) == list(range(40))
+    assert modularity(out_adj, communities) > 0
+
+
+def test_girvan_newman_dendrogram_reused_across_max_splits():
+    out_adj = _two_triangles_with_bridge()
+    dendrogram = girvan_newman_dendrogram(out_adj, max_splits=1)
+    assert dendrogram.removed_edges == [(2, 3)]
+
+    # pedir mais remoções continua o dendrograma salvo em vez de recomeçar
+    extended = girvan_newman_dendrogram(out_adj, max_splits=4)
+    assert extended.removed_edges[0] == (2, 3)
+    assert len(extended.removed_edges) == 4
+    assert _normalize(extended.communities_at(1)) == [[0, 1, 2], [3, 4, 5], [6, 7]]
+    assert _normalize(girvan_newman_community_detection(out_adj, max_splits=1)) == [[0, 1, 2], [3, 4, 5], [6, 7]]
+
+
+def test_girvan_newman_modularity_by_level_matches_modularity():
+    out_adj = _two_triangles_with_bridge()
+    dendrogram = girvan_newman_dendrogram(out_adj, max_splits=8)
+    levels = dendrogram.modularity_by_level(out_adj, weighted=False)
+    assert [step for step, _, _ in levels][0] == 0
+    for step, num_communities, q in levels:
+        communities = dendrogram.communities_at(step)
+        assert len(communities) == num_communities
+        assert q == pytest.approx(modularity(out_adj, communities, weighted=False))
+
+
+def test_biconnected_structure_finds_bridge_and_articulation_points():
+    structure = biconnected_structure(_two_triangles_with_bridge())
+    assert structure['bridges'] == [(2, 3), (6, 7)]
+    assert structure['articulation_points'] == [2, 3]
+    assert structure['articulation_impact'][2] == (2, 2)  # {0, 1} perde contato com {3, 4, 5}
+    assert _normalize(structure['biconnected_components']) == [[0, 1, 2], [2, 3], [3, 4, 5], [6, 7]]
+
+
+def test_structural_bridging_ties_keep_direction_and_weight():
+    assert sorted(find_structural_bridging_ties(_two_triangles_with_bridge())) == [(2, 3, 1.0), (6, 7, 1.0)]
+
+
+def test_structural_holes_star_and_triangle():
+    # 0 liga {1, 2, 3}, que não se falam; 4-5-6 formam um triângulo; 7 isolado
+    out_adj = [[(1, 1.0), (2, 1.0), (3, 1.0)], [], [], [], [(5, 1.0), (6, 1.0)], [(6, 1.0)], [], []]
+    holes = structural_holes(out_adj)
+    assert holes['constraint'][0] == pytest.approx(1 / 3)
+    assert holes['effective_size'][0] == pytest.approx(3.0)
+    assert holes['efficiency'][0] == pytest.approx(1.0)
+    assert holes['constraint'][1] == pytest.approx(1.0)
+    # no triângulo cada vizinho é redundante pela metade: constraint = 2 * (1/2 + 1/4)^2
+    assert holes['constraint'][4] == pytest.approx(1.125)
+    assert holes['effective_size'][4] == pytest.approx(1.0)
+    assert math.isnan(holes['constraint'][7])
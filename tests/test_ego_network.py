@@ -0,0 +1,73 @@
+import random
+
+import pytest
+
+from src.analysis.ego_network import ego_graph
+from src.core.AdjacencyListGraph import AdjacencyListGraph
+
+
+def _graph(n, edges):
+    graph = AdjacencyListGraph(n)
+    for u, v, w in edges:
+        graph.addEdge(u, v, w)
+    return graph
+
+
+def _hop_distances(graph, center, min_weight):
+    """Distâncias (em saltos, ignorando o sentido) a partir de center, por BFS simples."""
+    n = graph.getVertexCount()
+    dist = {center: 0}
+    frontier = [center]
+    while frontier:
+        nxt = []
+        for u in frontier:
+            for v in range(n):
+                linked = ((graph.hasEdge(u, v) and graph.getEdgeWeight(u, v) >= min_weight)
+                          or (graph.hasEdge(v, u) and graph.getEdgeWeight(v, u) >= min_weight))
+                if linked and v not in dist:
+                    dist[v] = dist[u] + 1
+                    nxt.append(v)
+        frontier = nxt
+    return dist
+
+
+def test_ego_graph_follows_both_directions_up_to_k_hops():
+    # 1 -> 0 -> 2 -> 3 -> 4; 5 isolado
+    graph = _graph(6, [(1, 0, 1.0), (0, 2, 1.0), (2, 3, 1.0), (3, 4, 1.0)])
+    nodes, edges = ego_graph(graph, 0, hops=2, max_nodes=10)
+    assert nodes[0] == 0
+    assert sorted(nodes) == [0, 1, 2, 3]
+    assert sorted(edges) == [(0, 2, 1.0), (1, 0, 1.0), (2, 3, 1.0)]
+    assert ego_graph(graph, 5, hops=3)[0] == [5]
+
+    with pytest.raises(ValueError):
+        ego_graph(graph, 6)
+
+
+def test_ego_graph_cap_keeps_strongest_ties_and_min_weight_prunes():
+    # vizinhos do centro com laços de força 1, 5 (2 + 3 nos dois sentidos), 4 e 0.5
+    graph = _graph(6, [(0, 1, 1.0), (0, 2, 2.0), (2, 0, 3.0), (3, 0, 4.0), (0, 4, 0.5), (4, 5, 9.0)])
+    nodes, edges = ego_graph(graph, 0, hops=2, max_nodes=3)
+    assert nodes == [0, 2, 3]
+    assert sorted(edges) == [(0, 2, 2.0), (2, 0, 3.0), (3, 0, 4.0)]
+
+    nodes, _ = ego_graph(graph, 0, hops=2, max_nodes=10, min_weight=1.0)
+    assert 4 not in nodes and 5 not in nodes
+
+
+def test_ego_graph_matches_bfs_when_uncapped():
+    rng = random.Random(7)
+    n = 40
+    edges = {(rng.randrange(n), rng.randrange(n)): float(rng.randint(1, 5)) for _ in range(70)}
+    graph = _graph(n, [(u, v, w) for (u, v), w in edges.items() if u != v])
+    for center in range(0, n, 7):
+        for hops in (1, 2, 3):
+            dist = _hop_distances(graph, center, min_weight=2.0)
+            nodes, ego_edges = ego_graph(graph, center, hops=hops, max_nodes=n, min_weight=2.0)
+            assert sorted(nodes) == sorted(v for v, d in dist.items() if d <= hops)
+            levels = [dist[v] for v in nodes]
+            assert levels == sorted(levels)
+            inside = set(nodes)
+            assert all(u in inside and v in inside and w >= 2.0 for u, v, w in ego_edges)
+            assert len(ego_edges) == sum(1 for (u, v), w in edges.items()
+                                         if u != v and u in inside and v in inside and w >= 2.0)
@@ -0,0 +1,44 @@
+from src.analysis.graph_diff import diff_snapshots, list_snapshots, load_snapshot, save_snapshot, snapshot_from_graph
+from src.core.AdjacencyListGraph import AdjacencyListGraph
+
+
+def _week_one():
+    return {0: "alice", 1: "bob", 2: "carol"}, [(0, 1, 2.0), (1, 0, 4.0), (2, 1, 1.0)]
+
+
+def _week_two():
+    # índices reordenados, carol saiu, dave entrou; bob -> alice mudou de peso
+    return {0: "bob", 1: "dave", 2: "alice"}, [(2, 0, 2.0), (0, 2, 5.0), (1, 0, 3.0)]
+
+
+def test_diff_snapshots_by_login():
+    diff = diff_snapshots(_week_one(), _week_two())
+    assert diff['added_vertices'] == ["dave"]
+    assert diff['removed_vertices'] == ["carol"]
+    assert diff['added_edges'] == [("dave", "bob", 3.0)]
+    assert diff['removed_edges'] == [("carol", "bob", 1.0)]
+    assert diff['reweighted_edges'] == [("bob", "alice", 4.0, 5.0)]
+
+    deltas = dict(zip(diff['degree_delta']['author'], diff['degree_delta']['delta']))
+    # bob: +1 (saída) +3 (dave) -1 (carol); alice: +1; dave: +3; carol: -1
+    assert deltas == {"bob": 3.0, "dave": 3.0, "alice": 1.0, "carol": -1.0}
+    assert diff['degree_delta']['author'][:2] == ["bob", "dave"]
+    assert diff['summary']['authors_with_degree_change'] == 4
+
+    unchanged = diff_snapshots(_week_one(), _week_one())
+    assert all(count == 0 for count in unchanged['summary'].values())
+
+
+def test_snapshots_round_trip_and_match_loaded_graph(tmp_path):
+    names, edges = _week_one()
+    graph = AdjacencyListGraph(3)
+    for u, v, w in edges:
+        graph.addEdge(u, v, w)
+    assert diff_snapshots(snapshot_from_graph(graph, names), (names, edges))['summary']['added_edges'] == 0
+
+    save_snapshot("week1", names, edges, directory=str(tmp_path))
+    save_snapshot("week2", *_week_two(), directory=str(tmp_path))
+    assert sorted(list_snapshots(str(tmp_path))) == ["week1", "week2"]
+    loaded_names, loaded_edges = load_snapshot("week1", directory=str(tmp_path))
+    assert loaded_names == names
+    assert sorted(loaded_edges) == sorted(edges)
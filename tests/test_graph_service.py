@@ -0,0 +1,81 @@
+import pytest
+
+import src.services.graph_service as graph_service
+from src.analysis import link_prediction, reachability, shortest_paths
+from src.core.AdjacencyListGraph import AdjacencyListGraph
+
+
+class _SessionState(dict):
+    """Substituto de st.session_state: dict com acesso por atributo."""
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        self[name] = value
+
+
+def _chain(n):
+    graph = AdjacencyListGraph(n)
+    for u in range(n - 1):
+        graph.addEdge(u, u + 1, 1.0)
+    return graph
+
+
+@pytest.fixture
+def session(monkeypatch):
+    state = _SessionState(graph_obj=_chain(4))
+    monkeypatch.setattr(graph_service.st, "session_state", state)
+    return state
+
+
+def _count_builds(monkeypatch, module, name):
+    calls = []
+    original = getattr(module, name)
+
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(module, name, counting)
+    return calls
+
+
+def test_shortest_path_index_is_built_once_per_active_graph(session, monkeypatch):
+    builds = _count_builds(monkeypatch, shortest_paths, "build_shortest_path_index")
+    assert graph_service.find_shortest_path(0, 3, weighted=False)[1] == [0, 1, 2, 3]
+    assert graph_service.find_shortest_path(1, 3, weighted=False)[1] == [1, 2, 3]
+    assert len(builds) == 1
+
+    # modificar o grafo pela API descarta o índice
+    graph_service.add_edge(0, 3)
+    assert graph_service.find_shortest_path(0, 3, weighted=False)[1] == [0, 3]
+    assert len(builds) == 2
+
+    # um grafo ativo novo (filtros alterados) também
+    session.graph_obj = _chain(3)
+    assert graph_service.find_shortest_path(0, 2, weighted=False)[1] == [0, 1, 2]
+    assert len(builds) == 3
+
+
+def test_reachability_index_is_reused_until_the_graph_changes(session, monkeypatch):
+    builds = _count_builds(monkeypatch, reachability, "build_reachability_index")
+    assert graph_service.can_reach(0, 3) and not graph_service.can_reach(3, 0)
+    assert graph_service.get_influence_size(1) == 2  # vértices 2 e 3
+    assert len(builds) == 1
+
+    graph_service.add_edge(3, 0)
+    assert graph_service.can_reach(3, 0)
+    assert len(builds) == 2
+
+
+def test_similarity_indexes_are_kept_per_active_graph(session, monkeypatch):
+    exact = _count_builds(monkeypatch, link_prediction, "build_similarity_index")
+    approximate = _count_builds(monkeypatch, link_prediction, "build_minhash_index")
+    for v in range(4):
+        graph_service.find_similar_vertices(v, k=2)
+        graph_service.find_similar_vertices(v, k=2, approximate=True)
+    assert (len(exact), len(approximate)) == (1, 1)
@@ -0,0 +1,92 @@
+import math
+import random
+
+import pytest
+
+from src.analysis import link_prediction
+from src.analysis.link_prediction import METHODS, MinHashLSHIndex, SimilarityIndex
+
+
+def _collab_graph():
+    """0 e 1 interagem com {2, 3, 4}; 5 só com 2; 6 isolado; 0 -> 1 já ligados."""
+    adj = [{} for _ in range(7)]
+    for u in (0, 1):
+        for v in (2, 3, 4):
+            adj[u][v] = 2.0
+    adj[4][0] = 1.0  # aresta recíproca: peso de {0, 4} vira 3.0
+    adj[5][2] = 1.0
+    adj[0][1] = 1.0
+    return adj
+
+
+def _neighbor_sets(adj):
+    sets = [set() for _ in adj]
+    for u, nbrs in enumerate(adj):
+        for v in nbrs:
+            sets[u].add(v)
+            sets[v].add(u)
+    return sets
+
+
+def test_scores_match_set_definitions():
+    adj = _collab_graph()
+    index = SimilarityIndex(adj)
+    nbrs = _neighbor_sets(adj)
+    for u in range(len(adj)):
+        cn = index.scores(u, "common_neighbors")
+        jac = index.scores(u, "jaccard")
+        aa = index.scores(u, "adamic_adar")
+        for v in range(len(adj)):
+            common = nbrs[u] & nbrs[v] if u != v else set()
+            assert cn[v] == len(common)
+            assert jac[v] == pytest.approx(len(common) / len(nbrs[u] | nbrs[v]) if common else 0.0)
+            assert aa[v] == pytest.approx(sum(1 / math.log(len(nbrs[w])) for w in common))
+
+
+def test_cosine_uses_weights_of_both_directions():
+    index = SimilarityIndex(_collab_graph())
+    # linhas: 0 -> {1: 1, 2: 2, 3: 2, 4: 3}; 1 -> {0: 1, 2: 2, 3: 2, 4: 2}
+    expected = (2 * 2 + 2 * 2 + 3 * 2) / (math.sqrt(1 + 4 + 4 + 9) * math.sqrt(1 + 4 + 4 + 4))
+    assert index.scores(0, "cosine")[1] == pytest.approx(expected)
+
+
+def test_top_k_and_exclusion():
+    index = SimilarityIndex(_collab_graph())
+    assert index.top_k(0, 1, "common_neighbors") == [(1, 3.0)]
+    suggested = [v for v, _ in index.top_k(0, 5, "common_neighbors", exclude_neighbors=True)]
+    assert suggested == [5]
+    assert index.top_k(6, 3) == []
+    with pytest.raises(ValueError):
+        index.scores(0, "unknown")
+
+
+def test_predict_links_skips_existing_edges():
+    index = SimilarityIndex(_collab_graph())
+    for method in METHODS:
+        predicted = index.predict_links(10, method)
+        assert all(u < v for u, v, _ in predicted)
+        assert (0, 1) not in [(u, v) for u, v, _ in predicted]
+    top = index.predict_links(1, "common_neighbors")
+    assert top[0][2] == 2.0  # ex.: 2 e 3 compartilham {0, 1}
+
+
+def test_minhash_finds_identical_neighbourhoods():
+    adj = _collab_graph()
+    index = MinHashLSHIndex(adj, num_perm=32, bands=16)
+    # 3 e 4 têm exatamente os mesmos vizinhos {0, 1}
+    assert index.top_k(3, 1) == [(4, 1.0)]
+    assert index.top_k(6, 3) == []
+    with pytest.raises(ValueError):
+        MinHashLSHIndex(adj, num_perm=30, bands=16)
+
+
+def test_minhash_signatures_do_not_depend_on_block_size(monkeypatch):
+    rng = random.Random(5)
+    adj_list = [{} for _ in range(300)]
+    for _ in range(1200):
+        u, v = rng.randrange(300), rng.randrange(300)
+        if u != v:
+            adj_list[u][v] = 1.0
+    whole = MinHashLSHIndex(adj_list).signatures
+    monkeypatch.setattr(link_prediction, "MINHASH_BLOCK_CELLS", 64 * 5)  # blocos de ~5 vizinhos
+    assert (MinHashLSHIndex(adj_list).signatures == whole).all()
@@ -0,0 +1,100 @@
+import os
+import pickle
+
+import pytest
+
+from src.analysis import metric_cache
+from src.analysis.metric_cache import cached_metric, graph_fingerprint
+from src.analysis.sparse_graph import ArrayAdjacency
+
+calls = []
+
+
+@cached_metric
+def _count_edges(out_adj, scale: float = 1.0):
+    calls.append(1)
+    return sum(len(nbrs) for nbrs in out_adj) * scale
+
+
+def test_fingerprint_ignores_neighbor_order_but_not_weights():
+    a = [[(1, 2.0), (2, 1.0)], [], []]
+    b = [[(2, 1.0), (1, 2.0)], [], []]
+    c = [[(1, 3.0), (2, 1.0)], [], []]
+    assert graph_fingerprint(a) == graph_fingerprint(b)
+    assert graph_fingerprint(a) != graph_fingerprint(c)
+    # lista de dicts (getAsAdjacencyList) com o mesmo conteúdo tem a mesma impressão digital
+    assert graph_fingerprint([{1: 2.0, 2: 1.0}, {}, {}]) == graph_fingerprint(a)
+
+
+def test_array_adjacency_fingerprint_ignores_edge_order_but_not_weights():
+    a = ArrayAdjacency.from_edges(3, [0, 0, 1], [1, 2, 0], [2.0, 1.0, 1.0])
+    b = ArrayAdjacency.from_edges(3, [1, 0, 0], [0, 2, 1], [1.0, 1.0, 2.0])
+    c = ArrayAdjacency.from_edges(3, [0, 0, 1], [1, 2, 0], [3.0, 1.0, 1.0])
+    assert graph_fingerprint(a) == graph_fingerprint(b)
+    assert graph_fingerprint(a) != graph_fingerprint(c)
+
+
+def test_cached_metric_hits_on_same_graph_and_params(isolated_metric_cache):
+    calls.clear()
+    out_adj = [[(1, 1.0)], [(0, 1.0)]]
+    assert _count_edges(out_adj) == 2
+    assert _count_edges([[(1, 1.0)], [(0, 1.0)]]) == 2
+    assert len(calls) == 1
+
+    # parâmetro diferente => nova chave
+    assert _count_edges(out_adj, scale=2.0) == 4
+    assert len(calls) == 2
+
+
+def test_cache_evicts_least_recently_used(isolated_metric_cache):
+    cache = metric_cache.configure(max_mb=200 / (1024 * 1024))  # 200 bytes: cabe só um resultado
+    cache.put("old", list(range(60)))
+    old_path = cache.cache_dir / "old.pkl"
+    os.utime(old_path, (old_path.stat().st_atime, old_path.stat().st_mtime - 60))
+    cache.put("new", list(range(60)))
+    remaining = {p.stem for p in cache.cache_dir.glob("*.pkl")}
+    assert remaining == {"new"}
+
+
+def test_disabled_cache_always_recomputes(isolated_metric_cache):
+    calls.clear()
+    metric_cache.configure(enabled=False)
+    _count_edges([[]])
+    _count_edges([[]])
+    assert len(calls) == 2
+
+
+def test_unreadable_entry_is_discarded_and_recomputed(isolated_metric_cache):
+    calls.clear()
+    out_adj = [[(1, 1.0)], []]
+    cache = metric_cache.get_cache()
+    key = cache.make_key(_count_edges.uncached, (out_adj,), {})
+    cache.cache_dir.mkdir(parents=True, exist_ok=True)
+    # pickle válido de uma classe que não existe mais: falha com AttributeError, não UnpicklingError
+    stale = pickle.dumps(metric_cache.MetricCache("x", 1)).replace(b"MetricCache", b"GoneCacheXX")
+    (cache.cache_dir / (key + ".pkl")).write_bytes(stale)
+
+    with pytest.warns(RuntimeWarning):
+        assert _count_edges(out_adj) == 1
+    assert len(calls) == 1
+    # a entrada ruim foi substituída pelo resultado recalculado
+    assert _count_edges(out_adj) == 1
+    assert len(calls) == 1
+
+
+def test_truncated_entry_is_removed(isolated_metric_cache):
+    cache = metric_cache.get_cache()
+    cache.put("k", list(range(10)))
+    path = cache.cache_dir / "k.pkl"
+    path.write_bytes(path.read_bytes()[:5])
+    with pytest.warns(RuntimeWarning):
+        assert cache.get("k") == (False, None)
+    assert not path.exists()
+
+
+def test_write_failure_warns_instead_of_raising(isolated_metric_cache, tmp_path):
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+    cache = metric_cache.configure(cache_dir=str(blocker / "cache"))
+    with pytest.warns(RuntimeWarning):
+        cache.put("k", 1)
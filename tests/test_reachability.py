@@ -0,0 +1,113 @@
+import random
+
+from src.analysis.multi_source_bfs import build_neighbor_snapshot
+from src.analysis.reachability import (ReachabilityIndex, build_reachability_index, condensation,
+                                       departure_resilience, strongly_connected_components)
+from src.core.AdjacencyListGraph import AdjacencyListGraph
+
+
+def _two_cycles_chain():
+    """Ciclo {0,1} -> ciclo {2,3} -> 4; 5 isolado."""
+    return [{1: 1.0}, {0: 1.0, 2: 1.0}, {3: 1.0}, {2: 1.0, 4: 1.0}, {}, {}]
+
+
+def test_condensation_is_reverse_topological():
+    component_of, dag_successors, components = condensation(_two_cycles_chain())
+    assert sorted(sorted(c) for c in components) == [[0, 1], [2, 3], [4], [5]]
+    for c, succ in enumerate(dag_successors):
+        assert all(d < c for d in succ)
+    assert component_of[0] == component_of[1] != component_of[2]
+
+
+def test_reachability_queries_and_influence():
+    index = build_reachability_index(_two_cycles_chain())
+    assert index.can_reach(0, 4) and index.can_reach(3, 2)
+    assert not index.can_reach(4, 0) and not index.can_reach(0, 5)
+    assert index.influence_size(0) == 4
+    assert index.influence_size(2) == 2
+    assert index.reachable_from(1) == [0, 1, 2, 3, 4]
+
+
+def test_index_over_memory_budget_answers_by_dag_search():
+    rng = random.Random(11)
+    n = 60
+    adj = [{} for _ in range(n)]
+    for _ in range(90):
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            adj[u][v] = 1.0
+    full = ReachabilityIndex(adj)
+    lean = ReachabilityIndex(adj, max_closure_bytes=0)
+    assert full.materialized and not lean.materialized and not lean.reach
+    for u in range(n):
+        assert lean.influence_size(u) == full.influence_size(u)
+        assert lean.reachable_from(u) == full.reachable_from(u)
+        for v in range(n):
+            assert lean.can_reach(u, v) == full.can_reach(u, v)
+
+
+def test_is_strongly_connected():
+    graph = AdjacencyListGraph(3)
+    graph.addEdge(0, 1)
+    graph.addEdge(1, 2)
+    assert not graph.isStronglyConnected()
+    graph.addEdge(2, 0)
+    assert graph.isStronglyConnected()
+
+
+def test_is_strongly_connected_matches_tarjan_without_touching_the_cache(isolated_metric_cache):
+    rng = random.Random(3)
+    for _ in range(40):
+        n = rng.randint(1, 8)
+        graph = AdjacencyListGraph(n)
+        for _ in range(rng.randint(0, 3 * n)):
+            u, v = rng.randrange(n), rng.randrange(n)
+            if u != v and not graph.hasEdge(u, v):
+                graph.addEdge(u, v)
+        components = strongly_connected_components(build_neighbor_snapshot(graph.getAsAdjacencyList()))
+        assert graph.isStronglyConnected() == (len(components) == 1)
+    assert not isolated_metric_cache.cache_dir.exists()
+
+
+def _weak_components_after(adj, gone):
+    """Tamanhos das componentes fracas sem os nós de `gone` (BFS do zero)."""
+    undirected = [set() for _ in adj]
+    for u, nbrs in enumerate(adj):
+        for v in nbrs:
+            undirected[u].add(v)
+            undirected[v].add(u)
+    seen, sizes = set(gone), []
+    for s in range(len(adj)):
+        if s in seen:
+            continue
+        seen.add(s)
+        stack, size = [s], 0
+        while stack:
+            u = stack.pop()
+            size += 1
+            for v in undirected[u] - seen:
+                seen.add(v)
+                stack.append(v)
+        sizes.append(size)
+    return sizes
+
+
+def test_departure_resilience_on_two_cycles_chain():
+    curve = departure_resilience(_two_cycles_chain(), [3, 1, 3])
+    assert curve['removed'] == [3, 1]
+    # sem 3: {0,1,2} + {4} + {5}; sem 3 e 1: {0} + {2} + {4} + {5}
+    assert curve['largest_component'] == [5, 3, 1]
+    assert curve['num_components'] == [2, 3, 4]
+
+
+def test_departure_resilience_matches_recomputing_components():
+    rng = random.Random(8)
+    adj = [{} for _ in range(40)]
+    for _ in range(70):
+        adj[rng.randrange(40)][rng.randrange(40)] = 1.0
+    order = rng.sample(range(40), 15)
+    curve = departure_resilience(adj, order)
+    for i in range(len(order) + 1):
+        sizes = _weak_components_after(adj, order[:i])
+        assert curve['largest_component'][i] == max(sizes, default=0)
+        assert curve['num_components'][i] == len(sizes)
@@ -0,0 +1,101 @@
+import numpy as np
+
+from src.services import shared_queries
+from src.services.shared_queries import (
+    ARTIFACTS_QUERY,
+    AUTHORS_QUERY,
+    ROLE_QUERIES,
+    fetch_authors_and_edges,
+    get_author_artifact_model,
+)
+
+
+class FakeNeo4jService:
+    """Responde às consultas do modelo bipartido com linhas fixas (ids do Neo4j arbitrários)."""
+
+    def __init__(self):
+        # autores 10 (alice), 11 (bob), 12 (carol); issue 100 criada por alice, PR 200 criado por bob
+        self.rows = {
+            AUTHORS_QUERY: [{"id": 10, "name": "alice"}, {"id": 11, "name": "bob"}, {"id": 12, "name": "carol"}],
+            ARTIFACTS_QUERY: [{"id": 100, "isIssue": True, "createdAt": "2024-01-02T00:00:00Z"},
+                              {"id": 200, "isIssue": False, "createdAt": None}],
+            ROLE_QUERIES["created"]: [{"authorId": 10, "artifactId": 100, "day": "2024-01-02", "n": 1},
+                                      {"authorId": 11, "artifactId": 200, "day": None, "n": 1}],
+            # bob comentou na issue de alice em dois dias diferentes
+            ROLE_QUERIES["commented"]: [{"authorId": 11, "artifactId": 100, "day": "2024-02-01", "n": 1},
+                                        {"authorId": 11, "artifactId": 100, "day": "2024-03-01", "n": 1},
+                                        {"authorId": 12, "artifactId": 200, "day": None, "n": 1},
+                                        {"authorId": 11, "artifactId": 200, "day": "2024-02-01", "n": 3}],  # comentário no próprio PR
+            ROLE_QUERIES["reviewed"]: [{"authorId": 10, "artifactId": 200, "day": "2024-02-10", "n": 1}],
+            ROLE_QUERIES["approved"]: [{"authorId": 10, "artifactId": 200, "day": None, "n": 1}],
+            ROLE_QUERIES["merged"]: [{"authorId": 12, "artifactId": 200, "day": "2024-02-11", "n": 1}],
+            ROLE_QUERIES["closed"]: [{"authorId": 12, "artifactId": 100, "day": None, "n": 1}],
+        }
+        self.calls = 0
+
+    def query(self, cypher, parameters=None):
+        self.calls += 1
+        return self.rows[cypher]
+
+
+def test_projections_match_multi_hop_semantics():
+    model = get_author_artifact_model(FakeNeo4jService())
+    # alice=0, bob=1, carol=2
+    assert model.relation_edges("COMMENT_PR_ISSUE").tolist() == [[1, 0], [1, 0], [2, 1]]
+    assert model.relation_edges("OPENED_ISSUE_COMMENTED").tolist() == [[1, 0], [1, 0]]
+    assert model.relation_edges("REVIEW").tolist() == [[0, 1]]
+    assert model.relation_edges("MERGE").tolist() == [[2, 1]]
+    assert model.relation_edges("ISSUE_CLOSED").tolist() == [[2, 0]]
+
+
+def test_model_is_loaded_once_and_reweighted_locally():
+    service = FakeNeo4jService()
+    store = {}
+    names, edges = fetch_authors_and_edges(service, {"COMMENT_PR_ISSUE", "REVIEW"}, store=store)
+    queries_after_first_load = service.calls
+    assert names == {0: "alice", 1: "bob", 2: "carol"}
+    assert sorted(edges) == [(0, 1, 4.0), (1, 0, 4.0), (2, 1, 2.0)]
+
+    _, reweighted = fetch_authors_and_edges(service, {"COMMENT_PR_ISSUE", "REVIEW"},
+                                            weights={"COMMENT_PR_ISSUE": 1, "REVIEW": 10}, store=store)
+    assert sorted(reweighted) == [(0, 1, 10.0), (1, 0, 2.0), (2, 1, 1.0)]
+    assert service.calls == queries_after_first_load
+
+    # sem store, cada chamada volta ao banco
+    fetch_authors_and_edges(service, {"REVIEW"})
+    assert service.calls == 2 * queries_after_first_load
+
+
+def test_refresh_picks_up_new_rows():
+    service = FakeNeo4jService()
+    store = {}
+    _, edges = fetch_authors_and_edges(service, {"MERGE"}, store=store)
+    assert edges == [(2, 1, 5.0)]
+
+    # nova coleta: alice também fez merge do PR de bob
+    service.rows[ROLE_QUERIES["merged"]].append({"authorId": 10, "artifactId": 200, "day": "2024-02-12", "n": 1})
+    _, stale = fetch_authors_and_edges(service, {"MERGE"}, store=store)
+    assert stale == [(2, 1, 5.0)]
+    _, fresh = fetch_authors_and_edges(service, {"MERGE"}, store=store, refresh=True)
+    assert sorted(fresh) == [(0, 1, 5.0), (2, 1, 5.0)]
+    assert sorted(store[shared_queries.MODEL_SESSION_KEY].relation_edges("MERGE").tolist()) == [[0, 1], [2, 1]]
+
+
+def test_timed_edges_carry_event_date_and_weighted_multiplicity():
+    model = get_author_artifact_model(FakeNeo4jService())
+    src, dst, weights, times = model.timed_edges(["COMMENT_PR_ISSUE", "REVIEW"], {"COMMENT_PR_ISSUE": 2, "REVIEW": 4})
+    # bob comentou na issue de alice em fevereiro e em março; carol comentou no PR de bob
+    # (comentário sem data, PR sem createdAt); alice revisou o PR de bob
+    assert src.tolist() == [1, 1, 2, 0]
+    assert dst.tolist() == [0, 0, 1, 1]
+    assert weights.tolist() == [2.0, 2.0, 2.0, 4.0]
+    assert times[0] == 1706745600.0  # 2024-02-01, não o createdAt da issue
+    assert times[1] == 1709251200.0  # 2024-03-01
+    assert np.isnan(times[2])
+    assert times[3] == 1707523200.0  # 2024-02-10
+
+
+def test_undated_events_fall_back_to_artifact_creation():
+    model = get_author_artifact_model(FakeNeo4jService())
+    _, _, _, times = model.timed_edges(["ISSUE_CLOSED"])
+    assert times.tolist() == [1704153600.0]  # createdAt da issue 100
@@ -0,0 +1,29 @@
+import math
+
+import pytest
+
+from src.analysis.shortest_paths import ShortestPathIndex, build_shortest_path_index
+
+
+def _diamond():
+    """0 -> 1 -> 3 com pesos fortes e o atalho fraco 0 -> 3; 2 só recebe arestas."""
+    return [{1: 4.0, 3: 1.0, 2: 1.0}, {3: 4.0}, {}, {}]
+
+
+def test_unweighted_query_uses_fewest_hops():
+    cost, path, _ = ShortestPathIndex(_diamond(), weighted=False).query(0, 3)
+    assert (cost, path) == (1.0, [0, 3])
+
+
+@pytest.mark.parametrize("num_landmarks", [0, 2])
+def test_weighted_query_follows_strong_interactions(num_landmarks):
+    index = build_shortest_path_index(_diamond(), weighted=True, num_landmarks=num_landmarks)
+    cost, path, _ = index.query(0, 3)
+    assert path == [0, 1, 3]
+    assert cost == pytest.approx(0.5)
+
+
+@pytest.mark.parametrize("num_landmarks", [0, 2])
+def test_unreachable_target(num_landmarks):
+    cost, path, _ = ShortestPathIndex(_diamond(), weighted=True, num_landmarks=num_landmarks).query(2, 0)
+    assert cost == math.inf and path == []
@@ -0,0 +1,113 @@
+import pytest
+
+from src.analysis.structure_metrics import (
+    calculate_assortativity,
+    calculate_core_numbers,
+    calculate_average_clustering_coefficient,
+    calculate_average_shortest_path_length,
+    calculate_diameter,
+    calculate_distance_summary,
+    calculate_local_clustering_coefficients,
+    calculate_structural_summary,
+    calculate_triad_census,
+    count_triangles,
+    estimate_average_clustering_coefficient,
+    estimate_average_shortest_path_length,
+)
+
+
+def test_average_shortest_path_length_over_reachable_pairs():
+    # 0 -> 1 -> 2 e 3 isolado: pares (0,1)=1, (0,2)=2, (1,2)=1
+    adj_list = [{1: 1.0}, {2: 1.0}, {}, {}]
+    assert calculate_average_shortest_path_length(adj_list) == pytest.approx(4 / 3)
+
+
+def test_average_shortest_path_length_empty_graph():
+    assert calculate_average_shortest_path_length([{}, {}]) == 0.0
+
+
+def test_count_triangles_and_local_clustering():
+    # triângulo 0-1-2 (com arestas nos dois sentidos entre 0 e 1) e cauda 2 -> 3
+    adj_list = [{1: 1.0}, {0: 1.0, 2: 1.0}, {0: 1.0, 3: 1.0}, {}]
+    assert count_triangles(adj_list) == [1, 1, 1, 0]
+    local = calculate_local_clustering_coefficients(adj_list)
+    assert local == pytest.approx([1.0, 1.0, 1 / 3, 0.0])
+    assert calculate_average_clustering_coefficient(adj_list) == pytest.approx((1 + 1 + 1 / 3) / 4)
+
+
+def test_wedge_sampling_estimate_contains_exact_value():
+    adj_list = [{1: 1.0, 2: 1.0, 3: 1.0}, {2: 1.0}, {3: 1.0}, {}, {0: 1.0}]
+    exact = calculate_average_clustering_coefficient(adj_list)
+    estimate, low, high = estimate_average_clustering_coefficient(adj_list, num_samples=20000, seed=3)
+    assert low <= exact <= high
+    assert estimate == pytest.approx(exact, abs=0.03)
+
+
+def test_structural_summary_single_pass():
+    # 0 <-> 1, 1 -> 2, 2 -> 0 e 3 isolado
+    adj_list = [{1: 1.0}, {0: 1.0, 2: 2.0}, {0: 1.0}, {}]
+    summary = calculate_structural_summary(adj_list)
+    assert summary['num_edges'] == 4
+    assert summary['density'] == pytest.approx(4 / 12)
+    assert summary['reciprocity'] == pytest.approx(0.5)
+    assert list(summary['out_degree']) == [1, 2, 1, 0]
+    assert list(summary['in_degree']) == [2, 1, 1, 0]
+    assert list(summary['total_hist']) == [1, 0, 1, 2]
+    assert list(summary['total_ccdf']) == pytest.approx([1.0, 0.75, 0.75, 0.5])
+    assert summary['assortativity'] == pytest.approx(calculate_assortativity(adj_list))
+
+
+def test_diameter_weak_and_strong_views():
+    # ciclo dirigido 0 -> 1 -> 2 -> 3 -> 0 mais a cauda 3 -> 4 -> 5
+    adj_list = [{1: 1.0}, {2: 1.0}, {3: 1.0}, {0: 1.0, 4: 1.0}, {5: 1.0}, {}]
+    weak = calculate_diameter(adj_list)
+    strong = calculate_diameter(adj_list, strong=True)
+    assert (weak['diameter'], weak['component_size']) == (4, 6)
+    assert (strong['diameter'], strong['component_size']) == (3, 4)
+
+
+def test_sampled_average_shortest_path_length_is_exact_with_all_sources():
+    adj_list = [{1: 1.0}, {2: 1.0}, {3: 1.0}, {0: 1.0}]
+    result = estimate_average_shortest_path_length(adj_list, strong=True, num_samples=10)
+    assert result['aspl'] == pytest.approx(2.0)
+    assert result['low'] == result['high'] == result['aspl']
+    sampled = estimate_average_shortest_path_length(adj_list, num_samples=2, seed=1)
+    assert sampled['low'] <= sampled['aspl'] <= sampled['high']
+
+
+def test_distance_summary_matches_separate_calls_with_many_small_components():
+    # ciclo 0 -> 1 -> 2 -> 3 -> 0 com cauda 3 -> 4 -> 5, pares soltos e autores isolados
+    adj_list = [{1: 1.0}, {2: 1.0}, {3: 1.0}, {0: 1.0, 4: 1.0}, {5: 1.0}, {}]
+    for _ in range(50):
+        adj_list += [{len(adj_list) + 1: 1.0}, {}]
+    adj_list += [{} for _ in range(100)]
+    for strong in (False, True):
+        summary = calculate_distance_summary.uncached(adj_list, strong=strong, num_samples=10)
+        expected = {**calculate_diameter.uncached(adj_list, strong=strong),
+                    **estimate_average_shortest_path_length.uncached(adj_list, strong=strong, num_samples=10)}
+        assert summary == expected
+    assert calculate_distance_summary.uncached(adj_list)['component_size'] == 6
+
+
+def test_core_numbers_total_in_and_out():
+    # clique dirigido {0,1,2} (todas as arestas nos dois sentidos) e 3 -> 0
+    adj_list = [{1: 1.0, 2: 1.0}, {0: 1.0, 2: 1.0}, {0: 1.0, 1: 1.0}, {0: 1.0}]
+    assert calculate_core_numbers(adj_list) == [4, 4, 4, 1]
+    assert calculate_core_numbers(adj_list, mode="in") == [2, 2, 2, 0]
+    assert calculate_core_numbers(adj_list, mode="out") == [2, 2, 2, 1]
+    with pytest.raises(ValueError):
+        calculate_core_numbers(adj_list, mode="both")
+
+
+def test_triad_census_small_graph():
+    # 0 <-> 1, 1 -> 2, 3 isolado: {0,1,2}=111U, {0,1,3}=102, {1,2,3}=012, {0,2,3}=003
+    adj_list = [{1: 1.0}, {0: 1.0, 2: 1.0}, {}, {}]
+    census = calculate_triad_census(adj_list)
+    assert len(census) == 16
+    nonzero = {triad: count for triad, count in census.items() if count}
+    assert nonzero == {"003": 1, "012": 1, "102": 1, "111U": 1}
+
+
+def test_triad_census_cycle_and_transitive():
+    assert calculate_triad_census([{1: 1.0}, {2: 1.0}, {0: 1.0}])["030C"] == 1
+    assert calculate_triad_census([{1: 1.0, 2: 1.0}, {2: 1.0}, {}])["030T"] == 1
@@ -0,0 +1,74 @@
+import random
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from src.analysis.centrality_metrics import build_adjlists, degree_centrality, pagerank
+from src.analysis.temporal_metrics import SlidingWindowSeries, period_index, period_start, sliding_window_metrics
+
+DAY = 86400.0
+
+
+def _ts(*args) -> float:
+    return datetime(*args, tzinfo=timezone.utc).timestamp()
+
+
+def _random_events(n=25, m=600, seed=5):
+    rng = random.Random(seed)
+    events = []
+    for _ in range(m):
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            events.append((u, v, float(rng.randint(1, 3)), _ts(2023, 1, 1) + rng.random() * 200 * DAY))
+    src, dst, weights, times = (np.array(column) for column in zip(*events))
+    return n, src, dst, weights, times
+
+
+def test_periods_start_on_monday_and_first_of_month():
+    times = [_ts(2024, 1, 1), _ts(2024, 1, 7, 23), _ts(2024, 1, 8), _ts(2024, 2, 29)]
+    weeks = period_index(times, "W")
+    assert [str(period_start(p, "W")) for p in weeks] == ["2024-01-01", "2024-01-01", "2024-01-08", "2024-02-26"]
+    assert [str(period_start(p, "M")) for p in period_index(times, "M")] == \
+        ["2024-01-01", "2024-01-01", "2024-01-01", "2024-02-01"]
+    with pytest.raises(ValueError):
+        period_index(times, "D")
+
+
+def test_incremental_windows_match_graphs_built_from_scratch():
+    n, src, dst, weights, times = _random_events()
+    times[0] = np.nan  # interação sem data é ignorada
+    result = sliding_window_metrics.uncached(n, src, dst, weights, times, freq="W", span=3, step=2)
+    series = SlidingWindowSeries(n, src, dst, weights, times, freq="W", span=3, step=2)
+    assert result["labels"] == series.labels()
+    assert len(result["labels"]) > 10
+
+    for window in range(len(series)):
+        start = series.window_starts[window]
+        in_window = np.isfinite(times)
+        in_window[in_window] &= (period_index(times[in_window], "W") >= start) & \
+            (period_index(times[in_window], "W") < start + 3)
+        totals = {}
+        for u, v, w in zip(src[in_window], dst[in_window], weights[in_window]):
+            totals[(u, v)] = totals.get((u, v), 0.0) + w
+        out_adj, in_adj = build_adjlists(n, [(u, v, w) for (u, v), w in totals.items()])
+
+        degree = degree_centrality(out_adj, in_adj)
+        rank = pagerank.uncached(out_adj)
+        assert result["degree"][window] == pytest.approx([degree[u] for u in range(n)], rel=1e-6)
+        assert result["pagerank"][window] == pytest.approx([rank[u] for u in range(n)], abs=1e-5)
+        assert result["interactions"][window] == int(in_window.sum())
+        assert result["active_authors"][window] == len({u for pair in totals for u in pair})
+
+
+def test_community_counts_follow_the_windows():
+    jan, feb = _ts(2024, 1, 10), _ts(2024, 2, 10)
+    # janeiro: dois triângulos; fevereiro: três triângulos disjuntos
+    triangles = [(0, 1), (1, 2), (2, 0), (3, 4), (4, 5), (5, 3)]
+    events = [(u, v, jan) for u, v in triangles] + [(u, v, feb) for u, v in triangles]
+    events += [(6, 7, feb), (7, 8, feb), (8, 6, feb)]
+    src, dst, times = (np.array(column) for column in zip(*events))
+    result = sliding_window_metrics.uncached(9, src, dst, np.ones(len(src)), times, freq="M")
+    assert result["labels"] == ["2024-01-01", "2024-02-01"]
+    assert result["communities"] == [2, 3]
+    assert result["active_authors"] == [6, 9]
@@ -0,0 +1,72 @@
+import random
+
+import numpy as np
+import pytest
+
+from src.analysis.centrality_metrics import build_adjlists, build_integrated_edges, degree_centrality, pagerank
+from src.analysis.weight_sensitivity import WeightSweep, kendall_tau, sweep_weights, weight_grid
+
+
+def _brute_force_tau_b(x, y):
+    concordant = discordant = only_x = only_y = 0
+    for i in range(len(x)):
+        for j in range(i + 1, len(x)):
+            dx, dy = np.sign(x[i] - x[j]), np.sign(y[i] - y[j])
+            if dx == 0 and dy == 0:
+                continue
+            if dx == 0:
+                only_x += 1
+            elif dy == 0:
+                only_y += 1
+            elif dx == dy:
+                concordant += 1
+            else:
+                discordant += 1
+    return (concordant - discordant) / ((concordant + discordant + only_x) * (concordant + discordant + only_y)) ** 0.5
+
+
+def test_kendall_tau_matches_brute_force_with_ties():
+    rng = random.Random(4)
+    for _ in range(50):
+        n = rng.randint(2, 30)
+        x = [rng.randint(0, 4) for _ in range(n)]
+        y = [rng.randint(0, 6) for _ in range(n)]
+        if len(set(x)) > 1 and len(set(y)) > 1:
+            assert kendall_tau(x, y) == pytest.approx(_brute_force_tau_b(x, y))
+    assert kendall_tau([1, 2, 3], [3, 2, 1]) == pytest.approx(-1.0)
+    assert np.isnan(kendall_tau([1, 1, 1], [1, 2, 3]))
+
+
+def _relations(n=30, seed=2):
+    rng = random.Random(seed)
+    return {rel: [(rng.randrange(n), rng.randrange(n)) for _ in range(120)] for rel in ("REVIEW", "MERGE", "APPROVED")}
+
+
+def test_sweep_matches_rebuilt_integrated_graph():
+    n, relations = 30, _relations()
+    weights = {"REVIEW": 4.0, "MERGE": 0.5, "APPROVED": 2.0}
+    sweep = WeightSweep(n, {rel: np.array(pairs) for rel, pairs in relations.items()})
+    out_adj, in_adj = build_adjlists(n, build_integrated_edges(
+        {rel: [(u, v) for u, v in pairs if u != v] for rel, pairs in relations.items()}, weights))
+
+    rank, _ = sweep.pagerank(weights)
+    expected_rank = pagerank.uncached(out_adj)
+    expected_degree = degree_centrality(out_adj, in_adj)
+    assert rank == pytest.approx([expected_rank[u] for u in range(n)], abs=1e-6)
+    assert sweep.degree(weights) == pytest.approx([expected_degree[u] for u in range(n)])
+
+
+def test_sweep_weights_compares_grid_against_baseline():
+    n, relations = 30, _relations()
+    baseline = {"REVIEW": 4.0, "MERGE": 5.0, "APPROVED": 4.0}
+    grid = weight_grid({"REVIEW": [4, 8], "MERGE": [5, 0]}, baseline)
+    assert [(w["REVIEW"], w["MERGE"], w["APPROVED"]) for w in grid] == \
+        [(4.0, 5.0, 4.0), (4.0, 0.0, 4.0), (8.0, 5.0, 4.0), (8.0, 0.0, 4.0)]
+
+    result = sweep_weights.uncached(n, relations, grid, baseline, k=5)
+    same = result['points'][0]
+    assert same['pagerank_tau'] == pytest.approx(1.0)
+    assert same['degree_tau'] == pytest.approx(1.0)
+    assert same['pagerank_overlap'] == same['degree_overlap'] == 5
+    assert [u for u, _ in same['pagerank_top']] == [u for u, _ in result['baseline']['pagerank_top']]
+    assert all(-1.0 <= point['degree_tau'] < 1.0 for point in result['points'][1:])